@@ -0,0 +1 @@
+"""Benchmarks of the Vocabulary Practice App hot paths (run with `python -m benchmarks.run_benchmarks`)."""
@@ -0,0 +1,67 @@
+"""
+deck_generator.py
+
+Synthetic vocabulary files for the benchmarks.
+
+Generated decks mirror file_examples/File.txt: a "Left - Right" header followed by word
+pairs of one to five words (short words and long phrases, with Polish diacritics on the
+right side), plus "$ context $" lines, "#" comments, empty lines and malformed lines.
+The output only depends on the line count and the seed, so results are comparable across runs.
+
+Usage:
+    from benchmarks.deck_generator import write_deck
+    write_deck("deck_10000.txt", 10_000)
+"""
+import os
+import random
+from typing import Iterator
+
+HEADER = "English - Polish"
+CONTEXT_EVERY = 50  # Lines between context changes
+COMMENT_RATE = 0.02
+EMPTY_RATE = 0.02
+MALFORMED_RATE = 0.01
+
+_LEFT_SYLLABLES = ("ba", "ter", "con", "duc", "ex", "ec", "man", "ag", "ing", "ri", "sen", "ior", "ther", "a", "pist")
+_RIGHT_SYLLABLES = ("ad", "wo", "kat", "dy", "rek", "tor", "prze", "się", "bior", "ca", "ży", "ą", "ść", "ró", "ł")
+
+
+def _word(rng: random.Random, syllables: tuple, max_syllables: int = 4) -> str:
+    return "".join(rng.choice(syllables) for _ in range(rng.randint(1, max_syllables)))
+
+
+def _phrase(rng: random.Random, syllables: tuple, words: int) -> str:
+    return " ".join(_word(rng, syllables) for _ in range(words))
+
+
+def generate_lines(line_count: int, seed: int = 0) -> Iterator[str]:
+    """Yields `line_count` lines (without the header) of a synthetic deck."""
+    rng = random.Random(seed)
+    for line_index in range(line_count):
+        if line_index % CONTEXT_EVERY == 0:
+            yield f"$ Context {line_index // CONTEXT_EVERY} $"
+            continue
+        roll = rng.random()
+        if roll < COMMENT_RATE:
+            yield f"# Comment {line_index}"
+        elif roll < COMMENT_RATE + EMPTY_RATE:
+            yield ""
+        elif roll < COMMENT_RATE + EMPTY_RATE + MALFORMED_RATE:
+            yield _phrase(rng, _LEFT_SYLLABLES, 2)  # No " - " separator
+        else:
+            words = 1 if rng.random() < 0.7 else rng.randint(2, 5)
+            yield f"{_phrase(rng, _LEFT_SYLLABLES, words).capitalize()} - {_phrase(rng, _RIGHT_SYLLABLES, words).capitalize()}"
+
+
+def write_deck(file_path: str, line_count: int, seed: int = 0) -> str:
+    """
+    Writes a synthetic deck with a header and `line_count` following lines.
+    Returns:
+        str: `file_path`.
+    """
+    os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write(HEADER + "\n")
+        for line in generate_lines(line_count, seed):
+            file.write(line + "\n")
+    return file_path
@@ -0,0 +1,284 @@
+"""
+run_benchmarks.py
+
+Benchmarks of the Vocabulary Practice App hot paths on synthetic decks (1k to 1M lines).
+
+Benchmarks (per deck size):
+    load.parse          parsing a deck (load_deck without cache, what read_deck does on a cache miss)
+    load.cached         loading a deck from the compiled deck cache
+    load.lazy           opening a deck lazily (decks above "lazy_load_min_mb")
+    pick.random         PracticeSession.next_word without the blocklist
+    pick.blocklist      next_word with the blocklist (the pool is reset when it runs out)
+    pick.scheduled      next_word in the SM-2 selection mode
+    pick.weighted       next_word in the weighted selection mode
+    check.answer        next_word + PracticeSession.check (scoring, low accuracy transitions)
+    status.refresh      PracticeSession.status_text (the text of the status labels)
+and once:
+    score.short         AccuracyScorer.score of single words (uncached)
+    score.long          AccuracyScorer.score of long phrases (uncached)
+    score.cached        AccuracyScorer.score of already scored pairs
+    score.forms         AccuracyScorer.score_forms against precomputed AnswerForms (the check() path, uncached)
+    score.forms_loose   score_forms with accent-insensitive comparison (uncached)
+
+Every benchmark runs `--repeat` times; the median and the minimum are reported, together with
+the time per operation. Results are written to JSON. With --compare, the results are compared
+with a previous JSON file by the fastest repetition (the least noisy measure), and benchmarks
+slower by more than --threshold are flagged as regressions (the exit code is 1 if there are any).
+
+Usage (from the repository root):
+    python -m benchmarks.run_benchmarks --output baseline.json
+    python -m benchmarks.run_benchmarks --sizes 1000 10000 --compare baseline.json
+    python -m benchmarks.run_benchmarks --current new.json --compare baseline.json  # compare only
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.deck_generator import write_deck
+from modules.deck_cache import load_deck
+from modules.lazy_deck import open_lazy_deck
+from modules.practice_session import PracticeSession
+from modules.scoring import AccuracyScorer
+from modules.word_store import WordStore
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10  # 10% slower than the baseline is a regression
+PICKS = 10_000
+SCORES = 2_000
+RESULTS_DIR = "benchmarks/results"
+RESULTS_VERSION = 1
+
+
+def measure(function: Callable[[], None], operations: int, repeat: int, setup: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """
+    Times `function` (which performs `operations` operations) `repeat` times with the garbage collector disabled.
+    `setup` runs before every repetition and is not timed.
+    """
+    timings: List[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    median = statistics.median(timings)
+    return {
+        "operations": operations,
+        "repeat": repeat,
+        "median_s": median,
+        "min_s": min(timings),
+        "per_op_us": median / operations * 1e6,
+        "min_per_op_us": min(timings) / operations * 1e6,
+    }
+
+
+def _session(store: WordStore, selection_mode: str = "random", block_repeat: bool = False) -> PracticeSession:
+    session = PracticeSession(rng=random.Random(0))
+    session.set_selection_mode(selection_mode)
+    session.set_block_repeat(block_repeat)
+    session.set_low_accuracy_enabled(block_repeat)
+    session.load(store)
+    return session
+
+
+def bench_load(file_path: str, cache_dir: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    load_deck(file_path, cache_dir)  # Writes the deck cache
+    return {
+        "load.parse": measure(lambda: load_deck(file_path), 1, repeat),
+        "load.cached": measure(lambda: load_deck(file_path, cache_dir), 1, repeat),
+        "load.lazy": measure(lambda: open_lazy_deck(file_path), 1, repeat),
+    }
+
+
+def bench_session(store: WordStore, repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, selection_mode, block_repeat in (
+        ("pick.random", "random", False),
+        ("pick.blocklist", "random", True),
+        ("pick.scheduled", "scheduled", False),
+        ("pick.weighted", "weighted", False),
+    ):
+        holder = {}
+
+        def setup(selection_mode=selection_mode, block_repeat=block_repeat):
+            holder["session"] = _session(store, selection_mode, block_repeat)
+
+        def pick():
+            session = holder["session"]
+            for _ in range(PICKS):
+                if session.next_word() is None:
+                    session.reset()
+        results[name] = measure(pick, PICKS, repeat, setup)
+
+    def setup_check():
+        holder["session"] = _session(store, "random", True)
+        holder["answers"] = random.Random(1)  # Every repetition scores the same answers
+
+    def check():
+        session, answers = holder["session"], holder["answers"]
+        for _ in range(PICKS):
+            question = session.next_word()
+            if question is None:
+                session.reset()
+                continue
+            # 70% correct answers, the rest with a typo
+            answer = question.word[question.answer_key]
+            session.check(answer if answers.random() < 0.7 else answer[:-1])
+    results["check.answer"] = measure(check, PICKS, repeat, setup_check)
+
+    def refresh():
+        session = holder["session"]
+        for _ in range(PICKS):
+            session.status_text()
+    results["status.refresh"] = measure(refresh, PICKS, repeat, setup_check)
+    return results
+
+
+def bench_scoring(store: WordStore, repeat: int) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(2)
+    short_pairs, long_pairs = [], []
+    form_pairs = []  # (AnswerForms, user input) of short and long answers, as check() scores them
+    for word in store:
+        pairs = short_pairs if " " not in word["Right_Lang"] else long_pairs
+        if len(pairs) < SCORES:
+            answer = word["Right_Lang"]
+            position = rng.randrange(len(answer))
+            pairs.append((answer, answer[:position] + answer[position + 1:]))  # One deleted letter
+            form_pairs.append((word.forms("Right_Lang"), pairs[-1][1]))
+        if len(short_pairs) >= SCORES and len(long_pairs) >= SCORES:
+            break
+    scorer = AccuracyScorer()
+
+    def score(pairs):
+        for correct_answer, user_input in pairs:
+            scorer.score(correct_answer, user_input)
+    results = {
+        "score.short": measure(lambda: score(short_pairs), len(short_pairs), repeat, scorer.cache_clear),
+        "score.long": measure(lambda: score(long_pairs), len(long_pairs), repeat, scorer.cache_clear),
+    }
+    score(short_pairs)
+    results["score.cached"] = measure(lambda: score(short_pairs), len(short_pairs), repeat)
+
+    def score_forms(accent_insensitive):
+        for forms, user_input in form_pairs:
+            scorer.score_forms(forms, user_input, accent_insensitive)
+    results["score.forms"] = measure(lambda: score_forms(False), len(form_pairs), repeat, scorer.cache_clear)
+    results["score.forms_loose"] = measure(lambda: score_forms(True), len(form_pairs), repeat, scorer.cache_clear)
+    return results
+
+
+def run(sizes: List[int], repeat: int) -> Dict[str, object]:
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="vocabulary-benchmarks-") as work_dir:
+        cache_dir = os.path.join(work_dir, "cache")
+        for size in sizes:
+            file_path = write_deck(os.path.join(work_dir, f"deck_{size}.txt"), size)
+            print(f"Deck of {size} lines ({os.path.getsize(file_path) / 1024 / 1024:.1f} MB)...", flush=True)
+            size_results = bench_load(file_path, cache_dir, repeat)
+            store = load_deck(file_path)
+            size_results.update(bench_session(store, repeat))
+            if size == sizes[-1]:
+                results.update(bench_scoring(store, repeat))
+            results.update({f"{name}[{size}]": result for name, result in size_results.items()})
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def print_results(report: Dict[str, object]) -> None:
+    print(f"\n{'benchmark':<28} {'ops':>7} {'median':>11} {'min':>11} {'per op':>12}")
+    for name, result in report["results"].items():
+        print(f"{name:<28} {result['operations']:>7} {result['median_s'] * 1e3:>9.2f}ms "
+              f"{result['min_s'] * 1e3:>9.2f}ms {result['per_op_us']:>10.3f}us")
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    """
+    Prints the change of every benchmark present in both reports.
+    Returns:
+        list: Names of the benchmarks whose fastest repetition (min_per_op_us) is slower than the baseline by more than `threshold`.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<28} {'baseline':>12} {'current':>12} {'change':>9}")
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        ratio = result["min_per_op_us"] / previous["min_per_op_us"] if previous["min_per_op_us"] else 1.0
+        flag = ""
+        if ratio > 1.0 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1.0 - threshold:
+            flag = "  improved"
+        print(f"{name:<28} {previous['min_per_op_us']:>10.3f}us {result['min_per_op_us']:>10.3f}us {(ratio - 1.0) * 100:>+8.1f}%{flag}")
+    missing = sorted(set(baseline["results"]) - set(current["results"]))
+    if missing:
+        print(f"Not measured in this run: {', '.join(missing)}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {threshold * 100:.0f}%: {', '.join(regressions)}")
+    else:
+        print(f"\nNo regressions above {threshold * 100:.0f}%.")
+    return regressions
+
+
+def _read_report(file_path: str) -> Dict[str, object]:
+    with open(file_path, "r", encoding="utf-8") as file:
+        report = json.load(file)
+    if report.get("version") != RESULTS_VERSION:
+        raise SystemExit(f"{file_path}: unsupported results version {report.get('version')}")
+    return report
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks of the Vocabulary Practice App hot paths.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Deck sizes in lines.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Repetitions of every benchmark.")
+    parser.add_argument("--output", help=f"Results JSON file (default: {RESULTS_DIR}/<timestamp>.json).")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare the results with a previous results file.")
+    parser.add_argument("--current", metavar="RESULTS", help="Compare this results file instead of running the benchmarks.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Slowdown flagged as a regression (0.1 = 10%%).")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.current:
+        if not args.compare:
+            raise SystemExit("--current requires --compare")
+        report = _read_report(args.current)
+    else:
+        report = run(sorted(args.sizes), args.repeat)
+        output = args.output or os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + ".json")
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+        print_results(report)
+        print(f"\nResults written to {output}")
+    if args.compare:
+        return 1 if compare(report, _read_report(args.compare), args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
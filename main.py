@@ -1,18 +1,30 @@
+from modules.startup_profiler import STARTUP_PROFILER
+import argparse
 import customtkinter as ctk
+STARTUP_PROFILER.mark("import customtkinter")
 from CTkMenuBar import *
-import random
+STARTUP_PROFILER.mark("import CTkMenuBar")
+import logging
+import os
 from tkinter import filedialog
-import difflib
 from typing import List, Dict, Optional
 
-from modules.translation_utils import t_path, load_translations
-import modules.translation_utils
-from modules.utils import get_program_path, load_settings_from_json, set_app_icon
-from modules.gui_console import GUIConsole
-from modules.about_window import AboutWindow
+from modules.translation_utils import t_path, configure_translations, set_language, translation_cache_info, available_languages, language_display_name
+from modules.language_manager import LanguageManager
+from modules.utils import get_program_path, set_app_icon
+from modules.settings_service import SettingsService
+from modules.deck_cache import load_deck
+from modules.lazy_deck import open_lazy_deck
+from modules.deck_loader import DeckLoadTask
+from modules.deck_library import DeckLibrary, DeckInfo
+from modules.app_logging import setup_logging
+from modules.word_store import WordStore
+from modules.scoring import AccuracyScorer, LOW_ACCURACY_THRESHOLD
+from modules.practice_session import PracticeSession, Question, AnswerResult
+from modules.metrics import METRICS
+STARTUP_PROFILER.mark("import app modules")
+# GUIConsole, AboutWindow (PIL, platform probing) and pprint are imported on first use
 
-# temp
-from pprint import pprint
 REQUIRED_JSON_VERSION = 1
 # Application version and release date
 APP_VERSION = {
@@ -21,7 +33,10 @@ APP_VERSION = {
 }
 
 RESOURCE_FILE_PATHS = {
-    "json_config": "Assets/Vocabulary-Practice-App/settingsV2.json"
+    "json_config": "Assets/Vocabulary-Practice-App/settingsV2.json",
+    "translations_dir": "Assets/Vocabulary-Practice-App/Translations",
+    "translation_cache_dir": "Assets/Vocabulary-Practice-App/Cache/Translations",
+    "library_index": "Assets/Vocabulary-Practice-App/Cache/library_index.json",
 }
 
 APP_SETTINGS = {
@@ -33,57 +48,108 @@ APP_SETTINGS = {
     "appearance_mode": "dark",
     "color_theme": "blue",
     "ui_zoom_factor": 1.075,
+    "accuracy_backend": "levenshtein",  # "levenshtein" or "difflib" (scores of versions <= 1.4)
+    "accent_insensitive": False,  # Compare answers without accents (e.g. "ą" == "a")
+    "deck_cache_dir": "Assets/Vocabulary-Practice-App/Cache",  # Compiled deck cache ("" disables it)
+    "lazy_load_min_mb": 64,  # Files of this size or larger are memory-mapped and decoded on demand
+    "log_level": "INFO",  # "DEBUG" also logs every picked word and checked answer
+    "log_file": "Assets/Vocabulary-Practice-App/Logs/vocabulary_app.log",  # Rotating log file ("" disables it)
+    "history_db": "Assets/Vocabulary-Practice-App/History/history.sqlite3",  # Answer history database ("" disables it)
+    "history_last_attempts": 5,  # Attempts per word used by the low accuracy history report
+    "library_dir": "",  # Folder listed in File > Deck Library ("" until a folder is chosen)
+    "library_max_decks": 8,  # Opened library decks kept in memory for instant switching
+    "metrics_enabled": False,  # Collect hot-path metrics from startup (Debug > Open Metrics)
+    "selection_mode": "random",  # "random" (blocklist / low accuracy rounds), "scheduled" (SM-2) or "weighted" (by recent mistakes)
 }
 
-# Initialize global variables
-JSON_Loaded_flag = "False - Unknown"  # Flag to check if JSON settings were loaded successfully
+# Allowed values of settings that are not free-form (other settings only need the type of their default)
+SETTING_CHOICES = {
+    "accuracy_backend": ("levenshtein", "difflib"),
+    "selection_mode": ("random", "scheduled", "weighted"),
+}
+# settingsV2.json migrations: {N: function(document of VERSION N) -> document of VERSION N + 1}
+SETTINGS_MIGRATIONS = {}
 
-# Loading settings from JSON file
-temp_status, _ = load_settings_from_json(
+SETTINGS = SettingsService(
     file_path=RESOURCE_FILE_PATHS["json_config"],
-    target_dict=APP_SETTINGS,
-    version_key="VERSION",
-    required_version=REQUIRED_JSON_VERSION,
-    ignore_version_error_key="IGNORE_VERSION_ERROR",
-    settings_key="APP_SETTINGS",
-    show_errors=True
+    defaults=APP_SETTINGS,  # Updated in place, APP_SETTINGS always holds the current values
+    version=REQUIRED_JSON_VERSION,
+    choices=SETTING_CHOICES,
+    migrations=SETTINGS_MIGRATIONS,
 )
-JSON_Loaded_flag = temp_status
 
-TRANSLATIONS = load_translations(APP_SETTINGS.get("Language", "en"))
-modules.translation_utils.TRANSLATIONS = TRANSLATIONS
+# Initialize global variables
+JSON_Loaded_flag = "False - Unknown"  # Flag to check if JSON settings were loaded successfully
+
+logger = logging.getLogger("main")
+
+
+def load_app_configuration() -> None:
+    """Loads the JSON settings, configures logging and loads the translations of the selected language."""
+    global JSON_Loaded_flag
+    JSON_Loaded_flag = SETTINGS.load()
+    STARTUP_PROFILER.mark("load settings")
+
+    setup_logging(level=APP_SETTINGS["log_level"], log_file=APP_SETTINGS["log_file"])
+    METRICS.enabled = APP_SETTINGS["metrics_enabled"]
+    STARTUP_PROFILER.mark("setup logging")
+
+    configure_translations(RESOURCE_FILE_PATHS["translations_dir"], RESOURCE_FILE_PATHS["translation_cache_dir"])
+    APP_SETTINGS["Language"] = set_language(APP_SETTINGS["Language"])
+    STARTUP_PROFILER.mark("load translations")
+
+
+def apply_appearance_settings() -> None:
+    """Applies the appearance mode and color theme; must run before the root window is created."""
+    ctk.set_appearance_mode(APP_SETTINGS["appearance_mode"])
+    try:
+        ctk.set_default_color_theme(APP_SETTINGS["color_theme"])
+    except:
+        logger.error("Color theme %s not found. Using default theme.", APP_SETTINGS["color_theme"])
+        ctk.set_default_color_theme("blue")
 
 # ==========================================================================
 # Debugging functions
 
-get_program_path(show_messagebox=False, status_flag=JSON_Loaded_flag)
-
 def pprint_list_of_dicts(list_of_dicts, width=130):
+    from pprint import pprint
     try:
         pprint(list_of_dicts, width=width)
     except Exception as e:
-        print(f"[ERROR] Failed to pretty-print list of dictionaries: {e}")
+        logger.error("Failed to pretty-print list of dictionaries: %s", e)
 
 class MainApp():
     def __init__(self, root: ctk.CTk):
         # State variables
-        self.vocab_word_list: List[Dict[str, str | int]] = []
-        self.low_accuracy_word_list: List[Dict[str, str | int]] = []  # Words with <90% accuracy
-        self.selected_word: Optional[Dict[str, str | int]] = None
-        self.selected_mode: str = "mixed"
-        self.hint_shown: bool = False
-        self.available_words: List[Dict[str, str | int]] = []
-        self.blocked_lines: set[int] = set()
-        self.current_mode: str = "mixed"
-
-        self.low_accuracy_mode: bool = False  # Track if we're in low accuracy mode
+        # Deck, selection, scoring and history live in the session; the window only renders it
+        self.session: PracticeSession = PracticeSession(
+            scorer=AccuracyScorer(backend=APP_SETTINGS["accuracy_backend"]),
+            history_provider=lambda: self.history,
+            on_question=self.show_question,
+            on_answer=self.show_result,
+            on_status=self.update_words_info_label,
+        )
+        self.session.set_selection_mode(APP_SETTINGS["selection_mode"])
+        self.session.accent_insensitive = APP_SETTINGS["accent_insensitive"]
+        METRICS.add_gauge("session", self.session.memory_usage)
+        self.failed_lines: List[int] = []
+        self.deck_language_names: Optional[tuple[str, str]] = None  # Language names of the loaded deck (radiobutton texts)
+        self._words_info_texts: tuple[str, str] | None = None  # Last texts shown in the status labels
+        self.load_task: Optional[DeckLoadTask] = None  # Background deck loading (see start_loading)
+        self._history = None  # AttemptHistory, opened on first use (see history)
+        self._library: Optional[DeckLibrary] = None  # Deck library of the "library_dir" setting (see library)
+        self.library_window = None  # LibraryWindow, created when the library is first opened
+        self.library_scan: Optional[DeckLoadTask] = None  # Background library rescan
+        self.library_scan_folder: Optional[str] = None  # Folder of the last started rescan
+        self._question_text_before_load = ""  # Text source of the question label before loading started
 
         # ==========================================================================
-        self.gui_console = GUIConsole(root, APP_SETTINGS)
+        self.gui_console = None  # GUIConsole, created when the console is first opened
 
         # ==========================================================================
 
         self.root = root
+        self.language = LanguageManager()  # Re-labels the widgets registered in register_translated_texts
         self.root.title(APP_SETTINGS["title"])
         self.root.geometry(APP_SETTINGS["window_size"])
         self.root.resizable(*APP_SETTINGS["resizable"])
@@ -110,6 +176,7 @@ class MainApp():
         self.file_dropdown = CustomDropdownMenu(widget=self.file_button_MenuBar, font=("Arial", 13))
 
         self.file_load_option = self.file_dropdown.add_option(option=f"{t_path('menubar.file.load_file'):<26} [Ctrl+O]",command=lambda: self.open_file_dialog())
+        self.file_library_option = self.file_dropdown.add_option(option=t_path("menubar.file.deck_library"),command=lambda: self.open_library_window())
         self.file_clear_blocklist_option = self.file_dropdown.add_option(option=f"{t_path('main_window.buttons.clear_button'):<22} [Ctrl+C]",command=lambda: self.clear_blocked_lines(), state="disabled")
         self.file_dropdown.add_separator()
         self.file_exit_option = self.file_dropdown.add_option(option=t_path("menubar.file.exit"),command=lambda: self.root.quit())
@@ -122,7 +189,7 @@ class MainApp():
         self.appearance_light_mode_option = self.appearance_dropdown.add_option(option=t_path("menubar.appearance.light_mode"),command=lambda: self.set_app_appearance_mode("Light"))
         self.appearance_dropdown.add_separator()
         self.appearance_zoom_in_option = self.appearance_dropdown.add_option(option=f"{t_path('menubar.appearance.zoom_in'):<26} [Ctrl+'+']",command=lambda: self.change_ui_scale(0.1))
-        self.appearance_zoom_out_option = self.appearance_dropdown.add_option(option=f"{t_path('menubar.appearance.zoom_in'):<26} [Ctrl+'-']",command=lambda: self.change_ui_scale(-0.1))
+        self.appearance_zoom_out_option = self.appearance_dropdown.add_option(option=f"{t_path('menubar.appearance.zoom_out'):<26} [Ctrl+'-']",command=lambda: self.change_ui_scale(-0.1))
 
         # Settings menu
         self.settings_button_MenuBar = self.menu.add_cascade("Settings")
@@ -143,15 +210,66 @@ class MainApp():
             self.settings_dropdown,
             text="Practice low-accuracy words (<90%)",
             variable=self.enable_low_accuracy_mode,
+            command=lambda: self.session.set_low_accuracy_enabled(self.enable_low_accuracy_mode.get()),
             font=("Arial", 13)
         )
         self.low_accuracy_checkbox.pack(padx=5, pady=5, anchor="w")
 
+        # Add option to ignore accents when checking answers
+        self.accent_insensitive = ctk.BooleanVar(value=APP_SETTINGS["accent_insensitive"])
+        self.accent_insensitive_checkbox = ctk.CTkCheckBox(
+            self.settings_dropdown,
+            text="Ignore accents in answers",
+            variable=self.accent_insensitive,
+            command=lambda: self.set_accent_insensitive(self.accent_insensitive.get()),
+            font=("Arial", 13)
+        )
+        self.accent_insensitive_checkbox.pack(padx=5, pady=5, anchor="w")
+
+        # Word selection mode (random rounds or spaced repetition)
+        self.selection_mode = ctk.StringVar(value=APP_SETTINGS["selection_mode"])
+        self.selection_mode_label = ctk.CTkLabel(self.settings_dropdown, text="Word selection:", font=("Arial", 13))
+        self.selection_mode_label.pack(padx=5, pady=(5, 0), anchor="w")
+        self.selection_random_radio = ctk.CTkRadioButton(
+            self.settings_dropdown,
+            text="Random",
+            variable=self.selection_mode,
+            value="random",
+            command=lambda: self.set_selection_mode(self.selection_mode.get()),
+            font=("Arial", 13)
+        )
+        self.selection_random_radio.pack(padx=15, pady=5, anchor="w")
+        self.selection_scheduled_radio = ctk.CTkRadioButton(
+            self.settings_dropdown,
+            text="Spaced repetition (SM-2)",
+            variable=self.selection_mode,
+            value="scheduled",
+            command=lambda: self.set_selection_mode(self.selection_mode.get()),
+            font=("Arial", 13)
+        )
+        self.selection_scheduled_radio.pack(padx=15, pady=5, anchor="w")
+        self.selection_weighted_radio = ctk.CTkRadioButton(
+            self.settings_dropdown,
+            text="Weighted by mistakes",
+            variable=self.selection_mode,
+            value="weighted",
+            command=lambda: self.set_selection_mode(self.selection_mode.get()),
+            font=("Arial", 13)
+        )
+        self.selection_weighted_radio.pack(padx=15, pady=5, anchor="w")
+
+        # Language menu
+        self.language_button_MenuBar = self.menu.add_cascade(t_path("menubar.language.language"))
+        self.language_dropdown = CustomDropdownMenu(widget=self.language_button_MenuBar, font=("Arial", 13))
+
+        for language_code in available_languages():
+            self.language_dropdown.add_option(option=language_display_name(language_code),command=lambda code=language_code: self.change_language(code))
+
         # About menu
         self.about_button_MenuBar = self.menu.add_cascade(t_path("menubar.about.about"))
         self.about_dropdown = CustomDropdownMenu(widget=self.about_button_MenuBar, font=("Arial", 13))
 
-        self.about_about_this_app_option = self.about_dropdown.add_option(option=t_path("menubar.about.about_this_app"),command=lambda: AboutWindow(root, APP_SETTINGS, APP_VERSION, t_path))
+        self.about_about_this_app_option = self.about_dropdown.add_option(option=t_path("menubar.about.about_this_app"),command=self.open_about_window)
 
         # Debug menu
         self.debug_button_MenuBar = self.menu.add_cascade("Debug")
@@ -160,6 +278,8 @@ class MainApp():
         self.debug_get_program_path_option = self.debug_dropdown.add_option(option="Get Program Path",command=lambda: get_program_path(show_messagebox=True, status_flag=JSON_Loaded_flag))
         self.debug_get_cache_info_option = self.debug_dropdown.add_option(option="Print Cache Info",command=lambda: self.get_cache_info())
         self.debug_print_status_option = self.debug_dropdown.add_option(option="Print Vocabulary Status",command=lambda: self.print_status())
+        self.debug_print_history_option = self.debug_dropdown.add_option(option="Print Answer History",command=lambda: self.print_history())
+        self.debug_open_metrics_option = self.debug_dropdown.add_option(option="Open Metrics",command=lambda: self.open_metrics_window())
         self.debug_dropdown.add_separator()
         self.debug_open_console_option = self.debug_dropdown.add_option(option="Open Console Output",command=lambda: self.open_console())
 
@@ -180,6 +300,19 @@ class MainApp():
             )
         self.question_label.pack(pady=(10, 5))
 
+        # Loading indicator (shown below the question label while a deck loads in the background)
+        self.loading_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.loading_progressbar = ctk.CTkProgressBar(self.loading_frame, width=260)
+        self.loading_progressbar.set(0)
+        self.loading_progressbar.pack(side="left", padx=(5, 5), pady=(5, 5))
+        self.loading_cancel_button = ctk.CTkButton(
+            self.loading_frame,
+            text=t_path("main_window.buttons.cancel_button"),
+            width=80,
+            command=lambda: self.cancel_loading()
+        )
+        self.loading_cancel_button.pack(side="left", padx=(5, 5), pady=(5, 5))
+
         # Context label (for group context)
         self.context_label = ctk.CTkLabel(
             self.main_frame,
@@ -358,64 +491,112 @@ class MainApp():
             text_color="#FF5555"
         )
         self.low_accuracy_info_label.pack(pady=(5, 0))
-        
-    ctk.set_appearance_mode(APP_SETTINGS["appearance_mode"])
-    try:
-        ctk.set_default_color_theme(APP_SETTINGS["color_theme"])
-    except:
-        print(f"[ERROR]: Color theme {APP_SETTINGS['color_theme']} not found. Using default theme.")
-        ctk.set_default_color_theme("blue")
+
+        self.register_translated_texts()
+
+    def register_translated_texts(self) -> None:
+        """Registers every translated static text, so change_language() can re-label it."""
+        language = self.language
+        # MenuBar
+        language.bind_path(self.file_button_MenuBar, "menubar.file.file")
+        language.bind(self.file_load_option, lambda: f"{t_path('menubar.file.load_file'):<26} [Ctrl+O]")
+        language.bind_path(self.file_library_option, "menubar.file.deck_library")
+        language.bind(self.file_clear_blocklist_option, lambda: f"{t_path('main_window.buttons.clear_button'):<22} [Ctrl+C]")
+        language.bind_path(self.file_exit_option, "menubar.file.exit")
+        language.bind_path(self.appearance_button_MenuBar, "menubar.appearance.appearance")
+        language.bind_path(self.appearance_dark_mode_option, "menubar.appearance.dark_mode")
+        language.bind_path(self.appearance_light_mode_option, "menubar.appearance.light_mode")
+        language.bind(self.appearance_zoom_in_option, lambda: f"{t_path('menubar.appearance.zoom_in'):<26} [Ctrl+'+']")
+        language.bind(self.appearance_zoom_out_option, lambda: f"{t_path('menubar.appearance.zoom_out'):<26} [Ctrl+'-']")
+        language.bind_path(self.language_button_MenuBar, "menubar.language.language")
+        language.bind_path(self.about_button_MenuBar, "menubar.about.about")
+        language.bind_path(self.about_about_this_app_option, "menubar.about.about_this_app")
+        # Main window
+        language.bind_path(self.question_label, "main_window.question_label.default")
+        language.bind_path(self.loading_cancel_button, "main_window.buttons.cancel_button")
+        language.bind_path(self.line_info_label, "main_window.line_info_label")
+        language.bind_path(self.entry, "main_window.entry_placeholder", option="placeholder_text")
+        language.bind_path(self.hint_button, "main_window.buttons.hint_button")
+        language.bind_path(self.check_button, "main_window.buttons.check_button")
+        language.bind_path(self.skip_button, "main_window.buttons.skip_button")
+        language.bind_path(self.mode_label, "main_window.mode_label")
+        language.bind(self.radio_Left_Lang_to_Right_Lang, lambda: self.direction_text())
+        language.bind(self.radio_Right_Lang_to_Left_Lang, lambda: self.direction_text(reverse=True))
+        language.bind_path(self.radio_mixed, "main_window.Radiobuttons.both")
+        language.bind_path(self.file_button, "main_window.buttons.file_button")
+        language.bind_path(self.clear_button, "main_window.buttons.clear_button")
+        language.bind_path(self.block_repeat_checkbox, "main_window.checkbox.block_list")
+        language.bind_path(self.result_label, "main_window.result_label.default")
+
+    def direction_text(self, reverse: bool = False) -> str:
+        """Returns a radiobutton text: the language names of the loaded deck, or the translated defaults."""
+        left, right = self.deck_language_names or (t_path("main_window.Radiobuttons.left"), t_path("main_window.Radiobuttons.right"))
+        return f"{right} ► {left}" if reverse else f"{left} ► {right}"
+
+    def update_direction_texts(self, language_names: Optional[tuple[str, str]]) -> None:
+        """Sets the language names shown on the radiobuttons (kept across language switches)."""
+        self.deck_language_names = language_names
+        self.radio_Left_Lang_to_Right_Lang.configure(text=self.direction_text())
+        self.radio_Right_Lang_to_Left_Lang.configure(text=self.direction_text(reverse=True))
+
+    def change_language(self, language_code: str) -> None:
+        """Switches the UI language at runtime (labels are updated in place)."""
+        SETTINGS.set("Language", self.language.switch(language_code))
 
     # Debug functions
     def get_cache_info(self) -> None:
-        print(t_path.cache_info())
-
-    def print_status(self) -> None:
-        print("\n=== Debug: Vocabulary Status ===")
-        print(f"\nLoaded words: {len(self.vocab_word_list)}")
-        if self.block_repeat_mode.get():
-            remaining = len([word for word in self.vocab_word_list if word["line_number"] not in self.blocked_lines])
-            print(f"Words remaining (not repeated): {remaining}")
-        if hasattr(self, 'failed_lines') and self.failed_lines:
-            print(f"Failed to load lines: {self.failed_lines}")
-        print(f"Selected word: {self.selected_word}")
-        print(f"Selected mode: {self.selected_mode}")
-        print(f"Hint shown: {self.hint_shown}")
-        print(f"Available words: {len(self.available_words)}")
-        print(f"Blocked lines: {self.blocked_lines}\n")
-        pprint_list_of_dicts(self.available_words, width=130)
-        print("\n=== Debug: Vocabulary Status ===\n")
+        print(f"Translations: {translation_cache_info()}")
+        print(f"Accuracy scorer ({self.session.scorer.backend}): {self.session.scorer.cache_info()}")
 
+    @METRICS.timed("label_refresh")
     def update_words_info_label(self):
-        loaded = len(self.vocab_word_list)
-        show_low_acc = self.enable_low_accuracy_mode.get()
-        low_acc_count = len(self.low_accuracy_word_list)
-        block_repeat = self.block_repeat_mode.get()
-        # Show info label if in low accuracy mode
-        if self.low_accuracy_mode:
-            self.low_accuracy_info_label.configure(text="Low accuracy mode: practice words that you find difficult", text_color="#FF5555")
-            if show_low_acc and block_repeat:
-                self.words_info_label.configure(text=f"Loaded: {loaded} | Remaining: 0 | Low accuracy: {low_acc_count}")
-            else:
-                self.words_info_label.configure(text=f"Loaded: {loaded} | Remaining: 0")
-        else:
-            self.low_accuracy_info_label.configure(text="")
-            if block_repeat:
-                remaining = len([word for word in self.vocab_word_list if word["line_number"] not in self.blocked_lines])
-                if show_low_acc:
-                    self.words_info_label.configure(text=f"Loaded: {loaded} | Remaining: {remaining} | Low accuracy: {low_acc_count}")
-                else:
-                    self.words_info_label.configure(text=f"Loaded: {loaded} | Remaining: {remaining}")
-            else:
-                # If low accuracy mode is enabled but block_repeat is off, only show Loaded
-                self.words_info_label.configure(text=f"Loaded: {loaded}")
+        """Refreshes the status labels from the incremental counters (constant time)."""
+        texts = self.session.status_text()
+        if texts == self._words_info_texts:
+            METRICS.increment("label_refresh.unchanged")
+            return  # Nothing changed, skip the Tk redraw
+        self._words_info_texts = texts
+        words_info_text, low_accuracy_text = texts
+        self.words_info_label.configure(text=words_info_text)
+        self.low_accuracy_info_label.configure(text=low_accuracy_text, text_color="#FF5555")
 
     def open_console(self) -> None:
+        if self.gui_console is None:
+            from modules.gui_console import GUIConsole
+            self.gui_console = GUIConsole(self.root, APP_SETTINGS)
         self.gui_console.open()
 
-    def load_words_from_file(self, file_path: Optional[str] = None) -> List[Dict[str, str | int]]:
+    def open_metrics_window(self) -> None:
+        from modules.metrics_window import MetricsWindow
+        MetricsWindow(self.root, METRICS, APP_SETTINGS)
+
+    def open_about_window(self) -> None:
+        from modules.about_window import AboutWindow
+        AboutWindow(self.root, APP_SETTINGS, APP_VERSION, t_path)
+
+    @METRICS.timed("load")
+    def read_deck(self, file_path: str, progress=None, cancel_event=None) -> WordStore:
+        """
+        Reads a deck without touching any widget, so it is safe to call from a worker thread.
+        Files larger than "lazy_load_min_mb" are memory-mapped and decoded lazily,
+        other files go through the compiled deck cache (or VocabFileParser on a cache miss).
+        Raises FileNotFoundError, or LoadCancelled if `cancel_event` is set.
+        """
+        if os.path.getsize(file_path) >= APP_SETTINGS["lazy_load_min_mb"] * 1024 * 1024:
+            return open_lazy_deck(file_path, progress=progress, cancel_event=cancel_event)
+        return load_deck(file_path, APP_SETTINGS["deck_cache_dir"], progress=progress, cancel_event=cancel_event)
+
+    def show_deck_info(self, file_path: str, words_list: WordStore) -> None:
+        """Updates the failed lines and the radiobutton texts after a deck has been read."""
+        self.failed_lines = words_list.failed_lines
+        self.update_direction_texts(words_list.language_names)
+        logger.info("Loaded %d words from %s (%d failed lines).", len(words_list), file_path, len(self.failed_lines))
+
+    def load_words_from_file(self, file_path: Optional[str] = None) -> WordStore:
         """
-        Reads a vocabulary file and returns a list of word pairs, supporting context grouping.
+        Reads a vocabulary file synchronously and returns a list of word pairs, supporting context grouping.
+        Reading is done by read_deck; this method only updates the radiobuttons afterwards.
+        The GUI loads files in the background instead (see start_loading).
         Each line after the first is expected to be in the format "Left_Lang - Right_Lang".
         Context is set by lines in the form $ context $ and applies to following words until next context or EOF.
         Lines where the left and right words are identical are skipped.
@@ -423,61 +604,22 @@ class MainApp():
         Args:
             file_path (str, optional): Path to the vocabulary file. Defaults to None.
         Returns:
-            list[dict]: A list of dictionaries, each containing:
+            WordStore: Columnar store of the words. Each row (WordRecord) exposes:
                 - "Left_Lang": The word in the left language.
                 - "Right_Lang": The word in the right language.
                 - "line_number": The line number in the file (starting from 2).
                 - "context": The context/group string, or None if not set.
         """
-        words_list: List[Dict[str, str | int | None]] = []
-        language_names = ("Left", "Right")
         self.failed_lines = []  # Track failed lines for status/debug
         if not file_path:
-            self.failed_lines = []
-            return words_list
+            return WordStore()
 
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                # Read the first line for language names
-                first_line = file.readline()
-                if " - " in first_line:
-                    language_names = tuple(first_line.strip().split(" - "))
-                # Update radiobutton text immediately
-                self.radio_Left_Lang_to_Right_Lang.configure(
-                    text = f"{language_names[0]} ► {language_names[1]}"
-                )
-                self.radio_Right_Lang_to_Left_Lang.configure(
-                    text = f"{language_names[1]} ► {language_names[0]}"
-                )
-                # Read the rest of the file line by line
-                current_context = None
-                for line_number, line in enumerate(file, start=2):
-                    line_strip = line.strip()
-                    if not line_strip or line_strip.startswith('#'):
-                        continue  # skip comments and empty lines
-                    # Detect context line: $ ... $
-                    if line_strip.startswith('$') and line_strip.endswith('$') and len(line_strip) > 2:
-                        current_context = line_strip[1:-1].strip()
-                        continue
-                    if " - " in line_strip:
-                        try:
-                            Left_Lang, Right_Lang = line_strip.split(" - ")
-                            if Left_Lang != Right_Lang:
-                                # Always assign the current context (even if None)
-                                words_list.append({
-                                    "Left_Lang": Left_Lang,
-                                    "Right_Lang": Right_Lang,
-                                    "line_number": line_number,
-                                    "context": current_context if current_context is not None else None
-                                })
-                        except Exception:
-                            self.failed_lines.append(line_number)
-                    else:
-                        self.failed_lines.append(line_number)
+            words_list = self.read_deck(file_path)
         except FileNotFoundError:
-            print(f"File {file_path} not found.")
-            self.failed_lines = []
-        pprint_list_of_dicts(words_list, width=130)
+            logger.error("File %s not found.", file_path)
+            return WordStore()
+        self.show_deck_info(file_path, words_list)
         return words_list
 
     def get_language_names(self, file_path: Optional[str]) -> tuple[str, str]:
@@ -490,105 +632,57 @@ class MainApp():
                 if " - " in first_line:
                     language_names = tuple(first_line.strip().split(" - "))
         except FileNotFoundError:
-            print(f"File {file_path} not found.")
+            logger.error("File %s not found.", file_path)
 
         # Update radiobutton text
-        self.radio_Left_Lang_to_Right_Lang.configure(
-            text = f"{language_names[0]} ► {language_names[1]}"
-        )
-
-        self.radio_Right_Lang_to_Left_Lang.configure(
-            text = f"{language_names[1]} ► {language_names[0]}"
-        )
+        self.update_direction_texts(language_names)
 
         return language_names
 
     def pick_new_word(self) -> None:
         """
         Selects a new word for the vocabulary practice session according to the current mode and blocklist settings.
-        Displays context if available.
+        The session picks the word, show_question renders it.
         """
-        if not self.vocab_word_list:
+        self.session.next_word()
+
+    def show_question(self, question: Optional[Question]) -> None:
+        """Displays a question picked by the session (on_question observer). Displays context if available."""
+        if not self.session.deck:
             # Brak załadowanych słówek!
-            self.question_label.configure(text=t_path("main_window.question_label.Not_loaded"))
+            self.language.bind_path(self.question_label, "main_window.question_label.Not_loaded")
             self.context_label.configure(text="Context: N/A")
-            self.update_words_info_label()
             return
 
-        self.hint_shown = False
-
-        # If not in low accuracy mode, use main list
-        if not self.low_accuracy_mode:
-            # Filter words by blocklist
-            if not self.block_repeat_mode.get():
-                self.available_words = self.vocab_word_list
-            else:
-                self.available_words = [
-                    word for word in self.vocab_word_list if word["line_number"] not in self.blocked_lines
-                ]
-
-            # If main list is exhausted and low accuracy mode is enabled, switch to low accuracy mode
-            if not self.available_words and self.enable_low_accuracy_mode.get() and self.block_repeat_mode.get() and self.low_accuracy_word_list:
-                self.low_accuracy_mode = True
-                self.blocked_lines.clear()
-                self.available_words = self.low_accuracy_word_list.copy()
-                print("[INFO] Switched to low accuracy mode. Practicing words with <90% accuracy.")
-
-        else:
-            # In low accuracy mode, use only low_accuracy_word_list and blocklist
-            self.available_words = [
-                word for word in self.low_accuracy_word_list if word["line_number"] not in self.blocked_lines
-            ]
-
-        if not self.available_words:
+        if question is None:
             # Brak dostępnych słówek do wyświetlenia!
-            self.question_label.configure(text=t_path("main_window.question_label.No_words"))
-            self.result_label.configure(text="\n")
-            self.line_info_label.configure(text=f"{t_path('main_window.line_info_label')}")
+            self.language.bind_path(self.question_label, "main_window.question_label.No_words")
+            self.language.bind(self.result_label, "\n")
+            self.language.bind_path(self.line_info_label, "main_window.line_info_label")
             self.context_label.configure(text="")
-            self.update_words_info_label()
             self.check_button.configure(state="disabled")
             self.hint_button.configure(state="disabled")
             self.skip_button.configure(state="disabled")
             return
 
-        self.selected_word = random.choice(self.available_words)
-
-        # Dodaj numer linii do blokady
-        if self.block_repeat_mode.get():
-            self.blocked_lines.add(self.selected_word["line_number"])
-
-        self.update_words_info_label()
-
-        question_text = self.selected_word["Left_Lang"] if self.selected_mode == "Left_Lang_to_Right_Lang" else self.selected_word["Right_Lang"]
-
-        # Always pick a random direction if mode is "mixed"
-        self.current_mode = self.selected_mode
-        if self.selected_mode == "mixed":
-            self.current_mode = random.choice(["Left_Lang_to_Right_Lang", "Right_Lang_to_Left_Lang"])
-        question_text = self.selected_word["Left_Lang"] if self.current_mode == "Left_Lang_to_Right_Lang" else self.selected_word["Right_Lang"]
-
-        print("\n=== Next word selected ===")
-        print(f"Selected word: {self.selected_word['Left_Lang']} - {self.selected_word['Right_Lang']}")
-        print("Showing question:", question_text)
-        print(f"Line number: {self.selected_word['line_number']}")
-        print(f"Mode: {self.current_mode}")
-        print(f"Context: {self.selected_word.get('context')}")
-
+        question_text = question.text
         # Podaj tłumaczenie słowa:
-        self.question_label.configure(text=f"{t_path('main_window.question_label.TranslateIt')} {question_text}")
+        self.language.bind(self.question_label, lambda: f"{t_path('main_window.question_label.TranslateIt')} {question_text}")
         # Show context if enabled and available
         if hasattr(self, 'context_enabled') and not self.context_enabled.get():
             self.context_label.configure(text="")
         else:
-            context = self.selected_word.get('context')
+            context = question.word.context
             if context:
                 self.context_label.configure(text=f"Context: {context}")
             else:
                 self.context_label.configure(text="")
-        self.line_info_label.configure(text=f"{t_path('main_window.line_info_label')} {self.selected_word['line_number']}", text_color="gray")
+        _, line_number = question.word.source
+        source_name = self.session.deck.source_name(question.word.index)
+        line_info = f"{line_number} ({source_name})" if source_name else line_number
+        self.language.bind(self.line_info_label, lambda: f"{t_path('main_window.line_info_label')} {line_info}", text_color="gray")
         self.entry.delete(0, ctk.END)
-        self.result_label.configure(text="\n")
+        self.language.bind(self.result_label, "\n")
 
     def set_buttons_state(self, state: str) -> None:
         """Sets the status of all buttons and radiobuttons."""
@@ -615,123 +709,317 @@ class MainApp():
     def calculate_accuracy(self, correct_answer: str, user_input: str) -> float:
         """
         Calculates the percentage match between the correct answer and the user's answer.
+        Delegates to the configured AccuracyScorer backend (results are cached per pair).
         """
-        correct_answer = correct_answer.lower()
-        user_input = user_input.lower()
-        
-        ratio = difflib.SequenceMatcher(None, correct_answer, user_input).ratio()
-        return ratio * 100
+        return self.session.scorer.score(correct_answer, user_input)
 
     def show_hint(self) -> None:
-        """Reveals the first letters (3) of the correct translation.""" 
-        if not self.hint_shown:
-            if self.current_mode == "Left_Lang_to_Right_Lang":
-                hint = self.selected_word["Right_Lang"][:3] + "..."
-            else:
-                hint = self.selected_word["Left_Lang"][:3] + "..."
-            self.result_label.configure(text=f"{t_path('main_window.result_label.hint_text')} {hint}")
-            self.hint_shown = True
+        """Reveals the first letters (3) of the correct translation."""
+        hint = self.session.hint()
+        if hint is not None:
+            self.language.bind(self.result_label, lambda: f"{t_path('main_window.result_label.hint_text')} {hint}")
 
     def check_answer(self) -> None:
-        """Checks the correctness of the entered translation."""
-        if not self.available_words:
-            return print("Action blocked - [CheckAnswer]")
-        if not self.selected_word:
-            self.result_label.configure(text=t_path('main_window.result_label.No_words'))
+        """Checks the correctness of the entered translation (show_result renders the result)."""
+        if not self.session.deck or self.is_loading():
+            logger.debug("Action blocked - [CheckAnswer]")
             return
-        user_translation = self.entry.get()
-        if self.current_mode == "Left_Lang_to_Right_Lang":
-            correct_answer = self.selected_word["Right_Lang"]
-        else:
-            correct_answer = self.selected_word["Left_Lang"]
-
-        # Debug
-        print("\n=== Checking answer ===")
-        print(f"User input: {user_translation}")
-        print(f"Correct answer: {correct_answer}")
-        print("precentage:", self.calculate_accuracy(correct_answer, user_translation))
-        print(f"Mode: {self.current_mode}\n")
-
-        accuracy = self.calculate_accuracy(correct_answer, user_translation)
-        self.result_label.configure(
-            text=f"{t_path('main_window.result_label.percent')} {accuracy:.2f}%\n{t_path('main_window.result_label.correct')} {correct_answer}")
-
-        # If in main mode, and accuracy < 90%, add to low_accuracy_word_list if not already present
-        if not self.low_accuracy_mode and self.enable_low_accuracy_mode.get() and self.block_repeat_mode.get():
-            if accuracy < 90:
-                # Use line_number as unique identifier
-                if not any(word["line_number"] == self.selected_word["line_number"] for word in self.low_accuracy_word_list):
-                    self.low_accuracy_word_list.append(self.selected_word.copy())
-
-        # If in low accuracy mode, and answer is correct (accuracy >= 90%), remove from low_accuracy_word_list
-        if self.low_accuracy_mode and accuracy >= 90:
-            self.low_accuracy_word_list = [word for word in self.low_accuracy_word_list if word["line_number"] != self.selected_word["line_number"]]
-            # Also update available_words to reflect removal
-            self.available_words = [word for word in self.available_words if word["line_number"] != self.selected_word["line_number"]]
-            self.update_words_info_label()
+        if self.session.check(self.entry.get()) is None:
+            self.language.bind_path(self.result_label, "main_window.result_label.No_words")
+
+    def show_result(self, result: AnswerResult) -> None:
+        """Displays the accuracy of a checked answer (on_answer observer)."""
+        self.language.bind(
+            self.result_label,
+            lambda: f"{t_path('main_window.result_label.percent')} {result.accuracy:.2f}%\n{t_path('main_window.result_label.correct')} {result.correct_answer}")
 
     def print_status(self) -> None:
+        session = self.session
         print("\n=== Debug: Vocabulary Status ===")
-        print(f"\nLoaded words: {len(self.vocab_word_list)}")
-        if self.block_repeat_mode.get():
-            remaining = len([word for word in self.vocab_word_list if word["line_number"] not in self.blocked_lines])
-            print(f"Words remaining (not repeated): {remaining}")
-        if hasattr(self, 'failed_lines') and self.failed_lines:
+        print(f"\nLoaded words: {len(session.deck)}")
+        if session.block_repeat:
+            print(f"Words remaining (not repeated): {session.counters.remaining}")
+        print(f"Counters: {session.counters}")
+        if self.failed_lines:
             print(f"Failed to load lines: {self.failed_lines}")
-        print(f"Selected word: {self.selected_word}")
-        print(f"Selected mode: {self.selected_mode}")
-        print(f"Hint shown: {self.hint_shown}")
-        print(f"Available words: {len(self.available_words)}")
-        print(f"Blocked lines: {self.blocked_lines}\n")
-        pprint_list_of_dicts(self.available_words, width=130)
-        print(f"Low accuracy words ({len(self.low_accuracy_word_list)}):")
-        pprint_list_of_dicts(self.low_accuracy_word_list, width=130)
+        print(f"Selected word: {session.selected_word}")
+        print(f"Selected mode: {session.selected_mode}")
+        print(f"Hint shown: {session.hint_shown}")
+        print(f"Available words: {len(session.available_words)}")
+        print(f"Blocked lines: {self.get_blocked_lines()}\n")
+        pprint_list_of_dicts([session.deck[index].to_dict() for index in session.available_words], width=130)
+        print(f"Low accuracy words ({len(session.low_accuracy_words)}):")
+        pprint_list_of_dicts([session.deck[index].to_dict() for index in session.low_accuracy_words], width=130)
         print("\n=== Debug: Vocabulary Status ===\n")
 
+    def set_selection_mode(self, mode: str) -> None:
+        """Switches between random, scheduled and weighted word selection and shows the next word."""
+        SETTINGS.set("selection_mode", mode)
+        self.session.set_selection_mode(mode)
+        logger.info("Word selection mode: %s", mode)
+        if self.session.deck and not self.is_loading():
+            self.skip_word()
+
+    def set_accent_insensitive(self, enabled: bool) -> None:
+        SETTINGS.set("accent_insensitive", enabled)
+        self.session.accent_insensitive = enabled
+
+    @property
+    def history(self):
+        """AttemptHistory of the "history_db" setting (None if disabled or the database cannot be opened)."""
+        if self._history is None and APP_SETTINGS["history_db"]:
+            from modules.attempt_history import AttemptHistory
+            try:
+                self._history = AttemptHistory(APP_SETTINGS["history_db"])
+            except Exception as e:
+                logger.error("Failed to open the answer history %s: %s", APP_SETTINGS["history_db"], e)
+                APP_SETTINGS["history_db"] = ""
+        return self._history
+
+    def print_history(self) -> None:
+        digests = self.session.deck.digests()  # One per source deck of a merged session
+        if self.history is None or not digests:
+            print("Answer history is disabled or no deck is loaded.")
+            return
+        self.history.flush()
+        last_attempts = APP_SETTINGS["history_last_attempts"]
+        print("\n=== Debug: Answer History ===")
+        for digest in digests:
+            stats = self.history.word_stats(digest)
+            low_accuracy_lines = self.history.low_accuracy_lines(digest, last_attempts, LOW_ACCURACY_THRESHOLD)
+            print(f"Deck: {digest}")
+            print(f"Words with attempts: {len(stats)} | Attempts: {sum(word.attempts for word in stats.values())}")
+            print(f"Below {LOW_ACCURACY_THRESHOLD:.0f}% over the last {last_attempts} attempts ({len(low_accuracy_lines)}): {low_accuracy_lines}")
+        print("=== Debug: Answer History ===\n")
+
+    def close(self) -> None:
+        """Releases resources when the main window closes (commits the queued history)."""
+        if self._history is not None:
+            self._history.close()
+
     def skip_word(self) -> None:
-        if not self.vocab_word_list:
-            return print("Action blocked - [SkipWord]")
+        if not self.session.deck or self.is_loading():
+            logger.debug("Action blocked - [SkipWord]")
+            return
         """Skips the current word and moves on to the next one.""" 
         self.pick_new_word()
 
     def set_mode(self, new_mode: str) -> None:
         """Changes the application mode.""" 
-        self.selected_mode = new_mode
+        self.session.set_direction(new_mode)
         self.pick_new_word()
 
     def open_file_dialog(self) -> None:
-        """Opens the file explorer and loads the selected file."""
+        """Opens the file explorer and loads the selected file in the background."""
+        if self.is_loading():
+            logger.info("Action blocked - [OpenFile] (a file is already loading)")
+            return
         file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt")])
         if file_path:
-            self.vocab_word_list = self.load_words_from_file(file_path)
-            self.update_words_info_label()
-            if self.vocab_word_list:
-                self.enable_all_buttons()
-                self.clear_blocked_lines()
+            self.start_loading(file_path)
+
+    @property
+    def library(self) -> Optional[DeckLibrary]:
+        """DeckLibrary of the "library_dir" setting (None if no folder is set or it does not exist)."""
+        folder = APP_SETTINGS["library_dir"]
+        if not folder or not os.path.isdir(folder):
+            return None
+        if self._library is None or self._library.folder != os.path.abspath(folder):
+            self._library = DeckLibrary(folder, RESOURCE_FILE_PATHS["library_index"], max_decks=APP_SETTINGS["library_max_decks"])
+        return self._library
+
+    def open_library_window(self) -> None:
+        if self.library_window is not None and self.library_window.winfo_exists():
+            self.library_window.focus()
+            return
+        from modules.library_window import LibraryWindow
+        self.library_window = LibraryWindow(
+            self.root, APP_SETTINGS, t_path,
+            on_open=self.open_library_deck,
+            on_merge=self.open_merged_decks,
+            on_choose_folder=self.choose_library_folder,
+            on_rescan=self.scan_library,
+        )
+        library = self.library
+        if library is not None:
+            self.library_window.show(library.folder, library.decks())  # Last index first, the rescan updates it
+        self.scan_library()
+
+    def choose_library_folder(self) -> None:
+        folder = filedialog.askdirectory(parent=self.library_window)
+        if folder:
+            SETTINGS.set("library_dir", folder)
+            self.scan_library()
+
+    def scan_library(self) -> None:
+        """
+        Rescans the library folder in the background (only new and changed files are read).
+        A running scan of the same folder is kept; a scan of a previous folder is cancelled.
+        """
+        library = self.library
+        if self.library_scan is not None and self.library_scan.running:
+            if library is not None and self.library_scan_folder == library.folder:
+                return
+            self.library_scan.cancel()  # The folder changed: its result would be stale
+        if library is None:
+            self.show_library(None)
+            return
+        if self.library_window is not None and self.library_window.winfo_exists():
+            self.library_window.set_status(t_path("library_window.scanning"))
+        self.library_scan = DeckLoadTask(
+            self.root,
+            lambda progress, cancel_event: library.scan(progress, cancel_event),
+            on_done=lambda decks: self.show_library(library, decks) if library is self._library else None,
+            on_error=lambda error: logger.error("Failed to scan the deck library %s: %s", library.folder, error),
+        )
+        self.library_scan_folder = library.folder
+        self.library_scan.start()
+
+    def show_library(self, library: Optional[DeckLibrary], decks: Optional[List[DeckInfo]] = None) -> None:
+        if self.library_window is not None and self.library_window.winfo_exists():
+            self.library_window.show(library.folder if library is not None else None, decks or [])
+
+    def open_library_deck(self, file_path: str) -> None:
+        """Switches to a library deck: instantly if it is still cached, otherwise it is loaded in the background."""
+        if self.is_loading():
+            logger.info("Action blocked - [OpenLibraryDeck] (a file is already loading)")
+            return
+        library = self.library
+        words_list = library.get(file_path) if library is not None else None
+        if words_list is None:
+            if library is None:
+                self.start_loading(file_path)
             else:
-                self.question_label.configure(text=t_path("main_window.question_label.File_error"))
-                print("[open_file_dialog] - File is empty or invalid!")
-                self.disable_all_buttons()
+                # Cached under the file signature taken before reading (see DeckLibrary.open)
+                self.start_loading(file_path, lambda progress, cancel_event: library.open(
+                    file_path, lambda path: self.read_deck(path, progress, cancel_event)))
+            return
+        logger.info("Switched to %s (library cache).", file_path)
+        self.show_deck_info(file_path, words_list)
+        self.set_deck(words_list)
+
+    def open_merged_decks(self, file_paths: List[str]) -> None:
+        """Starts a session over several decks (duplicate pairs are practiced once), loaded in the background."""
+        if len(file_paths) == 1:
+            self.open_library_deck(file_paths[0])
+            return
+        if not file_paths or self.is_loading():
+            logger.info("Action blocked - [OpenMergedDecks]")
+            return
+        self.start_loading(f"{len(file_paths)} decks", lambda progress, cancel_event: self.read_merged_decks(file_paths, progress, cancel_event))
+
+    def read_merged_decks(self, file_paths: List[str], progress=None, cancel_event=None) -> WordStore:
+        """Reads (or takes from the library cache) every deck and merges them. Runs on the loading worker thread."""
+        from modules.merged_deck import merge_decks
+        library = self._library
+        decks = []
+        for number, file_path in enumerate(file_paths):
+            deck_progress = None
+            if progress is not None:
+                # Every deck is an equal share of the progress bar
+                deck_progress = lambda done, total, number=number: progress(number * total + done, len(file_paths) * total)
+            if library is not None:
+                words_list = library.open(file_path, lambda path: self.read_deck(path, deck_progress, cancel_event))
+            else:
+                words_list = self.read_deck(file_path, deck_progress, cancel_event)
+            decks.append((os.path.basename(file_path), words_list))
+        return merge_decks(decks, cancel_event)
+
+    def is_loading(self) -> bool:
+        return self.load_task is not None and self.load_task.running
+
+    def start_loading(self, file_path: str, load_function=None) -> None:
+        """
+        Reads the deck on a worker thread; buttons are enabled again once it is ready.
+        `load_function(progress, cancel_event)` replaces read_deck (e.g. for merged decks, where `file_path` is a label).
+        """
+        self.disable_all_buttons()
+        self.file_button.configure(state="disabled")
+        self.file_load_option.configure(state="disabled")
+        self._question_text_before_load = self.language.source_of(self.question_label)
+        self.language.bind_path(self.question_label, "main_window.question_label.Loading")
+        self.loading_progressbar.set(0)
+        self.loading_cancel_button.configure(state="normal")
+        self.loading_frame.pack(pady=(0, 5), after=self.question_label)
+
+        self.load_task = DeckLoadTask(
+            self.root,
+            load_function or (lambda progress, cancel_event: self.read_deck(file_path, progress, cancel_event)),
+            on_done=lambda words_list: self.on_deck_loaded(file_path, words_list),
+            on_error=lambda error: self.on_deck_load_failed(file_path, error),
+            on_cancel=self.on_deck_load_cancelled,
+            on_progress=self.loading_progressbar.set,
+        )
+        self.load_task.start()
+
+    def cancel_loading(self) -> None:
+        if self.is_loading():
+            self.loading_cancel_button.configure(state="disabled")
+            self.load_task.cancel()
+
+    def finish_loading(self) -> None:
+        """Hides the loading indicator and re-enables the file controls."""
+        self.loading_frame.pack_forget()
+        self.file_button.configure(state="normal")
+        self.file_load_option.configure(state="normal")
+
+    def on_deck_loaded(self, file_path: str, words_list: WordStore) -> None:
+        self.finish_loading()
+        self.show_deck_info(file_path, words_list)
+        self.set_deck(words_list)
+
+    def on_deck_load_failed(self, file_path: str, error: BaseException) -> None:
+        self.finish_loading()
+        if isinstance(error, FileNotFoundError):
+            logger.error("File %s not found.", file_path)
+        else:
+            logger.error("Failed to load %s: %s", file_path, error, exc_info=error)
+        self.set_deck(WordStore())
+
+    def on_deck_load_cancelled(self) -> None:
+        """Keeps the previously loaded deck (if any) after a cancelled load."""
+        self.finish_loading()
+        logger.info("Loading cancelled.")
+        self.language.bind(self.question_label, self._question_text_before_load)
+        if self.session.deck:
+            self.enable_all_buttons()
+            if self.session.selected_word is None:
+                self.check_button.configure(state="disabled")
+                self.hint_button.configure(state="disabled")
+                self.skip_button.configure(state="disabled")
+
+    def set_deck(self, words_list: WordStore) -> None:
+        """Replaces the current deck and starts a new practice round."""
+        self.session.load(words_list)
+        if self.session.deck:
+            self.enable_all_buttons()
+            self.clear_blocked_lines()
+        else:
+            self.language.bind_path(self.question_label, "main_window.question_label.File_error")
+            logger.warning("[open_file_dialog] - File is empty or invalid!")
+            self.disable_all_buttons()
 
     def toggle_block_repeat_mode(self) -> None:
         """Enables or disables the repeat blocking mode."""
         if self.block_repeat_mode.get():
-            print("Repeat blocking mode enabled.")
+            logger.info("Repeat blocking mode enabled.")
         else:
-            print("Repeat blocking mode disabled.")
+            logger.info("Repeat blocking mode disabled.")
+        self.session.set_block_repeat(self.block_repeat_mode.get())
+
+    def get_blocked_lines(self) -> List[int]:
+        """Returns the line numbers blocked in the active pool (for debug output)."""
+        return self.session.blocked_lines()
 
     def clear_blocked_lines(self) -> None:
         """Clears the list of blocked line numbers."""
-        if not self.vocab_word_list:
-            return print("Action blocked - [ClearBlockList]")
-        
-        print(f"\nBlocked lines: {self.blocked_lines}")
-        self.blocked_lines.clear()
-        print("Block list cleared.")
-        self.update_words_info_label()
-        # Reset low accuracy mode and list if clearing
-        self.low_accuracy_mode = False
-        self.low_accuracy_word_list.clear()
+        if not self.session.deck or self.is_loading():
+            logger.debug("Action blocked - [ClearBlockList]")
+            return
+
+        # Also resets low accuracy mode, the low accuracy list and the scheduling state
+        self.session.reset()
+        logger.info("Block list cleared.")
         self.skip_word()
         self.check_button.configure(state="normal")
         self.hint_button.configure(state="normal")
@@ -742,22 +1030,51 @@ class MainApp():
         MAX_ZOOM = 3.0
         new_zoom = round(APP_SETTINGS["ui_zoom_factor"] + scale, 3)
         if new_zoom < MIN_ZOOM:
-            print(f"[WARNING] UI zoom factor too small: {new_zoom} (min: {MIN_ZOOM})")
+            logger.warning("UI zoom factor too small: %s (min: %s)", new_zoom, MIN_ZOOM)
             return
         if new_zoom > MAX_ZOOM:
-            print(f"[WARNING] UI zoom factor too large: {new_zoom} (max: {MAX_ZOOM})")
+            logger.warning("UI zoom factor too large: %s (max: %s)", new_zoom, MAX_ZOOM)
             return
-        APP_SETTINGS["ui_zoom_factor"] = new_zoom
-        print(f"UI zoom factor: {APP_SETTINGS['ui_zoom_factor']}")
+        SETTINGS.set("ui_zoom_factor", new_zoom)
+        logger.info("UI zoom factor: %s", APP_SETTINGS["ui_zoom_factor"])
         ctk.set_window_scaling(APP_SETTINGS["ui_zoom_factor"])
         ctk.set_widget_scaling(APP_SETTINGS["ui_zoom_factor"])
 
     def set_app_appearance_mode(self, theme: str) -> None:
         ctk.set_appearance_mode(theme)
+        SETTINGS.set("appearance_mode", theme.lower())
 
         if APP_SETTINGS["SetIcon"]:
             set_app_icon(self)
 
-root = ctk.CTk()
-app = MainApp(root)
-root.mainloop()
\ No newline at end of file
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=APP_SETTINGS["title"])
+    parser.add_argument("--profile-startup", action="store_true", help="print an import/initialization timeline once the window is shown")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    STARTUP_PROFILER.enabled = args.profile_startup
+    load_app_configuration()
+    get_program_path(show_messagebox=False, status_flag=JSON_Loaded_flag)
+
+    apply_appearance_settings()
+    root = ctk.CTk()
+    SETTINGS.attach(root)
+    STARTUP_PROFILER.mark("create root window")
+    app = MainApp(root)
+    STARTUP_PROFILER.mark("build main window")
+
+    def first_idle() -> None:
+        STARTUP_PROFILER.mark("first idle in mainloop (window shown)")
+        STARTUP_PROFILER.report()
+    root.after_idle(first_idle)
+    root.mainloop()
+    app.close()
+    SETTINGS.flush()
+
+
+if __name__ == "__main__":
+    main()
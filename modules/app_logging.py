@@ -0,0 +1,83 @@
+"""
+app_logging.py
+
+Logging setup for the Vocabulary Practice App.
+
+    - every module logs through its own logger: logger = logging.getLogger(__name__),
+    - setup_logging() configures the root logger once: level, stdout handler and an
+      optional rotating file sink,
+    - the GUI console attaches a ConsoleLogHandler while its window is open.
+
+Messages use lazy %-formatting (logger.debug("Word: %s", word)), so when a level is
+disabled the message is never built. Multi-line debug blocks are additionally guarded
+with logger.isEnabledFor(logging.DEBUG).
+
+Usage:
+    from modules.app_logging import setup_logging
+    setup_logging(level="INFO", log_file="Assets/Vocabulary-Practice-App/Logs/app.log")
+"""
+import logging
+import os
+import sys
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+CONSOLE_FORMAT = "[%(levelname)s] %(message)s"
+
+
+def setup_logging(level: str | int = "INFO", log_file: Optional[str] = None, max_bytes: int = 1024 * 1024, backup_count: int = 3) -> logging.Logger:
+    """
+    Configures the root logger (calling it again replaces the previous handlers).
+    Args:
+        level (str | int): Logging level name ("DEBUG", "INFO", ...) or number.
+        log_file (str, optional): Path of the rotating log file. Empty/None disables the file sink.
+        max_bytes (int): Size at which the log file is rotated.
+        backup_count (int): Number of rotated files to keep.
+    Returns:
+        logging.Logger: The root logger.
+    """
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if getattr(handler, "_app_handler", False):
+            root_logger.removeHandler(handler)
+            handler.close()
+
+    if isinstance(level, str):
+        level_name = level.upper()
+        level = logging.getLevelName(level_name)
+        if not isinstance(level, int):
+            print(f"[WARNING] Unknown log level '{level_name}'. Using INFO.")
+            level = logging.INFO
+    root_logger.setLevel(level)
+
+    # Bound to the original stdout, so it is not duplicated when the GUI console redirects sys.stdout
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+    stream_handler._app_handler = True
+    root_logger.addHandler(stream_handler)
+
+    if log_file:
+        try:
+            os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+            file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            file_handler._app_handler = True
+            root_logger.addHandler(file_handler)
+        except OSError as e:
+            root_logger.warning("Failed to open log file %s: %s", log_file, e)
+    return root_logger
+
+
+class ConsoleLogHandler(logging.Handler):
+    """Writes formatted records to a stream-like object (e.g. the GUI console's ConsoleRedirector)."""
+    def __init__(self, stream, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.stream = stream
+        self.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
@@ -0,0 +1,243 @@
+"""
+attempt_history.py
+
+Persistent per-word answer history of the Vocabulary Practice App (SQLite).
+
+Every checked answer is stored as an attempt keyed by the deck (sha256 of the deck file,
+WordStore.digest) and the line number of the word. Writes go through a queue to a
+background thread that commits them in batches, so check_answer never waits for the disk.
+
+Tables:
+    decks       id, digest                       one row per deck content
+    attempts    deck_id, line, accuracy, answered_at
+                indexed by (deck_id, line, id), so the last N attempts of a word are an index range
+    word_stats  deck_id, line, attempts, accuracy_sum, last_accuracy, last_answered_at
+                running totals updated with every batch, so long-term stats never scan attempts
+
+Queries read through their own connection (WAL mode lets them run while the writer commits);
+call flush() first to include attempts that are still queued.
+
+Usage:
+    from modules.attempt_history import AttemptHistory
+    history = AttemptHistory("Assets/Vocabulary-Practice-App/History/history.sqlite3")
+    history.record(store.digest, word.line_number, accuracy)
+    history.low_accuracy_lines(store.digest, last_attempts=5, threshold=90.0)
+    history.close()
+"""
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    id INTEGER PRIMARY KEY,
+    digest TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    deck_id INTEGER NOT NULL REFERENCES decks(id),
+    line INTEGER NOT NULL,
+    accuracy REAL NOT NULL,
+    answered_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_by_word ON attempts(deck_id, line, id);
+CREATE TABLE IF NOT EXISTS word_stats (
+    deck_id INTEGER NOT NULL REFERENCES decks(id),
+    line INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    accuracy_sum REAL NOT NULL,
+    last_accuracy REAL NOT NULL,
+    last_answered_at REAL NOT NULL,
+    PRIMARY KEY (deck_id, line)
+) WITHOUT ROWID;
+"""
+
+_UPDATE_STATS = """
+INSERT INTO word_stats (deck_id, line, attempts, accuracy_sum, last_accuracy, last_answered_at)
+VALUES (?, ?, 1, ?, ?, ?)
+ON CONFLICT (deck_id, line) DO UPDATE SET
+    attempts = attempts + 1,
+    accuracy_sum = accuracy_sum + excluded.accuracy_sum,
+    last_accuracy = excluded.last_accuracy,
+    last_answered_at = excluded.last_answered_at
+"""
+
+_LOW_ACCURACY_LINES = """
+SELECT stats.line FROM word_stats AS stats
+WHERE stats.deck_id = :deck_id AND (
+    SELECT AVG(accuracy) FROM (
+        SELECT accuracy FROM attempts
+        WHERE attempts.deck_id = stats.deck_id AND attempts.line = stats.line
+        ORDER BY id DESC LIMIT :last_attempts
+    )
+) < :threshold
+ORDER BY stats.line
+"""
+
+
+class WordStats(NamedTuple):
+    attempts: int
+    mean_accuracy: float
+    last_accuracy: float
+    last_answered_at: float
+
+
+class Attempt(NamedTuple):
+    digest: str
+    line: int
+    accuracy: float
+    answered_at: float
+
+
+_FLUSH = object()  # Queued by flush(): the writer commits its batch without waiting for the deadline
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    connection = sqlite3.connect(db_path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+class AttemptHistory:
+    """
+    Records attempts on a background writer thread and answers history queries.
+    Args:
+        db_path (str): Path of the SQLite database (created if missing).
+        batch_size (int): Maximum number of attempts committed in one transaction.
+        flush_interval (float): Seconds the writer waits to collect more attempts before committing.
+    """
+    def __init__(self, db_path: str, batch_size: int = 256, flush_interval: float = 1.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        with _connect(db_path) as connection:
+            connection.executescript(_SCHEMA)
+        connection.close()
+        self._queue: "queue.Queue[object]" = queue.Queue()  # Attempt, _FLUSH or None (stop)
+        self._deck_ids: Dict[str, int] = {}  # Used by the writer thread only
+        self._local = threading.local()  # Read connection per calling thread
+        self._writer = threading.Thread(target=self._write_loop, name="AttemptHistoryWriter", daemon=True)
+        self._writer.start()
+
+    def record(self, digest: str, line_number: int, accuracy: float, answered_at: Optional[float] = None) -> None:
+        """Queues an attempt; it is committed by the writer thread within `flush_interval` seconds."""
+        self._queue.put(Attempt(digest, line_number, accuracy, time.time() if answered_at is None else answered_at))
+
+    def flush(self) -> None:
+        """Blocks until every queued attempt is committed (the writer commits right away, it does not wait for the batch deadline)."""
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self) -> None:
+        """Commits the queued attempts and stops the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    # --- Writer thread ---
+    def _write_loop(self) -> None:
+        connection = _connect(self.db_path)
+        try:
+            running = True
+            while running:
+                batch = [self._queue.get()]
+                deadline = time.monotonic() + self.flush_interval
+                while batch[-1] is not None and batch[-1] is not _FLUSH and len(batch) < self.batch_size:
+                    timeout = deadline - time.monotonic()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(self._queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                if batch[-1] is None:
+                    running = False
+                attempts = [attempt for attempt in batch if isinstance(attempt, Attempt)]
+                try:
+                    if attempts:
+                        self._commit(connection, attempts)
+                except sqlite3.Error as e:
+                    self._deck_ids.clear()  # Deck rows inserted in the failed transaction were rolled back
+                    logger.error("Failed to save %d attempts: %s", len(attempts), e)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            connection.close()
+
+    def _deck_id(self, connection: sqlite3.Connection, digest: str) -> int:
+        deck_id = self._deck_ids.get(digest)
+        if deck_id is None:
+            connection.execute("INSERT OR IGNORE INTO decks (digest) VALUES (?)", (digest,))
+            deck_id = connection.execute("SELECT id FROM decks WHERE digest = ?", (digest,)).fetchone()[0]
+            self._deck_ids[digest] = deck_id
+        return deck_id
+
+    def _commit(self, connection: sqlite3.Connection, attempts: List[Attempt]) -> None:
+        with connection:
+            rows = [(self._deck_id(connection, a.digest), a.line, a.accuracy, a.answered_at) for a in attempts]
+            connection.executemany("INSERT INTO attempts (deck_id, line, accuracy, answered_at) VALUES (?, ?, ?, ?)", rows)
+            connection.executemany(_UPDATE_STATS, [(deck_id, line, accuracy, accuracy, answered_at) for deck_id, line, accuracy, answered_at in rows])
+        logger.debug("Committed %d attempts.", len(attempts))
+
+    # --- Queries ---
+    def _reader(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = _connect(self.db_path)
+        return connection
+
+    def _find_deck_id(self, digest: str) -> Optional[int]:
+        row = self._reader().execute("SELECT id FROM decks WHERE digest = ?", (digest,)).fetchone()
+        return row[0] if row else None
+
+    def word_stats(self, digest: str) -> Dict[int, WordStats]:
+        """Returns the long-term stats of every word of a deck that has attempts, keyed by line number."""
+        deck_id = self._find_deck_id(digest)
+        if deck_id is None:
+            return {}
+        rows = self._reader().execute(
+            "SELECT line, attempts, accuracy_sum, last_accuracy, last_answered_at FROM word_stats WHERE deck_id = ?",
+            (deck_id,),
+        )
+        return {line: WordStats(count, total / count, last, answered_at) for line, count, total, last, answered_at in rows}
+
+    def recent_attempts(self, digest: str, line_number: int, limit: int = 10) -> List[tuple[float, float]]:
+        """Returns the last `limit` (accuracy, answered_at) pairs of a word, newest first."""
+        deck_id = self._find_deck_id(digest)
+        if deck_id is None:
+            return []
+        return self._reader().execute(
+            "SELECT accuracy, answered_at FROM attempts WHERE deck_id = ? AND line = ? ORDER BY id DESC LIMIT ?",
+            (deck_id, line_number, limit),
+        ).fetchall()
+
+    def attempts(self, digest: str) -> List[tuple[int, float, float]]:
+        """Returns every (line, accuracy, answered_at) of a deck, ordered by line and then oldest first."""
+        deck_id = self._find_deck_id(digest)
+        if deck_id is None:
+            return []
+        return self._reader().execute(
+            "SELECT line, accuracy, answered_at FROM attempts WHERE deck_id = ? ORDER BY line, id",
+            (deck_id,),
+        ).fetchall()
+
+    def low_accuracy_lines(self, digest: str, last_attempts: int = 5, threshold: float = 90.0) -> List[int]:
+        """Returns the line numbers whose mean accuracy over their last `last_attempts` attempts is below `threshold`."""
+        deck_id = self._find_deck_id(digest)
+        if deck_id is None:
+            return []
+        rows = self._reader().execute(_LOW_ACCURACY_LINES, {"deck_id": deck_id, "last_attempts": last_attempts, "threshold": threshold})
+        return [line for (line,) in rows]
@@ -0,0 +1,273 @@
+"""
+deck_cache.py
+
+Compiled, memory-mapped cache of parsed vocabulary files.
+
+After a deck is parsed, its WordStore is written to a compact binary file in the cache
+directory. Reopening the same deck maps that file and exposes its columns directly
+(numeric columns as memoryviews, strings decoded on access), so no parsing is needed.
+
+Cache file layout (native byte order, sections padded to 8 bytes):
+    header           magic, format version, byte order, source size, source mtime (ns),
+                     sha256 of the source, word/context/failed-line/string counts, blob size
+    line_numbers     uint32 * words
+    context_ids      uint32 * words
+    failed_lines     uint32 * failed
+    string offsets   uint64 * (strings + 1)
+    string blob      utf-8: left words, right words, left forms, right forms, contexts, language names
+
+A cache is valid if the source size and mtime match. If only the mtime changed
+(e.g. the file was touched or copied), the content hash decides, and the new mtime is stored
+in the header so the next open takes the size + mtime fast path again.
+
+Usage:
+    from modules.deck_cache import load_deck
+    store = load_deck(file_path, cache_dir="Assets/Vocabulary-Practice-App/Cache")
+"""
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from typing import List, Optional, Sequence
+
+from modules.normalization import AnswerForms
+from modules.vocab_parser import ProgressCallback, VocabFileParser
+from modules.word_store import WordStore
+
+CACHE_MAGIC = b"VPAD"
+CACHE_FORMAT_VERSION = 1
+CACHE_EXTENSION = ".vpadeck"
+_HEADER = struct.Struct("<4sHBxQQ32sIIIIQ")
+_MTIME = struct.Struct("<Q")
+_MTIME_OFFSET = struct.calcsize("<4sHBxQ")  # Source mtime field of the header
+_BYTE_ORDER = 0 if sys.byteorder == "little" else 1
+_FORM_SEPARATOR = "\x1f"  # between alternatives
+_LOOSE_SEPARATOR = "\x1e"  # between exact and loose forms
+
+logger = logging.getLogger(__name__)
+
+
+class StringColumn(Sequence[str]):
+    """Read-only column of strings stored in the cache blob, decoded on access."""
+    __slots__ = ("blob", "offsets", "base", "length")
+
+    def __init__(self, blob: memoryview, offsets: memoryview, base: int, length: int):
+        self.blob = blob
+        self.offsets = offsets
+        self.base = base
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("StringColumn index out of range")
+        slot = self.base + index
+        return str(self.blob[self.offsets[slot]:self.offsets[slot + 1]], "utf-8")
+
+
+class FormsColumn(Sequence[AnswerForms]):
+    """Read-only column of AnswerForms stored as "exact\\x1eloose" strings."""
+    __slots__ = ("strings",)
+
+    def __init__(self, strings: StringColumn):
+        self.strings = strings
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def __getitem__(self, index: int) -> AnswerForms:
+        return decode_forms(self.strings[index])
+
+
+def encode_forms(forms: AnswerForms) -> str:
+    exact = _FORM_SEPARATOR.join(forms.exact)
+    if forms.loose is forms.exact or forms.loose == forms.exact:
+        return exact
+    return exact + _LOOSE_SEPARATOR + _FORM_SEPARATOR.join(forms.loose)
+
+
+def decode_forms(text: str) -> AnswerForms:
+    exact_text, _, loose_text = text.partition(_LOOSE_SEPARATOR)
+    exact = tuple(exact_text.split(_FORM_SEPARATOR))
+    return AnswerForms(exact, tuple(loose_text.split(_FORM_SEPARATOR)) if loose_text else exact)
+
+
+def file_digest(file_path: str, chunk_size: int = 1 << 20) -> bytes:
+    """Returns the sha256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def cache_path_for(file_path: str, cache_dir: str) -> str:
+    """Returns the cache file path for a deck (one cache file per absolute deck path)."""
+    key = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(cache_dir, f"{name}-{key}{CACHE_EXTENSION}")
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(-len(data) % 8)
+
+
+def write_deck_cache(store: WordStore, cache_path: str, source_size: int, source_mtime_ns: int, digest: bytes) -> None:
+    """Writes `store` to `cache_path` atomically (temporary file + rename)."""
+    count = len(store)
+    contexts = store.contexts[1:]  # id 0 (no context) is implicit
+    strings: List[str] = []
+    strings.extend(store.left)
+    strings.extend(store.right)
+    strings.extend(encode_forms(forms) for forms in store.left_forms)
+    strings.extend(encode_forms(forms) for forms in store.right_forms)
+    strings.extend(contexts)
+    strings.extend(store.language_names[:2])
+
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for text in strings:
+        blob += text.encode("utf-8")
+        offsets.append(len(blob))
+
+    header = _HEADER.pack(
+        CACHE_MAGIC, CACHE_FORMAT_VERSION, _BYTE_ORDER, source_size, source_mtime_ns, digest,
+        count, len(contexts), len(store.failed_lines), len(strings), len(blob),
+    )
+    os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(_pad(header))
+        file.write(_pad(array("I", store.line_numbers).tobytes()))
+        file.write(_pad(array("I", store.context_ids).tobytes()))
+        file.write(_pad(array("I", store.failed_lines).tobytes()))
+        file.write(_pad(offsets.tobytes()))
+        file.write(blob)
+    os.replace(temp_path, cache_path)
+
+
+def read_cache_header(cache_path: str) -> Optional[tuple]:
+    """Returns the unpacked header of a cache file, or None if it is missing or not a valid cache."""
+    try:
+        with open(cache_path, "rb") as file:
+            raw = file.read(_HEADER.size)
+    except OSError:
+        return None
+    if len(raw) < _HEADER.size:
+        return None
+    header = _HEADER.unpack(raw)
+    if header[0] != CACHE_MAGIC or header[1] != CACHE_FORMAT_VERSION or header[2] != _BYTE_ORDER:
+        return None
+    return header
+
+
+def update_cache_mtime(cache_path: str, source_mtime_ns: int) -> None:
+    """Rewrites the source mtime of a cache header in place (after the content hash matched)."""
+    try:
+        with open(cache_path, "r+b") as file:
+            file.seek(_MTIME_OFFSET)
+            file.write(_MTIME.pack(source_mtime_ns))
+    except OSError as e:
+        logger.warning("Failed to update the deck cache %s: %s", cache_path, e)
+
+
+def map_deck_cache(cache_path: str) -> WordStore:
+    """Memory-maps a cache file and returns a read-only WordStore backed by it."""
+    with open(cache_path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    header = _HEADER.unpack_from(mapping, 0)
+    _, _, _, _, _, digest, count, context_count, failed_count, string_count, blob_size = header
+    view = memoryview(mapping)
+
+    position = _HEADER.size + (-_HEADER.size % 8)
+
+    def section(size: int) -> memoryview:
+        nonlocal position
+        data = view[position:position + size]
+        position += size + (-size % 8)
+        return data
+
+    line_numbers = section(4 * count).cast("I")
+    context_ids = section(4 * count).cast("I")
+    failed_lines = section(4 * failed_count).cast("I").tolist()
+    offsets = section(8 * (string_count + 1)).cast("Q")
+    blob = view[position:position + blob_size]
+
+    strings = StringColumn(blob, offsets, 0, string_count)
+    context_base = 4 * count
+    contexts = [strings[context_base + i] for i in range(context_count)]
+    language_base = context_base + context_count
+    store = WordStore.from_columns(
+        left=StringColumn(blob, offsets, 0, count),
+        right=StringColumn(blob, offsets, count, count),
+        left_forms=FormsColumn(StringColumn(blob, offsets, 2 * count, count)),
+        right_forms=FormsColumn(StringColumn(blob, offsets, 3 * count, count)),
+        line_numbers=line_numbers,
+        context_ids=context_ids,
+        contexts=contexts,
+        language_names=(strings[language_base], strings[language_base + 1]),
+        failed_lines=failed_lines,
+    )
+    store.digest = digest.hex()
+    store.mapping = mapping  # Keep the mapping alive as long as the store
+    return store
+
+
+def load_cached_deck(file_path: str, cache_dir: str) -> Optional[WordStore]:
+    """Returns the cached WordStore of a deck if the cache is still valid, else None."""
+    cache_path = cache_path_for(file_path, cache_dir)
+    header = read_cache_header(cache_path)
+    if header is None:
+        return None
+    source = os.stat(file_path)
+    cached_size, cached_mtime_ns, cached_digest = header[3], header[4], header[5]
+    if source.st_size != cached_size:
+        return None
+    if source.st_mtime_ns != cached_mtime_ns:
+        if file_digest(file_path) != cached_digest:
+            return None
+        update_cache_mtime(cache_path, source.st_mtime_ns)  # Same content: trust the new mtime from now on
+    try:
+        return map_deck_cache(cache_path)
+    except (OSError, ValueError, struct.error) as e:
+        logger.warning("Deck cache %s is unreadable: %s", cache_path, e)
+        return None
+
+
+def load_deck(file_path: str, cache_dir: Optional[str] = None, progress: Optional[ProgressCallback] = None, cancel_event: Optional[threading.Event] = None) -> WordStore:
+    """
+    Loads a deck, using the compiled cache in `cache_dir` when it is valid.
+    Otherwise the file is parsed and the cache is (re)written.
+    Raises FileNotFoundError, or LoadCancelled if `cancel_event` is set while parsing.
+    Args:
+        file_path (str): Path to the vocabulary .txt file.
+        cache_dir (str, optional): Cache directory. If None, the cache is disabled.
+        progress (callable, optional): Called with (bytes_read, total_bytes) while parsing.
+        cancel_event (threading.Event, optional): Stops parsing when set.
+    Returns:
+        WordStore: The parsed (or memory-mapped) deck; `store.digest` is the sha256 of the file.
+    """
+    if cache_dir:
+        store = load_cached_deck(file_path, cache_dir)
+        if store is not None:
+            logger.info("Loaded %s from the deck cache.", file_path)
+            return store
+
+    source = os.stat(file_path)
+    store = WordStore.from_entries(VocabFileParser(file_path, progress=progress, cancel_event=cancel_event))
+    digest = file_digest(file_path)
+    store.digest = digest.hex()
+    if cache_dir and store:
+        try:
+            write_deck_cache(store, cache_path_for(file_path, cache_dir), source.st_size, source.st_mtime_ns, digest)
+        except OSError as e:
+            logger.warning("Failed to write the deck cache: %s", e)
+    return store
@@ -0,0 +1,259 @@
+"""
+deck_library.py
+
+Library of vocabulary decks in a folder for the Vocabulary Practice App (File > Deck Library).
+
+DeckLibrary keeps two things:
+    - a persistent index (JSON) with the language names, word count, contexts, failed line
+      count and sha256 of every .txt file in the folder. A rescan only re-reads files whose
+      size or mtime changed since they were indexed; indexing streams the file through
+      VocabFileParser, so no WordStore is built for it.
+    - the parsed decks that were actually opened, in an LRU cache bounded by the number of
+      decks and the total number of words. Switching back to a cached deck is a dict lookup;
+      a cached deck whose file changed is dropped and loaded again.
+
+The LRU cache may be used from the deck loading worker thread (it is guarded by a lock);
+scan() is meant to run on a worker thread too (see DeckLoadTask), it only reports progress
+and checks the cancel event between files.
+
+Usage:
+    from modules.deck_library import DeckLibrary
+    library = DeckLibrary("Decks", "Assets/Vocabulary-Practice-App/Cache/library_index.json")
+    library.scan()
+    for deck in library.decks(): print(deck.name, deck.word_count)
+    store = library.open(library.decks()[0].path)
+"""
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from modules.deck_cache import file_digest, load_deck
+from modules.vocab_parser import LoadCancelled, ProgressCallback, VocabFileParser
+from modules.word_store import WordStore
+
+DECK_EXTENSION = ".txt"
+INDEX_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+class DeckInfo(NamedTuple):
+    path: str  # Absolute path of the deck file
+    name: str  # Path relative to the library folder
+    size: int
+    mtime_ns: int
+    language_names: tuple[str, str]
+    word_count: int
+    contexts: List[str]
+    failed_lines: int
+    digest: str  # sha256 of the file (same as WordStore.digest)
+
+    def to_json(self) -> dict:
+        data = self._asdict()
+        del data["path"], data["name"]  # The index is keyed by name, paths follow the folder
+        data["language_names"] = list(self.language_names)
+        return data
+
+    @classmethod
+    def from_json(cls, folder: str, name: str, data: dict) -> "DeckInfo":
+        return cls(
+            os.path.join(folder, name), name, data["size"], data["mtime_ns"], tuple(data["language_names"]),
+            data["word_count"], list(data["contexts"]), data["failed_lines"], data["digest"],
+        )
+
+
+def index_deck(folder: str, name: str) -> DeckInfo:
+    """Reads one deck file and returns its index entry. Raises OSError / UnicodeDecodeError."""
+    path = os.path.join(folder, name)
+    stat = os.stat(path)
+    parser = VocabFileParser(path)
+    word_count = 0
+    contexts: Dict[str, None] = {}  # Insertion-ordered set
+    for entry in parser:
+        word_count += 1
+        if entry["context"] is not None:
+            contexts[entry["context"]] = None
+    return DeckInfo(path, name, stat.st_size, stat.st_mtime_ns, parser.language_names, word_count,
+                    list(contexts), len(parser.failed_lines), file_digest(path).hex())
+
+
+class DeckLibrary:
+    """
+    Index of the decks in `folder` plus an LRU cache of opened decks.
+    Args:
+        folder (str): Folder with the .txt decks (subfolders included).
+        index_path (str): JSON file of the persistent index.
+        loader (callable, optional): Reads a deck file into a WordStore (load_deck without cache by default).
+        max_decks (int): Maximum number of opened decks kept in memory.
+        max_words (int): Maximum total number of words of the kept decks (the last opened deck is always kept).
+    """
+    def __init__(self, folder: str, index_path: str, loader: Optional[Callable[[str], WordStore]] = None,
+                 max_decks: int = 8, max_words: int = 2_000_000):
+        self.folder = os.path.abspath(folder)
+        self.index_path = index_path
+        self.loader = loader or load_deck
+        self.max_decks = max_decks
+        self.max_words = max_words
+        self.entries: Dict[str, DeckInfo] = {}  # name -> entry
+        self.unreadable: Dict[str, tuple[int, int]] = {}  # name -> (size, mtime_ns) of files that failed to index
+        self._opened: "OrderedDict[str, tuple[tuple[int, int], WordStore]]" = OrderedDict()  # path -> (signature, store)
+        self._opened_words = 0
+        self._lock = threading.Lock()
+        self._load_index()
+
+    # --- Index ---
+    def _load_index(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                document = json.load(file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Deck library index %s is unreadable: %s", self.index_path, e)
+            return
+        if document.get("version") != INDEX_VERSION or document.get("folder") != self.folder:
+            return  # Index of another folder (or format): rebuilt by the next scan
+        try:
+            self.entries = {name: DeckInfo.from_json(self.folder, name, data) for name, data in document["decks"].items()}
+            self.unreadable = {name: tuple(signature) for name, signature in document.get("unreadable", {}).items()}
+        except (KeyError, TypeError) as e:
+            logger.warning("Deck library index %s is invalid: %s", self.index_path, e)
+            self.entries, self.unreadable = {}, {}
+
+    def _save_index(self) -> None:
+        document = {
+            "version": INDEX_VERSION,
+            "folder": self.folder,
+            "decks": {name: entry.to_json() for name, entry in sorted(self.entries.items())},
+            "unreadable": {name: list(signature) for name, signature in sorted(self.unreadable.items())},
+        }
+        temp_path = self.index_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(document, file, indent=1, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.error("Failed to save the deck library index %s: %s", self.index_path, e)
+
+    def _deck_files(self) -> Dict[str, os.stat_result]:
+        """Returns {name: stat} of every deck file in the folder."""
+        files = {}
+        for directory, subdirectories, file_names in os.walk(self.folder):
+            subdirectories.sort()
+            for file_name in sorted(file_names):
+                if file_name.lower().endswith(DECK_EXTENSION):
+                    path = os.path.join(directory, file_name)
+                    try:
+                        files[os.path.relpath(path, self.folder)] = os.stat(path)
+                    except OSError:
+                        continue  # Removed while scanning
+        return files
+
+    def scan(self, progress: Optional[ProgressCallback] = None, cancel_event: Optional[threading.Event] = None) -> List[DeckInfo]:
+        """
+        Updates the index: new and changed files (size or mtime) are re-read, removed files are dropped.
+        Unchanged files (also unchanged files that could not be read) are not opened.
+        Saves the index if anything changed.
+        Args:
+            progress (callable, optional): Called with (files done, files to re-read).
+            cancel_event (threading.Event, optional): Raises LoadCancelled when set (checked between files).
+        Returns:
+            list: The indexed decks (see decks()).
+        """
+        files = self._deck_files()
+        signatures = {name: (stat.st_size, stat.st_mtime_ns) for name, stat in files.items()}
+        changed = [name for name, signature in signatures.items()
+                   if self.unreadable.get(name) != signature
+                   and ((entry := self.entries.get(name)) is None or (entry.size, entry.mtime_ns) != signature)]
+        removed = (self.entries.keys() | self.unreadable.keys()) - files.keys()
+        entries = {name: entry for name, entry in self.entries.items() if name in files}
+        unreadable = {name: signature for name, signature in self.unreadable.items() if name in files}
+        for done, name in enumerate(changed):
+            if cancel_event is not None and cancel_event.is_set():
+                raise LoadCancelled(self.folder)
+            if progress is not None:
+                progress(done, len(changed))
+            try:
+                entries[name] = index_deck(self.folder, name)
+                unreadable.pop(name, None)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning("Skipping deck %s: %s", name, e)
+                entries.pop(name, None)
+                unreadable[name] = signatures[name]
+        if progress is not None:
+            progress(len(changed), len(changed))
+        self.entries, self.unreadable = entries, unreadable
+        if changed or removed:
+            self._save_index()
+        logger.info("Deck library %s: %d decks (%d re-indexed, %d removed).", self.folder, len(entries), len(changed), len(removed))
+        return self.decks()
+
+    def decks(self) -> List[DeckInfo]:
+        """Indexed decks sorted by name."""
+        return [self.entries[name] for name in sorted(self.entries, key=str.lower)]
+
+    # --- Opened decks ---
+    @staticmethod
+    def _signature(path: str) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def get(self, path: str) -> Optional[WordStore]:
+        """Returns the cached deck of `path` if it was opened before and the file did not change since."""
+        path = os.path.abspath(path)
+        signature = self._signature(path)
+        with self._lock:
+            cached = self._opened.get(path)
+            if cached is None:
+                return None
+            if cached[0] != signature:
+                self._discard(path)
+                return None
+            self._opened.move_to_end(path)
+            return cached[1]
+
+    def put(self, path: str, store: WordStore, signature: Optional[tuple[int, int]] = None) -> None:
+        """
+        Caches an opened deck and evicts the least recently used ones.
+        Pass the file `signature` (size, mtime_ns) taken before reading if the file may change meanwhile.
+        """
+        path = os.path.abspath(path)
+        signature = signature or self._signature(path)
+        with self._lock:
+            self._discard(path)
+            self._opened[path] = (signature, store)
+            self._opened_words += len(store)
+            while len(self._opened) > 1 and (len(self._opened) > self.max_decks or self._opened_words > self.max_words):
+                evicted = next(iter(self._opened))
+                self._discard(evicted)
+                logger.debug("Evicted deck %s from the library cache.", evicted)
+
+    def _discard(self, path: str) -> None:
+        cached = self._opened.pop(path, None)
+        if cached is not None:
+            self._opened_words -= len(cached[1])
+
+    def open(self, path: str, loader: Optional[Callable[[str], WordStore]] = None) -> WordStore:
+        """
+        Returns the cached deck of `path`, or reads it and caches it.
+        The file signature is taken before reading, so a file changed meanwhile is read again next time.
+        Args:
+            loader (callable, optional): Reads the deck (e.g. with progress and cancellation); the library's loader by default.
+        """
+        store = self.get(path)
+        if store is None:
+            signature = self._signature(path)
+            store = (loader or self.loader)(path)
+            self.put(path, store, signature)
+        return store
+
+    def cache_info(self) -> Dict[str, object]:
+        with self._lock:
+            return {"decks": len(self._opened), "words": self._opened_words, "paths": list(self._opened)}
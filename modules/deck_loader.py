@@ -0,0 +1,109 @@
+"""
+deck_loader.py
+
+Background loading of vocabulary decks for the Vocabulary Practice App.
+
+DeckLoadTask runs a load function on a worker thread and marshals everything back to the
+Tk main thread through root.after polling, so widgets are only touched from the main thread:
+    - progress (bytes read / total bytes) is stored by the worker and read by the poll loop,
+    - the result or the exception is passed through a queue,
+    - cancel() sets a threading.Event that the loaders check every few thousand lines.
+
+Usage:
+    from modules.deck_loader import DeckLoadTask
+    task = DeckLoadTask(
+        root,
+        lambda progress, cancel_event: load_deck(file_path, progress=progress, cancel_event=cancel_event),
+        on_done=..., on_error=..., on_cancel=..., on_progress=...,
+    )
+    task.start()
+"""
+import logging
+import queue
+import threading
+from typing import Any, Callable, Optional
+
+from modules.vocab_parser import LoadCancelled, ProgressCallback
+
+LoadFunction = Callable[[ProgressCallback, threading.Event], Any]
+
+logger = logging.getLogger(__name__)
+
+
+class DeckLoadTask:
+    """
+    Runs `load_function(progress, cancel_event)` on a daemon thread.
+    Callbacks are always called on the Tk main thread:
+        on_done(result), on_error(exception), on_cancel(), on_progress(fraction 0.0-1.0).
+    """
+    def __init__(self, root, load_function: LoadFunction, on_done: Callable[[Any], None],
+                 on_error: Optional[Callable[[BaseException], None]] = None,
+                 on_cancel: Optional[Callable[[], None]] = None,
+                 on_progress: Optional[Callable[[float], None]] = None,
+                 poll_ms: int = 50):
+        self.root = root
+        self.load_function = load_function
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.on_progress = on_progress
+        self.poll_ms = poll_ms
+        self.cancel_event = threading.Event()
+        self.fraction = 0.0  # Written by the worker, read by the poll loop
+        self._results: "queue.Queue[tuple[str, Any]]" = queue.Queue(maxsize=1)
+        self._thread: Optional[threading.Thread] = None
+        self._pending = False  # Set by start(), cleared when the result is delivered on the main thread
+
+    @property
+    def running(self) -> bool:
+        """
+        True from start() until the result is delivered, also after the worker thread ended.
+        Cleared right before on_done / on_error / on_cancel, which run in the same main thread step
+        (so they may start the next task, and no user action can run in between).
+        """
+        return self._pending
+
+    def start(self) -> None:
+        self._pending = True
+        self._thread = threading.Thread(target=self._run, name="DeckLoadTask", daemon=True)
+        self._thread.start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def cancel(self) -> None:
+        """Requests cancellation; on_cancel is called once the worker stops."""
+        self.cancel_event.set()
+
+    def _report_progress(self, bytes_read: int, total_bytes: int) -> None:
+        self.fraction = bytes_read / total_bytes if total_bytes else 1.0
+
+    def _run(self) -> None:
+        try:
+            result = self.load_function(self._report_progress, self.cancel_event)
+        except LoadCancelled:
+            self._results.put(("cancelled", None))
+        except BaseException as e:
+            self._results.put(("error", e))
+        else:
+            if self.cancel_event.is_set():
+                self._results.put(("cancelled", None))
+            else:
+                self._results.put(("done", result))
+
+    def _poll(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.fraction)
+        try:
+            status, value = self._results.get_nowait()
+        except queue.Empty:
+            self.root.after(self.poll_ms, self._poll)
+            return
+        self._pending = False
+        if status == "done":
+            self.on_done(value)
+        elif status == "cancelled":
+            if self.on_cancel is not None:
+                self.on_cancel()
+        elif self.on_error is not None:
+            self.on_error(value)
+        else:
+            logger.error("Deck loading failed: %s", value, exc_info=value)
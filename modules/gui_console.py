@@ -1,29 +1,86 @@
 """
 GUI Console Library for CustomTkinter
-Version: 1.1.0
+Version: 1.2.0
 Author: Nieznany237
 Reusable console output redirection and window for CustomTkinter-based apps.
 """
+import logging
 import sys
+import threading
+from collections import deque
 import customtkinter as ctk
 from modules.utils import set_app_icon
-__version__ = "1.1.0"
+from modules.app_logging import ConsoleLogHandler
+__version__ = "1.2.0"
 
 class ConsoleRedirector:
     """
     Redirects console output to a CTkTextbox widget in a thread-safe, read-only manner.
+    write() only appends to a bounded ring buffer (safe from any thread); the buffer is
+    flushed to the widget in one batch every `flush_interval_ms` on the Tk main thread.
+    If more than `buffer_size` chunks arrive between flushes, the oldest ones are dropped
+    and replaced by a single "[... N messages dropped ...]" line.
+    The textbox keeps at most `max_lines` lines.
     """
-    def __init__(self, widget):
+    def __init__(self, widget, flush_interval_ms=100, buffer_size=2000, max_lines=2000):
         self.widget = widget
+        self.flush_interval_ms = flush_interval_ms
+        self.max_lines = max_lines
+        self._buffer = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self._closed = False
+        self.widget.after(self.flush_interval_ms, self._flush_loop)
 
     def write(self, text):
-        self.widget.configure(state="normal")
-        self.widget.insert(ctk.END, text)
-        self.widget.see(ctk.END)
-        self.widget.configure(state="disabled")
+        if not text:
+            return
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append(text)
 
     def flush(self):
-        pass  # For compatibility
+        pass  # Output is flushed to the widget by the timer
+
+    def close(self):
+        """Stops the flush timer (the remaining buffer is written once more)."""
+        self._closed = True
+        self.flush_to_widget()
+
+    def _flush_loop(self):
+        if self._closed:
+            return
+        self.flush_to_widget()
+        try:
+            self.widget.after(self.flush_interval_ms, self._flush_loop)
+        except Exception:
+            self._closed = True  # The widget was destroyed
+
+    def flush_to_widget(self):
+        """Writes all buffered text to the widget in one insert (Tk main thread only)."""
+        with self._lock:
+            if not self._buffer:
+                return
+            chunks = list(self._buffer)
+            self._buffer.clear()
+            dropped, self._dropped = self._dropped, 0
+        text = "".join(chunks)
+        if dropped:
+            text = f"[... {dropped} messages dropped ...]\n" + text
+        try:
+            if not self.widget.winfo_exists():
+                return
+            self.widget.configure(state="normal")
+            self.widget.insert(ctk.END, text)
+            # Cap the visible line count
+            line_count = int(self.widget.index("end-1c").split(".")[0])
+            if line_count > self.max_lines:
+                self.widget.delete("1.0", f"{line_count - self.max_lines + 1}.0")
+            self.widget.see(ctk.END)
+            self.widget.configure(state="disabled")
+        except Exception:
+            self._closed = True
 
 class GUIConsole:
     """
@@ -41,6 +98,8 @@ class GUIConsole:
         self.font = font
         self.console_window = None
         self.console_textbox = None
+        self.redirector = None
+        self.log_handler = None
         self._stdout_backup = sys.stdout
         self._stderr_backup = sys.stderr
 
@@ -86,9 +145,13 @@ class GUIConsole:
         self.console_textbox.pack(padx=2, pady=2, fill="both", expand=True)
         self.console_textbox.configure(font=self.font)
 
-        sys.stdout = ConsoleRedirector(self.console_textbox)
-        sys.stderr = ConsoleRedirector(self.console_textbox)
-        print("Caution: When big files are loaded, the console may freeze for a moment.")
+        # One redirector for both streams keeps stdout and stderr in order
+        self.redirector = ConsoleRedirector(self.console_textbox)
+        sys.stdout = self.redirector
+        sys.stderr = self.redirector
+        # The console is just one more logging handler
+        self.log_handler = ConsoleLogHandler(self.redirector)
+        logging.getLogger().addHandler(self.log_handler)
         print("Console output redirected to the console window.")
 
         self.console_window.protocol("WM_DELETE_WINDOW", self.close)
@@ -104,6 +167,12 @@ class GUIConsole:
         try:
             sys.stdout = self._stdout_backup
             sys.stderr = self._stderr_backup
+            if self.log_handler is not None:
+                logging.getLogger().removeHandler(self.log_handler)
+                self.log_handler = None
+            if self.redirector is not None:
+                self.redirector.close()
+                self.redirector = None
             print("Console output reverted to original stdout and stderr.")
         except Exception as e:
             print(f"[ERROR] Failed to revert console output: {e}")
@@ -0,0 +1,96 @@
+"""
+language_manager.py
+
+Runtime language switching for the Vocabulary Practice App.
+
+Widgets get their translated texts through the LanguageManager instead of calling
+configure(text=t_path(...)) directly. The manager remembers how every text is built
+(a t_path key or a function that formats one), so switch() can re-label all registered
+widgets in one pass, without destroying or recreating them. The catalogs come from
+translation_utils, which flattens and caches every language once.
+
+Usage:
+    from modules.language_manager import LanguageManager
+    language = LanguageManager()
+    language.bind_path(self.check_button, "main_window.buttons.check_button")
+    language.bind(self.question_label, lambda: f"{t_path('main_window.question_label.TranslateIt')} {word}")
+    language.bind(self.entry, lambda: t_path("main_window.entry_placeholder"), option="placeholder_text")
+    language.switch("pl")
+"""
+import logging
+from functools import partial
+from tkinter import TclError
+from typing import Any, Callable, Dict, List, Union
+
+from modules.translation_utils import get_language, set_language, t_path
+
+TextSource = Union[Callable[[], str], str]  # Function building the text, or a fixed string
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve(source: TextSource) -> str:
+    return source() if callable(source) else source
+
+
+class LanguageManager:
+    """
+    Keeps the translated texts of registered widgets and re-labels them on language change.
+    Binding a widget option again replaces its previous text source.
+    """
+    def __init__(self):
+        self._bindings: Dict[Any, Dict[str, TextSource]] = {}  # widget -> {option: source}
+        self._listeners: List[Callable[[str], None]] = []
+
+    @property
+    def language(self) -> str:
+        return get_language()
+
+    def bind(self, widget, source: TextSource, option: str = "text", **configure) -> None:
+        """
+        Sets widget `option` from `source` now and after every language switch.
+        Extra keyword arguments are passed to widget.configure() once (e.g. text_color).
+        """
+        self._bindings.setdefault(widget, {})[option] = source
+        widget.configure(**{option: _resolve(source)}, **configure)
+
+    def bind_path(self, widget, path: str, option: str = "text") -> None:
+        """Binds widget `option` to a single translation key."""
+        self.bind(widget, partial(t_path, path), option)
+
+    def source_of(self, widget, option: str = "text") -> TextSource:
+        """Returns the text source bound to a widget option (the current text if it is not bound)."""
+        source = self._bindings.get(widget, {}).get(option)
+        return source if source is not None else widget.cget(option)
+
+    def unbind(self, widget) -> None:
+        self._bindings.pop(widget, None)
+
+    def add_listener(self, callback: Callable[[str], None]) -> None:
+        """Registers a callback called with the new language code after every switch."""
+        self._listeners.append(callback)
+
+    def relabel(self) -> None:
+        """Re-applies the texts of all registered widgets in one pass."""
+        for widget, options in list(self._bindings.items()):
+            try:
+                widget.configure(**{option: _resolve(source) for option, source in options.items()})
+            except TclError:
+                # The widget was destroyed (e.g. a closed window)
+                del self._bindings[widget]
+
+    def switch(self, language_code: str) -> str:
+        """
+        Changes the active language and re-labels every registered widget.
+        Returns:
+            str: The active language code (unsupported codes fall back to the default language).
+        """
+        previous = get_language()
+        language_code = set_language(language_code)
+        if language_code == previous:
+            return language_code
+        self.relabel()
+        for callback in self._listeners:
+            callback(language_code)
+        logger.info("Language switched to '%s' (%d widgets re-labelled).", language_code, len(self._bindings))
+        return language_code
@@ -0,0 +1,188 @@
+"""
+lazy_deck.py
+
+Memory-mapped, lazily decoded decks for very large vocabulary files.
+
+open_lazy_deck() scans the file once (hashing it on the way) and keeps only:
+    - the byte offset and line number of every word pair line (12 bytes per word),
+    - a sparse table of "$ context $" headers (entry index where each context starts + byte offset).
+Words are decoded from the mapped file - and their answer forms normalized - only when
+a WordRecord actually reads them (e.g. after pick_new_word selects one).
+
+The result is a regular, read-only WordStore (built with WordStore.from_columns),
+so the selection pools, scorer and UI work with it unchanged.
+
+Usage:
+    from modules.lazy_deck import open_lazy_deck
+    store = open_lazy_deck(file_path)
+"""
+import hashlib
+import mmap
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+import os
+import threading
+from typing import List, Optional, Sequence
+
+from modules.normalization import AnswerForms, answer_forms
+from modules.vocab_parser import DEFAULT_LANGUAGE_NAMES, PAIR_SEPARATOR, PROGRESS_EVERY_LINES, LoadCancelled, ProgressCallback
+from modules.word_store import NO_CONTEXT_ID, WordStore
+
+
+class _LazyLines:
+    """Decodes word pair lines from the mapped file on demand (small LRU cache of decoded pairs)."""
+    def __init__(self, mapping: mmap.mmap, offsets: array):
+        self.mapping = mapping
+        self.offsets = offsets
+        self.pair = lru_cache(maxsize=256)(self._pair)
+
+    def _line(self, offset: int) -> str:
+        end = self.mapping.find(b"\n", offset)
+        if end == -1:
+            end = len(self.mapping)
+        return self.mapping[offset:end].decode("utf-8").strip()
+
+    def _pair(self, index: int) -> tuple[str, str]:
+        left, _, right = self._line(self.offsets[index]).partition(PAIR_SEPARATOR)
+        return left, right
+
+
+class _PairColumn(Sequence[str]):
+    """One side (0 = left, 1 = right) of the word pairs, decoded on access."""
+    def __init__(self, lines: _LazyLines, side: int):
+        self.lines = lines
+        self.side = side
+
+    def __len__(self) -> int:
+        return len(self.lines.offsets)
+
+    def __getitem__(self, index: int) -> str:
+        return self.lines.pair(index)[self.side]
+
+
+class _FormsColumn(Sequence[AnswerForms]):
+    """Answer forms of one side, normalized on first access."""
+    def __init__(self, words: _PairColumn):
+        self.words = words
+        self.forms = lru_cache(maxsize=256)(self._forms)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def _forms(self, index: int) -> AnswerForms:
+        return answer_forms(self.words[index])
+
+    def __getitem__(self, index: int) -> AnswerForms:
+        return self.forms(index)
+
+
+class _SparseContextIds(Sequence[int]):
+    """Context id of every word, resolved by binary search over the indices where contexts start."""
+    def __init__(self, starts: array, count: int):
+        self.starts = starts
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> int:
+        # Context ids start at 1 (NO_CONTEXT_ID == 0 for words before the first header)
+        return bisect_right(self.starts, index)
+
+
+class _LazyContexts(Sequence[str | None]):
+    """Context strings decoded from their header offsets; index 0 is "no context"."""
+    def __init__(self, lines: _LazyLines, offsets: array):
+        self.lines = lines
+        self.offsets = offsets
+        self.context = lru_cache(maxsize=64)(self._context)
+
+    def __len__(self) -> int:
+        return len(self.offsets) + 1
+
+    def _context(self, context_id: int) -> str:
+        return self.lines._line(self.offsets[context_id - 1])[1:-1].strip()
+
+    def __getitem__(self, context_id: int) -> str | None:
+        if context_id == NO_CONTEXT_ID:
+            return None
+        return self.context(context_id)
+
+
+def open_lazy_deck(file_path: str, progress: Optional[ProgressCallback] = None, cancel_event: Optional[threading.Event] = None) -> WordStore:
+    """
+    Maps a vocabulary file and indexes its lines without decoding the word pairs.
+    Raises FileNotFoundError / OSError from open(), LoadCancelled if `cancel_event` is set.
+    Args:
+        progress (callable, optional): Called with (bytes_read, total_bytes) while indexing.
+        cancel_event (threading.Event, optional): Stops indexing when set.
+    Returns:
+        WordStore: A read-only store whose words are decoded on access.
+    """
+    offsets = array("Q")
+    line_numbers = array("I")
+    context_starts = array("I")
+    context_offsets = array("Q")
+    failed_lines: List[int] = []
+    language_names = DEFAULT_LANGUAGE_NAMES
+
+    with open(file_path, "rb") as file:
+        total_bytes = os.fstat(file.fileno()).st_size
+        header = file.readline()
+        hasher = hashlib.sha256(header)  # Updated line by line, so the digest needs no second pass
+        position = len(header)
+        parts = header.decode("utf-8", errors="replace").strip().split(PAIR_SEPARATOR)
+        if len(parts) >= 2:
+            language_names = (parts[0], parts[1])
+        for line_number, line in enumerate(file, start=2):
+            offset = position
+            position += len(line)
+            hasher.update(line)
+            if line_number % PROGRESS_EVERY_LINES == 0:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(file_path)
+                if progress is not None:
+                    progress(position, total_bytes)
+            # Decode before stripping: str.strip() also removes Unicode whitespace (as VocabFileParser does)
+            line = line.decode("utf-8").strip()
+            if not line or line[:1] == "#":
+                continue
+            if line[:1] == "$" and line[-1:] == "$" and len(line) > 2:
+                context_starts.append(len(offsets))
+                context_offsets.append(offset)
+                continue
+            left, separator, right = line.partition(PAIR_SEPARATOR)
+            if not separator or PAIR_SEPARATOR in right:
+                failed_lines.append(line_number)
+                continue
+            if left != right:
+                offsets.append(offset)
+                line_numbers.append(line_number)
+
+    if not offsets:
+        store = WordStore(language_names)
+        store.failed_lines = failed_lines
+        store.digest = hasher.hexdigest()
+        return store
+
+    with open(file_path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    lines = _LazyLines(mapping, offsets)
+    left = _PairColumn(lines, 0)
+    right = _PairColumn(lines, 1)
+    store = WordStore.from_columns(
+        left=left,
+        right=right,
+        left_forms=_FormsColumn(left),
+        right_forms=_FormsColumn(right),
+        line_numbers=line_numbers,
+        context_ids=_SparseContextIds(context_starts, len(offsets)),
+        contexts=[],
+        language_names=language_names,
+        failed_lines=failed_lines,
+    )
+    store.contexts = _LazyContexts(lines, context_offsets)
+    store.digest = hasher.hexdigest()
+    store.mapping = mapping  # Keep the mapping alive as long as the store
+    return store
@@ -0,0 +1,98 @@
+"""
+library_window.py
+
+Deck Library window of the Vocabulary Practice App (File > Deck Library).
+
+Lists the decks of the library folder (one button per deck, clicking it opens the deck) and lets
+the user choose the folder and rescan it. Checked decks are practiced together with
+"Practice selected". The window only renders: scanning and opening decks are done by the callbacks.
+
+Usage:
+    from modules.library_window import LibraryWindow
+    window = LibraryWindow(root, APP_SETTINGS, t_path, on_open=..., on_merge=..., on_choose_folder=..., on_rescan=...)
+    window.show(library.folder, library.decks())
+"""
+import logging
+from typing import Callable, Dict, List, Optional
+
+import customtkinter as ctk
+
+from modules.deck_library import DeckInfo
+from modules.utils import set_app_icon
+
+logger = logging.getLogger(__name__)
+
+
+class LibraryWindow(ctk.CTkToplevel):
+    def __init__(self, master, app_settings: dict, t_path: Callable[[str], str], on_open: Callable[[str], None],
+                 on_merge: Callable[[List[str]], None], on_choose_folder: Callable[[], None], on_rescan: Callable[[], None]):
+        super().__init__(master)
+        self.t_path = t_path
+        self.on_open = on_open
+        self.on_merge = on_merge
+        self.title(t_path("library_window.title"))
+        self.geometry("560x420")
+        if app_settings.get("SetIcon", False):
+            try:
+                set_app_icon(self)
+            except Exception as e:
+                logger.warning("set_app_icon failed: %s", e)
+
+        self.controls_frame = ctk.CTkFrame(self)
+        self.controls_frame.pack(padx=5, pady=(5, 0), fill="x")
+        self.folder_label = ctk.CTkLabel(self.controls_frame, text="", anchor="w", font=("Arial", 13))
+        self.folder_label.pack(side="left", padx=5, pady=5, fill="x", expand=True)
+        self.rescan_button = ctk.CTkButton(self.controls_frame, text=t_path("library_window.rescan"), width=110, command=on_rescan)
+        self.rescan_button.pack(side="right", padx=5, pady=5)
+        self.choose_folder_button = ctk.CTkButton(self.controls_frame, text=t_path("library_window.choose_folder"), width=110, command=on_choose_folder)
+        self.choose_folder_button.pack(side="right", padx=0, pady=5)
+
+        self.status_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.status_frame.pack(padx=5, pady=(5, 0), fill="x")
+        self.status_label = ctk.CTkLabel(self.status_frame, text="", font=("Arial", 13), text_color="gray")
+        self.status_label.pack(side="left", padx=5)
+        self.merge_button = ctk.CTkButton(self.status_frame, text=t_path("library_window.practice_selected"), width=130,
+                                          command=self.merge_selected, state="disabled")
+        self.merge_button.pack(side="right", padx=5)
+
+        self.decks_frame = ctk.CTkScrollableFrame(self)
+        self.decks_frame.pack(padx=5, pady=5, fill="both", expand=True)
+        self.deck_rows: List[ctk.CTkFrame] = []
+        self.selected: Dict[str, ctk.BooleanVar] = {}  # Deck path -> checkbox variable
+
+    def set_status(self, text: str) -> None:
+        self.status_label.configure(text=text)
+
+    def selected_paths(self) -> List[str]:
+        return [path for path, variable in self.selected.items() if variable.get()]
+
+    def update_merge_button(self) -> None:
+        self.merge_button.configure(state="normal" if len(self.selected_paths()) > 1 else "disabled")
+
+    def merge_selected(self) -> None:
+        self.on_merge(self.selected_paths())
+
+    def show(self, folder: Optional[str], decks: List[DeckInfo]) -> None:
+        """Replaces the listed decks (decks that stay listed keep their selection)."""
+        selected = set(self.selected_paths())
+        for row in self.deck_rows:
+            row.destroy()
+        self.deck_rows = []
+        self.selected = {}
+        self.folder_label.configure(text=folder or "")
+        self.rescan_button.configure(state="normal" if folder else "disabled")
+        if folder is None:
+            self.set_status(self.t_path("library_window.no_folder"))
+            return
+        self.set_status("" if decks else self.t_path("library_window.empty"))
+        for deck in decks:
+            text = (f"{deck.name}\n{deck.language_names[0]} - {deck.language_names[1]} | "
+                    f"{deck.word_count} {self.t_path('library_window.words')} | "
+                    f"{len(deck.contexts)} {self.t_path('library_window.contexts')}")
+            row = ctk.CTkFrame(self.decks_frame, fg_color="transparent")
+            row.pack(padx=2, pady=2, fill="x")
+            variable = self.selected[deck.path] = ctk.BooleanVar(value=deck.path in selected)
+            ctk.CTkCheckBox(row, text="", width=24, variable=variable, command=self.update_merge_button).pack(side="left")
+            ctk.CTkButton(row, text=text, anchor="w", command=lambda path=deck.path: self.on_open(path)).pack(side="left", fill="x", expand=True)
+            self.deck_rows.append(row)
+        self.update_merge_button()
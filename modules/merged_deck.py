@@ -0,0 +1,83 @@
+"""
+merged_deck.py
+
+Practice sessions over several decks at once (File > Deck Library > Practice selected).
+
+merge_decks() builds one WordStore from several decks and keeps every normalized pair only
+once: a hash index maps (normalized left, normalized right) - the first exact forms computed
+at load time - to the merged row, so overlapping decks neither repeat questions nor add rows.
+Decks with the same digest (copies of one file) are skipped as a whole, and decks whose header
+names the languages the other way round ("Polish - English") are merged with sides swapped.
+
+The merged rows are numbered 1..N in `line_numbers` (the session identity used by the blocklist);
+`source_ids` / `source_lines` keep the deck and line every row came from, so WordRecord.source -
+(deck digest, line) - stays the identity used by the answer history, and WordStore.source_key
+the one used by the low accuracy words.
+A duplicate keeps the source of its first occurrence.
+
+Merging reads every row of every deck once. For decks parsed in memory the merged store shares
+their string and forms objects. Decks read from the compiled cache (deck_cache) decode every
+row from the mapped file, and lazy decks (lazy_deck) normalize every row, so merging those costs
+about as much as parsing them and the merged store holds its own copies of their rows.
+
+Usage:
+    from modules.merged_deck import merge_decks
+    store = merge_decks([("A.txt", store_a), ("B.txt", store_b)])
+    store.duplicates, store[0].source
+"""
+import logging
+import threading
+from typing import Dict, Optional, Sequence
+
+from modules.vocab_parser import LoadCancelled
+from modules.word_store import WordStore
+
+CANCEL_CHECK_EVERY = 4096  # Rows between cancellation checks
+
+logger = logging.getLogger(__name__)
+
+
+def merge_decks(decks: Sequence[tuple[str, WordStore]], cancel_event: Optional[threading.Event] = None) -> WordStore:
+    """
+    Merges decks into one deduplicated store.
+    Args:
+        decks (sequence): (name, store) pairs; the first deck sets the language names.
+        cancel_event (threading.Event, optional): Raises LoadCancelled when set.
+    Returns:
+        WordStore: The merged store (`store.duplicates` is the number of skipped words).
+    """
+    language_names = decks[0][1].language_names if decks else ("Left", "Right")
+    merged = WordStore(language_names)
+    seen: Dict[tuple[str, str], int] = {}  # Normalized pair -> merged index
+    seen_digests = set()
+    duplicates = 0
+    append = merged.append
+    for name, store in decks:
+        if store.digest and store.digest in seen_digests:
+            logger.info("Skipping %s (same file as a merged deck).", name)
+            duplicates += len(store)
+            continue
+        seen_digests.add(store.digest)
+        swap = store.language_names != language_names and tuple(reversed(store.language_names)) == language_names
+        if not swap and store.language_names != language_names:
+            logger.warning("Merging %s (%s - %s) into %s - %s.", name, *store.language_names, *language_names)
+        source_id = len(merged.source_names)
+        merged.source_names.append(name)
+        merged.source_digests.append(store.digest)
+        left, right = (store.right, store.left) if swap else (store.left, store.right)
+        left_forms, right_forms = (store.right_forms, store.left_forms) if swap else (store.left_forms, store.right_forms)
+        line_numbers, context_ids, contexts = store.line_numbers, store.context_ids, store.contexts
+        for index in range(len(store)):
+            if cancel_event is not None and index % CANCEL_CHECK_EVERY == 0 and cancel_event.is_set():
+                raise LoadCancelled(name)
+            forms = left_forms[index], right_forms[index]
+            key = (forms[0].exact[0], forms[1].exact[0])
+            if key in seen:
+                duplicates += 1
+                continue
+            seen[key] = append(left[index], right[index], len(merged) + 1, contexts[context_ids[index]], *forms)
+            merged.source_ids.append(source_id)
+            merged.source_lines.append(line_numbers[index])
+    merged.duplicates = duplicates
+    logger.info("Merged %d decks: %d words (%d duplicates skipped).", len(merged.source_names), len(merged), duplicates)
+    return merged
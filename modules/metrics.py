@@ -0,0 +1,231 @@
+"""
+metrics.py
+
+Hot-path metrics of the Vocabulary Practice App (Debug > Open Metrics).
+
+METRICS keeps per-operation counters and latency histograms ("load", "pick", "check", "hint",
+"label_refresh", ...) and memory gauges of the deck structures. Collection is off unless the
+"metrics_enabled" setting is set or it is switched on in the metrics window; while it is off,
+a function decorated with METRICS.timed() only checks METRICS.enabled before calling through.
+
+Histograms use fixed power-of-two buckets of microseconds (<1 us, 1-2 us, 2-4 us ... ~67 s),
+so recording is O(1), memory does not grow, and percentiles are estimated from the buckets
+(the upper bound of the bucket, at most the maximum seen).
+
+Memory gauges are callables returning {name: bytes}; sizes are estimated with sys.getsizeof,
+sampling large containers (see estimate_size), so reading them stays cheap on 1M-word decks.
+
+Usage:
+    from modules.metrics import METRICS
+
+    @METRICS.timed("pick")
+    def next_word(self): ...
+
+    METRICS.enabled = True
+    METRICS.increment("pick.none")
+    METRICS.add_gauge("session", session.memory_usage)
+    METRICS.export_json("metrics.json")
+"""
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from array import array
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
+
+BUCKET_COUNT = 27  # Bucket i holds durations in [2^(i-1), 2^i) us, the last one everything above
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any, sample: int = 1000, _depth: int = 0) -> int:
+    """
+    Estimates the heap size of `value` in bytes: the object, its items and (two levels of) attributes.
+    Containers with more than `sample` items are extrapolated from evenly spaced samples.
+    Buffers (memoryview, e.g. memory-mapped deck cache columns) count only their object, not the mapped data.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool, array, memoryview)) or value is None:
+        return size
+    if isinstance(value, dict):
+        items = list(islice(value.items(), sample))
+        if items:
+            item_size = sum(estimate_size(key, sample, _depth + 1) + estimate_size(item, sample, _depth + 1) for key, item in items)
+            size += round(item_size * len(value) / len(items))
+    elif isinstance(value, (list, tuple)):
+        if value:
+            step = max(1, len(value) // sample)
+            sampled = value[::step]
+            seen = set()
+            item_size = 0
+            for item in sampled:
+                if id(item) not in seen:  # e.g. AnswerForms.loose is AnswerForms.exact
+                    seen.add(id(item))
+                    item_size += estimate_size(item, sample, _depth + 1)
+            size += round(item_size * len(value) / len(sampled))
+    elif isinstance(value, (set, frozenset)):
+        items = list(islice(value, sample))
+        if items:
+            size += round(sum(estimate_size(item, sample, _depth + 1) for item in items) * len(value) / len(items))
+    elif _depth < 2 and not callable(value):
+        attributes = getattr(value, "__dict__", None)
+        if attributes is not None:
+            size += sum(estimate_size(item, sample, _depth + 1) for item in attributes.values())
+        for slot in getattr(type(value), "__slots__", ()):
+            size += estimate_size(getattr(value, slot, None), sample, _depth + 1)
+    return size
+
+
+class LatencyHistogram:
+    """Count, total, min, max and power-of-two microsecond buckets of the observed durations."""
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0  # Seconds
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * BUCKET_COUNT
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[min(int(seconds * 1e6).bit_length(), BUCKET_COUNT - 1)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Returns the estimated duration (seconds) below which `fraction` (0-1) of the observations fall."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min((1 << bucket) / 1e6, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1e3,
+            "mean_us": self.total / self.count * 1e6 if self.count else 0.0,
+            "min_us": self.min * 1e6 if self.count else 0.0,
+            "max_us": self.max * 1e6,
+            "p50_us": self.percentile(0.5) * 1e6,
+            "p90_us": self.percentile(0.9) * 1e6,
+            "p99_us": self.percentile(0.99) * 1e6,
+            "buckets_us": {("<1" if bucket == 0 else str(1 << (bucket - 1))): bucket_count
+                           for bucket, bucket_count in enumerate(self.buckets) if bucket_count},
+        }
+
+
+class MetricsCollector:
+    """Counters, latency histograms and memory gauges; recording does nothing while `enabled` is False."""
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.gauges: Dict[str, Callable[[], Dict[str, int]]] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()  # Operations may be recorded on worker threads (deck loading)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def timed(self, name: str) -> Callable:
+        """Decorator recording the duration of every call in the `name` histogram while enabled."""
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def add_gauge(self, name: str, function: Callable[[], Dict[str, int]]) -> None:
+        """Registers a memory gauge: `function` returns {structure name: estimated bytes}."""
+        self.gauges[name] = function
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.started_at = time.time()
+
+    def memory(self) -> Dict[str, Dict[str, int]]:
+        """Reads every gauge (a gauge that fails is logged and skipped)."""
+        memory = {}
+        for name, function in list(self.gauges.items()):
+            try:
+                memory[name] = function()
+            except Exception as e:
+                logger.warning("Memory gauge '%s' failed: %s", name, e)
+        return memory
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns all metrics as a JSON-serializable dict."""
+        with self._lock:
+            counters = dict(self.counters)
+            latency = {name: histogram.to_dict() for name, histogram in self.histograms.items()}
+        return {
+            "enabled": self.enabled,
+            "collected_for_s": time.time() - self.started_at,
+            "counters": counters,
+            "latency": latency,
+            "memory_bytes": self.memory(),
+        }
+
+    def format_lines(self) -> List[str]:
+        """Returns a text report of the current metrics (used by the metrics window)."""
+        snapshot = self.snapshot()
+        lines = [f"Collection: {'on' if snapshot['enabled'] else 'off'} | collected for {snapshot['collected_for_s']:.0f} s", ""]
+        lines.append(f"{'operation':<18} {'count':>8} {'mean':>10} {'p50':>10} {'p90':>10} {'p99':>10} {'max':>10}")
+        for name, stats in sorted(snapshot["latency"].items()):
+            lines.append(
+                f"{name:<18} {stats['count']:>8} {stats['mean_us']:>8.1f}us {stats['p50_us']:>8.1f}us "
+                f"{stats['p90_us']:>8.1f}us {stats['p99_us']:>8.1f}us {stats['max_us']:>8.1f}us"
+            )
+        if snapshot["counters"]:
+            lines.append("")
+            lines.extend(f"{name:<30} {count:>10}" for name, count in sorted(snapshot["counters"].items()))
+        for gauge, structures in snapshot["memory_bytes"].items():
+            lines.append("")
+            lines.append(f"Memory ({gauge}): {sum(structures.values()) / 1024 / 1024:.2f} MB")
+            lines.extend(f"  {name:<28} {size / 1024:>12.1f} KB" for name, size in structures.items())
+        return lines
+
+    def export_json(self, file_path: str) -> None:
+        """Writes snapshot() to `file_path`. Raises OSError if the file cannot be written."""
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.snapshot(), file, indent=2)
+            file.write("\n")
+        logger.info("Metrics exported to %s.", file_path)
+
+
+METRICS = MetricsCollector()
@@ -0,0 +1,98 @@
+"""
+metrics_window.py
+
+Live view of the hot-path metrics (Debug > Open Metrics).
+
+The window re-renders METRICS.format_lines() every `refresh_ms` while it is open, and lets the
+user switch collection on/off, reset the metrics and export them to JSON. The first line
+(collection state and elapsed time) goes to a label, so the text box is only redrawn when
+the metrics themselves changed.
+
+Usage:
+    from modules.metrics_window import MetricsWindow
+    MetricsWindow(root, METRICS, APP_SETTINGS)
+"""
+import logging
+from tkinter import filedialog
+
+import customtkinter as ctk
+
+from modules.metrics import MetricsCollector
+from modules.utils import set_app_icon
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsWindow(ctk.CTkToplevel):
+    def __init__(self, master, metrics: MetricsCollector, app_settings: dict, refresh_ms: int = 1000,
+                 font=("Cascadia Code", 12)):
+        super().__init__(master)
+        self.metrics = metrics
+        self.refresh_ms = refresh_ms
+        self._last_text = None
+        self.title("Metrics")
+        self.geometry("720x480")
+        if app_settings.get("SetIcon", False):
+            try:
+                set_app_icon(self)
+            except Exception as e:
+                logger.warning("set_app_icon failed: %s", e)
+
+        self.controls_frame = ctk.CTkFrame(self)
+        self.controls_frame.pack(padx=5, pady=(5, 0), fill="x")
+
+        self.enabled_var = ctk.BooleanVar(value=metrics.enabled)
+        self.enabled_checkbox = ctk.CTkCheckBox(
+            self.controls_frame,
+            text="Collect metrics",
+            variable=self.enabled_var,
+            command=self.toggle_collection,
+        )
+        self.enabled_checkbox.pack(side="left", padx=5, pady=5)
+        self.export_button = ctk.CTkButton(self.controls_frame, text="Export JSON", width=100, command=self.export)
+        self.export_button.pack(side="right", padx=5, pady=5)
+        self.reset_button = ctk.CTkButton(self.controls_frame, text="Reset", width=60, command=self.reset)
+        self.reset_button.pack(side="right", padx=0, pady=5)
+
+        self.header_label = ctk.CTkLabel(self, text="", anchor="w", font=font)
+        self.header_label.pack(padx=10, pady=(5, 0), fill="x")
+
+        self.textbox = ctk.CTkTextbox(self, border_width=1, wrap=ctk.NONE, state="disabled", font=font)
+        self.textbox.pack(padx=5, pady=5, fill="both", expand=True)
+        self.refresh()
+
+    def toggle_collection(self) -> None:
+        self.metrics.enabled = self.enabled_var.get()
+        logger.info("Metrics collection %s.", "enabled" if self.metrics.enabled else "disabled")
+        self.render()
+
+    def reset(self) -> None:
+        self.metrics.reset()
+        self.render()
+
+    def export(self) -> None:
+        file_path = filedialog.asksaveasfilename(parent=self, defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        if not file_path:
+            return
+        try:
+            self.metrics.export_json(file_path)
+        except OSError as e:
+            logger.error("Failed to export metrics to %s: %s", file_path, e)
+
+    def render(self) -> None:
+        header, *lines = self.metrics.format_lines()
+        self.header_label.configure(text=header)  # Elapsed time changes on every refresh
+        text = "\n".join(lines).lstrip("\n")
+        if text == self._last_text:
+            return  # Nothing changed, skip the redraw
+        self._last_text = text
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", ctk.END)
+        self.textbox.insert("1.0", text)
+        self.textbox.configure(state="disabled")
+
+    def refresh(self) -> None:
+        if not self.winfo_exists():
+            return
+        self.render()
+        self.after(self.refresh_ms, self.refresh)
@@ -0,0 +1,72 @@
+"""
+normalization.py
+
+Answer normalization for the Vocabulary Practice App.
+
+Every side of a word pair is normalized once at load time into AnswerForms:
+    - exact: casefolded, NFKC, punctuation dropped, whitespace collapsed,
+    - loose: the same forms with accents removed (NFKD without combining marks),
+and alternative answers written as "car / automobile" or "car; automobile" become separate forms.
+
+Usage:
+    from modules.normalization import answer_forms, normalize_answer
+    forms = answer_forms("Samochód / auto")
+    # forms.exact == ("samochód auto", "samochód", "auto"), forms.loose == ("samochod auto", "samochod", "auto")
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple
+
+ALTERNATIVE_SEPARATORS = re.compile(r"[/;]")
+_APOSTROPHES = re.compile(r"['’`]")
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+_COMBINING_MARKS = re.compile("[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]+")
+
+
+class AnswerForms(NamedTuple):
+    exact: tuple[str, ...]  # Accent-sensitive forms; exact[0] is the whole answer
+    loose: tuple[str, ...]  # Accent-insensitive forms (same object as `exact` if there are no accents)
+
+
+def normalize_answer(text: str) -> str:
+    """Casefolds, applies NFKC, drops punctuation and collapses whitespace."""
+    if text.replace(" ", "").isalnum():
+        # Fast path for plain words (no punctuation)
+        if not text.isascii():
+            text = unicodedata.normalize("NFKC", text)
+        return " ".join(text.casefold().split())
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _APOSTROPHES.sub("", text)
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def strip_accents(text: str) -> str:
+    """Removes accents (NFKD decomposition without combining marks). Letters like "ł" stay unchanged."""
+    if text.isascii() or unicodedata.is_normalized("NFKD", text):
+        return text  # Nothing to decompose, so no accents to remove
+    return _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text))
+
+
+def answer_forms(text: str) -> AnswerForms:
+    """Builds the normalized forms of one side of a word pair (whole answer first, then alternatives)."""
+    forms = [normalize_answer(text)]
+    if "/" in text or ";" in text:
+        for alternative in ALTERNATIVE_SEPARATORS.split(text):
+            form = normalize_answer(alternative)
+            if form and form not in forms:
+                forms.append(form)
+    exact = tuple(forms)
+    if text.isascii():
+        return AnswerForms(exact, exact)
+    loose = tuple(strip_accents(form) for form in exact)
+    return AnswerForms(exact, exact if loose == exact else loose)
+
+
+@lru_cache(maxsize=1024)
+def normalize_input(user_input: str, accent_insensitive: bool = False) -> str:
+    """Normalizes a user's answer the same way as the stored forms (cached for repeated checks)."""
+    form = normalize_answer(user_input)
+    return strip_accents(form) if accent_insensitive else form
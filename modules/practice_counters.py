@@ -0,0 +1,70 @@
+"""
+practice_counters.py
+
+Incrementally maintained word counters for the status bar of the Vocabulary Practice App.
+
+The counters are updated at every state transition (load, block, unblock, clear,
+low-accuracy add/remove), so reading them - and rebuilding the status text - is
+constant time regardless of the deck size.
+
+Usage:
+    from modules.practice_counters import PracticeCounters
+    counters = PracticeCounters()
+    counters.reset(len(store))
+    counters.word_blocked()
+    text = counters.status_text(block_repeat=True, show_low_accuracy=False, low_accuracy_mode=False)
+"""
+
+
+class PracticeCounters:
+    """Loaded / remaining / blocked / low-accuracy counts kept up to date by the caller."""
+    __slots__ = ("loaded", "remaining", "blocked", "low_accuracy")
+
+    def __init__(self, loaded: int = 0):
+        self.reset(loaded)
+
+    def reset(self, loaded: int) -> None:
+        """Called after a deck is loaded: nothing blocked, no low-accuracy words."""
+        self.loaded = loaded
+        self.remaining = loaded
+        self.blocked = 0
+        self.low_accuracy = 0
+
+    def word_blocked(self) -> None:
+        self.remaining -= 1
+        self.blocked += 1
+
+    def word_unblocked(self) -> None:
+        self.remaining += 1
+        self.blocked -= 1
+
+    def blocks_cleared(self) -> None:
+        self.remaining = self.loaded
+        self.blocked = 0
+
+    def low_accuracy_added(self) -> None:
+        self.low_accuracy += 1
+
+    def low_accuracy_removed(self) -> None:
+        self.low_accuracy -= 1
+
+    def low_accuracy_cleared(self) -> None:
+        self.low_accuracy = 0
+
+    def status_text(self, block_repeat: bool, show_low_accuracy: bool, low_accuracy_mode: bool) -> str:
+        """Returns the text of the words info label for the given settings."""
+        if low_accuracy_mode:
+            # The main list is exhausted while practicing low accuracy words
+            if show_low_accuracy and block_repeat:
+                return f"Loaded: {self.loaded} | Remaining: 0 | Low accuracy: {self.low_accuracy}"
+            return f"Loaded: {self.loaded} | Remaining: 0"
+        if block_repeat:
+            if show_low_accuracy:
+                return f"Loaded: {self.loaded} | Remaining: {self.remaining} | Low accuracy: {self.low_accuracy}"
+            return f"Loaded: {self.loaded} | Remaining: {self.remaining}"
+        # If low accuracy mode is enabled but block_repeat is off, only show Loaded
+        return f"Loaded: {self.loaded}"
+
+    def __repr__(self) -> str:
+        return (f"PracticeCounters(loaded={self.loaded}, remaining={self.remaining}, "
+                f"blocked={self.blocked}, low_accuracy={self.low_accuracy})")
@@ -0,0 +1,362 @@
+"""
+practice_session.py
+
+Headless practice engine of the Vocabulary Practice App.
+
+PracticeSession owns the deck, word selection (random with blocklist and low accuracy
+rounds, SM-2 scheduling or weighted by mistakes), answer scoring, the answer history and
+every state transition between them. It never touches a widget: MainApp forwards user
+actions to it and renders the results through the observer callbacks, and benchmarks or
+other front-ends can drive it directly.
+
+Observer callbacks (all optional, called after the state changed):
+    on_question(question)  a new question was picked (None if no word is available),
+    on_answer(result)      an answer was checked,
+    on_status()            the counters or the low accuracy mode changed.
+
+Usage:
+    from modules.practice_session import PracticeSession
+    session = PracticeSession(scorer=AccuracyScorer())
+    session.load(store)
+    question = session.next_word()
+    result = session.check("answer")
+"""
+import logging
+import random
+from typing import Callable, Dict, NamedTuple, Optional, Sequence
+
+from modules.metrics import METRICS, estimate_size
+from modules.practice_counters import PracticeCounters
+from modules.scheduler import ReviewScheduler
+from modules.scoring import AccuracyScorer, LOW_ACCURACY_THRESHOLD
+from modules.selection import IndexedWordSet, SelectionPool
+from modules.weighted_sampler import WeightedSampler
+from modules.word_store import WordRecord, WordStore
+
+DIRECTIONS = ("Left_Lang_to_Right_Lang", "Right_Lang_to_Left_Lang")
+SELECTION_MODES = ("random", "scheduled", "weighted")
+
+logger = logging.getLogger(__name__)
+
+
+class Question(NamedTuple):
+    word: WordRecord
+    direction: str  # "Left_Lang_to_Right_Lang" or "Right_Lang_to_Left_Lang"
+    text: str  # The word to translate
+
+    @property
+    def answer_key(self) -> str:
+        return "Right_Lang" if self.direction == "Left_Lang_to_Right_Lang" else "Left_Lang"
+
+
+class AnswerResult(NamedTuple):
+    word: WordRecord
+    user_input: str
+    correct_answer: str
+    accuracy: float
+
+
+class PracticeSession:
+    """
+    Practice state of one deck, independent of any GUI toolkit.
+    Args:
+        scorer (AccuracyScorer, optional): Scores answers (a levenshtein scorer by default).
+        history_provider (callable, optional): Returns the AttemptHistory to record answers in, or None.
+            Called on first use, so the database is only opened when it is needed.
+        rng (random.Random, optional): Random generator used for every random choice of the session.
+        on_question, on_answer, on_status (callable, optional): Observer callbacks, see the module docstring.
+    """
+    def __init__(self, scorer: Optional[AccuracyScorer] = None,
+                 history_provider: Optional[Callable[[], object]] = None,
+                 rng: Optional[random.Random] = None,
+                 on_question: Optional[Callable[[Optional[Question]], None]] = None,
+                 on_answer: Optional[Callable[[AnswerResult], None]] = None,
+                 on_status: Optional[Callable[[], None]] = None):
+        self.scorer = scorer or AccuracyScorer()
+        self.history_provider = history_provider
+        self.rng = rng or random.Random()
+        self.on_question = on_question
+        self.on_answer = on_answer
+        self.on_status = on_status
+
+        # Settings
+        self.selected_mode = "mixed"  # Direction chosen by the user, "mixed" picks one per question
+        self.selection_mode = "random"
+        self.block_repeat = False
+        self.low_accuracy_enabled = False
+        self.accent_insensitive = False
+
+        # Deck state
+        self.deck: WordStore = WordStore()
+        self.counters = PracticeCounters()  # Updated on every block/unblock/reclassification
+        self.word_pool = SelectionPool()  # All words; blocked region == blocked lines
+        self.low_accuracy_words = IndexedWordSet()  # Words with <90% accuracy, keyed by WordStore.source_key
+        self.low_accuracy_pool = SelectionPool()  # Built when switching to low accuracy mode
+        self.low_accuracy_mode = False
+        self.available_words: Sequence[int] = []  # Indices into deck (range or SelectionPool)
+        self._scheduler: Optional[ReviewScheduler] = None  # Created on first use
+        self._sampler: Optional[WeightedSampler] = None  # Created on first use
+
+        # Current question
+        self.question: Optional[Question] = None
+        self.hint_shown = False
+        self.answer_recorded = False  # The current question was scored once (history / sampler updated)
+
+    @property
+    def selected_word(self) -> Optional[WordRecord]:
+        return self.question.word if self.question is not None else None
+
+    @property
+    def current_mode(self) -> str:
+        """Direction of the current question (the selected mode before the first question)."""
+        return self.question.direction if self.question is not None else self.selected_mode
+
+    @property
+    def history(self):
+        return self.history_provider() if self.history_provider is not None else None
+
+    @property
+    def scheduler(self) -> ReviewScheduler:
+        """SM-2 scheduler of the current deck, rebuilt from the answer history (so intervals carry over between sessions)."""
+        if self._scheduler is None:
+            self._scheduler = ReviewScheduler(len(self.deck), rng=self.rng)
+            history = self.history
+            if history is not None and self.deck.digests():
+                history.flush()  # Include queued attempts (committed right away, see AttemptHistory.flush)
+                index_of_source = self.deck.index_of_source
+                for digest in self.deck.digests():  # Every source deck of a merged store
+                    self._scheduler.seed(
+                        (index, accuracy, answered_at)
+                        for line_number, accuracy, answered_at in history.attempts(digest)
+                        if (index := index_of_source(digest, line_number)) is not None
+                    )
+        return self._scheduler
+
+    @property
+    def sampler(self) -> WeightedSampler:
+        """Error-weighted sampler of the current deck, seeded from the answer history."""
+        if self._sampler is None:
+            self._sampler = WeightedSampler(len(self.deck), rng=self.rng)
+            history = self.history
+            if history is not None and self.deck.digests():
+                history.flush()  # Include queued attempts (committed right away, see AttemptHistory.flush)
+                for digest in self.deck.digests():  # Every source deck of a merged store
+                    for line_number, stats in history.word_stats(digest).items():
+                        index = self.deck.index_of_source(digest, line_number)
+                        if index is not None:
+                            self._sampler.seed(index, stats.mean_accuracy, stats.last_accuracy)
+        return self._sampler
+
+    def _notify_status(self) -> None:
+        if self.on_status is not None:
+            self.on_status()
+
+    # --- Deck and progress ---
+    def load(self, deck: WordStore) -> None:
+        """Replaces the deck and resets the progress (call next_word() to ask the first question)."""
+        self.deck = deck
+        self.word_pool = SelectionPool(range(len(deck)))
+        self.counters.reset(len(deck))
+        self.reset()
+
+    def reset(self) -> None:
+        """Clears the blocklist, the low accuracy words and the in-session scheduling state (rebuilt from the answer history)."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Blocked lines: %s", self.blocked_lines())
+        self.word_pool.clear()
+        self.counters.blocks_cleared()
+        self.low_accuracy_mode = False
+        self.low_accuracy_words.clear()
+        self.low_accuracy_pool = SelectionPool()
+        self.counters.low_accuracy_cleared()
+        self.available_words = []
+        self._scheduler = None
+        self._sampler = None
+        self.question = None
+        self.hint_shown = False
+        self.answer_recorded = False
+        self._notify_status()
+
+    def memory_usage(self) -> Dict[str, int]:
+        """Estimated heap bytes of the deck columns and the selection structures (a memory gauge, see modules/metrics.py)."""
+        usage = {f"deck.{name}": estimate_size(getattr(self.deck, name))
+                 for name in ("left", "right", "left_forms", "right_forms", "line_numbers", "context_ids", "contexts")}
+        usage["word_pool"] = estimate_size(self.word_pool)
+        usage["low_accuracy_words"] = estimate_size(self.low_accuracy_words)
+        usage["low_accuracy_pool"] = estimate_size(self.low_accuracy_pool)
+        usage["scheduler"] = estimate_size(self._scheduler) if self._scheduler is not None else 0
+        usage["sampler"] = estimate_size(self._sampler) if self._sampler is not None else 0
+        return usage
+
+    def blocked_lines(self) -> list:
+        """Returns the line numbers blocked in the active pool."""
+        active_pool = self.low_accuracy_pool if self.low_accuracy_mode else self.word_pool
+        line_numbers = self.deck.line_numbers
+        return sorted(line_numbers[index] for index in active_pool.blocked_indices())
+
+    # --- Settings ---
+    def set_direction(self, mode: str) -> None:
+        """Sets the translation direction of the next questions (one of DIRECTIONS or "mixed")."""
+        self.selected_mode = mode
+
+    def set_block_repeat(self, enabled: bool) -> None:
+        self.block_repeat = enabled
+        self._notify_status()
+
+    def set_low_accuracy_enabled(self, enabled: bool) -> None:
+        self.low_accuracy_enabled = enabled
+        self._notify_status()
+
+    def set_selection_mode(self, mode: str) -> None:
+        if mode not in SELECTION_MODES:
+            raise ValueError(f"Unknown selection mode: {mode}")
+        self.selection_mode = mode
+
+    def status_text(self) -> tuple[str, str]:
+        """Returns the texts of the words info label and the low accuracy info label."""
+        words_info_text = self.counters.status_text(
+            block_repeat=self.block_repeat,
+            show_low_accuracy=self.low_accuracy_enabled,
+            low_accuracy_mode=self.low_accuracy_mode,
+        )
+        low_accuracy_text = "Low accuracy mode: practice words that you find difficult" if self.low_accuracy_mode else ""
+        return words_info_text, low_accuracy_text
+
+    # --- Practice ---
+    @METRICS.timed("pick")
+    def next_word(self) -> Optional[Question]:
+        """
+        Picks the next question according to the selection mode and the blocklist settings.
+        Returns None (and notifies on_question(None)) if the deck is empty or no word is available.
+        """
+        self.hint_shown = False
+        self.answer_recorded = False
+        if not self.deck:
+            selected_index = None
+        elif self.selection_mode == "scheduled":
+            selected_index = self.scheduler.next_card()
+        elif self.selection_mode == "weighted":
+            previous = self.selected_word
+            selected_index = self.sampler.pick(exclude=previous.index if previous is not None else None)
+        else:
+            selected_index = self.pick_random_index()
+
+        if selected_index is None:
+            self.question = None
+            METRICS.increment("pick.no_words")
+        else:
+            word = self.deck[selected_index]
+            direction = self.selected_mode
+            if direction not in DIRECTIONS:
+                # Always pick a random direction if mode is "mixed"
+                direction = self.rng.choice(DIRECTIONS)
+            self.question = Question(word, direction, word["Left_Lang"] if direction == DIRECTIONS[0] else word["Right_Lang"])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Next word selected: %s - %s | question: %s | line: %d | mode: %s | context: %s",
+                    word["Left_Lang"], word["Right_Lang"], self.question.text,
+                    word.line_number, direction, word.context,
+                )
+        self._notify_status()
+        if self.on_question is not None:
+            self.on_question(self.question)
+        return self.question
+
+    def pick_random_index(self) -> Optional[int]:
+        """
+        Picks a random word index using the blocklist and low accuracy settings (the "random" selection mode).
+        Returns None if no word is available.
+        """
+        # If not in low accuracy mode, use main list
+        if not self.low_accuracy_mode:
+            # Filter words by blocklist
+            if not self.block_repeat:
+                self.available_words = range(len(self.deck))
+            else:
+                self.available_words = self.word_pool
+
+            # If main list is exhausted and low accuracy mode is enabled, switch to low accuracy mode
+            if not self.available_words and self.low_accuracy_enabled and self.block_repeat and self.low_accuracy_words:
+                self.low_accuracy_mode = True
+                self.word_pool.clear()
+                self.counters.blocks_cleared()
+                self.low_accuracy_pool = SelectionPool(self.low_accuracy_words, capacity=len(self.deck))
+                self.available_words = self.low_accuracy_pool
+                METRICS.increment("low_accuracy.rounds")
+                logger.info("Switched to low accuracy mode. Practicing words with <90%% accuracy.")
+        else:
+            # In low accuracy mode, use only the low accuracy pool (it has its own blocklist)
+            self.available_words = self.low_accuracy_pool
+
+        if not self.available_words:
+            return None
+
+        selected_index = self.rng.choice(self.available_words)
+
+        if self.block_repeat:
+            if self.low_accuracy_mode:
+                self.low_accuracy_pool.block(selected_index)
+            elif self.word_pool.block(selected_index):
+                self.counters.word_blocked()
+
+        return selected_index
+
+    @METRICS.timed("hint")
+    def hint(self, length: int = 3) -> Optional[str]:
+        """Returns the first `length` letters of the answer, or None if there is no question or the hint was already shown."""
+        if self.question is None or self.hint_shown:
+            return None
+        self.hint_shown = True
+        return self.question.word[self.question.answer_key][:length] + "..."
+
+    @METRICS.timed("check")
+    def check(self, user_input: str) -> Optional[AnswerResult]:
+        """
+        Scores an answer to the current question, records it and updates the selection state.
+        Returns None if there is no current question.
+        """
+        question = self.question
+        if question is None:
+            return None
+        word = question.word
+        # Compare against the normalized forms precomputed at load time
+        accuracy = self.scorer.score_forms(word.forms(question.answer_key), user_input, self.accent_insensitive,
+                                           answer=word[question.answer_key])
+        # Only the first answer to a question is recorded in the history and the sampler weights
+        # (Enter may be pressed again on the same question; the scheduler guards reviews itself)
+        first_answer = not self.answer_recorded
+        self.answer_recorded = True
+        digest, line_number = word.source
+        history = self.history if digest and first_answer else None
+        if history is not None:
+            history.record(digest, line_number, accuracy)
+        if self.selection_mode == "scheduled":
+            self.scheduler.review(word.index, accuracy)
+        elif self.selection_mode == "weighted" and first_answer:
+            self.sampler.record(word.index, accuracy)
+
+        result = AnswerResult(word, user_input, word[question.answer_key], accuracy)
+        logger.debug("Checking answer: input=%r correct=%r accuracy=%.2f mode=%s", user_input, result.correct_answer, accuracy, question.direction)
+
+        # Low accuracy rounds only exist in random selection (the scheduler and the sampler requeue failed words themselves)
+        tracks_low_accuracy = self.selection_mode == "random"
+
+        # If in main mode, and accuracy < 90%, add to low_accuracy_words if not already present
+        if tracks_low_accuracy and not self.low_accuracy_mode and self.low_accuracy_enabled and self.block_repeat:
+            if accuracy < LOW_ACCURACY_THRESHOLD and self.low_accuracy_words.add(self.deck.source_key(word.index), word.index):
+                self.counters.low_accuracy_added()
+
+        # If in low accuracy mode, and answer is correct (accuracy >= 90%), remove from low_accuracy_words
+        if accuracy < LOW_ACCURACY_THRESHOLD:
+            METRICS.increment("check.below_threshold")
+
+        if tracks_low_accuracy and self.low_accuracy_mode and accuracy >= LOW_ACCURACY_THRESHOLD:
+            if self.low_accuracy_words.remove(self.deck.source_key(word.index)):
+                self.counters.low_accuracy_removed()
+            # Also remove it from the low accuracy pool (available_words points at it)
+            self.low_accuracy_pool.remove(word.index)
+
+        self._notify_status()
+        if self.on_answer is not None:
+            self.on_answer(result)
+        return result
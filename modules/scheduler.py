@@ -0,0 +1,199 @@
+"""
+scheduler.py
+
+Spaced-repetition (SM-2) scheduling of words for the Vocabulary Practice App.
+
+Every reviewed word has an ease factor, an interval and a due time. Reviewed words are kept
+in a min-heap ordered by due time, so the next due word is found in O(log N); rescheduling
+pushes a new heap entry and the outdated one is skipped when it reaches the top (lazy deletion).
+Words that were never reviewed are drawn at random from a SelectionPool, so neither picking
+nor building the scheduler scans the deck - memory grows only with the number of reviewed words.
+
+The accuracy of an answer (0-100) is mapped to an SM-2 quality (0-5). Failed answers
+(quality < 3) make the word due again after `relearn_seconds` in the same session.
+The state is not stored: seed() replays the answers recorded in AttemptHistory with their
+timestamps, so intervals of days carry over between sessions.
+
+Picking order:
+    1. the reviewed word with the earliest due time, if it is due,
+    2. otherwise a new word,
+    3. otherwise the earliest reviewed word even if it is not due yet (practicing ahead).
+
+Usage:
+    from modules.scheduler import ReviewScheduler
+    scheduler = ReviewScheduler(len(store))
+    scheduler.seed((index, accuracy, answered_at) for ...)  # Past answers, oldest first per word
+    index = scheduler.next_card()
+    scheduler.review(index, accuracy)
+"""
+import heapq
+import random
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from modules.scoring import LOW_ACCURACY_THRESHOLD
+from modules.selection import SelectionPool
+
+DAY_SECONDS = 24 * 60 * 60
+MIN_EASE = 1.3
+INITIAL_EASE = 2.5
+
+
+def quality_from_accuracy(accuracy: float, threshold: float = LOW_ACCURACY_THRESHOLD) -> int:
+    """Maps an answer accuracy (percent) to an SM-2 quality: 5 perfect, 3-4 passed, 0-2 failed."""
+    if accuracy >= 100.0:
+        return 5
+    if accuracy >= threshold:
+        return 4 if accuracy >= (100.0 + threshold) / 2 else 3
+    if accuracy >= threshold / 2:
+        return 2
+    return 1 if accuracy > 0 else 0
+
+
+class CardState:
+    """SM-2 state of one reviewed word."""
+    __slots__ = ("ease", "interval", "repetitions", "due", "version")
+
+    def __init__(self):
+        self.ease = INITIAL_EASE
+        self.interval = 0.0  # Days
+        self.repetitions = 0  # Successful reviews in a row
+        self.due = 0.0  # Timestamp
+        self.version = 0  # Incremented on every reschedule, identifies the current heap entry
+
+    def __repr__(self) -> str:
+        return (f"CardState(ease={self.ease:.2f}, interval={self.interval:g}d, "
+                f"repetitions={self.repetitions}, due={self.due:.0f})")
+
+
+class ReviewScheduler:
+    """
+    SM-2 scheduler over the word indices 0..card_count-1.
+    Args:
+        card_count (int): Number of words in the deck.
+        clock (callable): Returns the current time in seconds (time.time by default).
+        relearn_seconds (float): Delay before a failed word is due again.
+        rng (random.Random, optional): Random generator used to pick new words.
+    """
+    def __init__(self, card_count: int, clock: Callable[[], float] = time.time,
+                 relearn_seconds: float = 60.0, rng: Optional[random.Random] = None):
+        self.clock = clock
+        self.relearn_seconds = relearn_seconds
+        self.rng = rng or random.Random()
+        self.cards: Dict[int, CardState] = {}
+        self.new_cards = SelectionPool(range(card_count), capacity=card_count)
+        self._heap: List[tuple[float, int, int]] = []  # (due, version, index)
+        self.current: Optional[int] = None  # Word returned by the last next_card()
+        self._current_reviewed = False
+
+    def __len__(self) -> int:
+        """Number of reviewed words."""
+        return len(self.cards)
+
+    @property
+    def new_count(self) -> int:
+        return len(self.new_cards)
+
+    def due_count(self, now: Optional[float] = None) -> int:
+        """Number of reviewed words that are due (O(number of reviewed words), for status display)."""
+        now = self.clock() if now is None else now
+        return sum(1 for card in self.cards.values() if card.due <= now)
+
+    def _push(self, index: int, card: CardState) -> None:
+        card.version += 1
+        if len(self._heap) > 2 * len(self.cards) + 64:
+            # Too many outdated entries: rebuild the heap from the current states
+            self._heap = [(state.due, state.version, i) for i, state in self.cards.items() if i != index]
+            heapq.heapify(self._heap)
+        heapq.heappush(self._heap, (card.due, card.version, index))
+
+    def _top(self) -> Optional[tuple[float, int, int]]:
+        """Returns the earliest up-to-date heap entry, dropping outdated ones."""
+        heap, cards = self._heap, self.cards
+        while heap:
+            due, version, index = heap[0]
+            if cards[index].version == version:
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def _release_skipped(self, now: float) -> None:
+        """A word that was shown but not reviewed goes back: new words to the pool, reviewed ones later."""
+        index = self.current
+        if index is None or self._current_reviewed:
+            return
+        card = self.cards.get(index)
+        if card is None:
+            self.new_cards.unblock(index)
+        elif card.due <= now:
+            card.due = now + self.relearn_seconds
+            self._push(index, card)
+
+    def seed(self, attempts: Iterable[tuple[int, float, float]]) -> None:
+        """
+        Replays past answers (index, accuracy, answered_at) - in chronological order for every word -
+        as reviews made at `answered_at`. Call before the first next_card().
+        """
+        cards = self.cards
+        for index, accuracy, answered_at in attempts:
+            card = cards.get(index)
+            if card is None:
+                card = cards[index] = CardState()
+                self.new_cards.remove(index)
+            self._schedule(card, accuracy, answered_at)
+        self._heap = [(card.due, card.version, index) for index, card in cards.items()]
+        heapq.heapify(self._heap)
+
+    def _schedule(self, card: CardState, accuracy: float, now: float) -> None:
+        """Applies one SM-2 review made at `now` to `card` (the heap is not updated)."""
+        quality = quality_from_accuracy(accuracy)
+        if quality >= 3:
+            if card.repetitions == 0:
+                card.interval = 1.0
+            elif card.repetitions == 1:
+                card.interval = 6.0
+            else:
+                card.interval = round(card.interval * card.ease, 2)
+            card.repetitions += 1
+            card.due = now + card.interval * DAY_SECONDS
+        else:
+            card.repetitions = 0
+            card.interval = 0.0
+            card.due = now + self.relearn_seconds
+        card.ease = max(MIN_EASE, card.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+
+    def next_card(self) -> Optional[int]:
+        """Returns the index of the next word to practice, or None if the deck is empty."""
+        now = self.clock()
+        self._release_skipped(now)
+        top = self._top()
+        if top is not None and top[0] <= now:
+            index = top[2]
+        elif self.new_cards:
+            index = self.new_cards.pick(self.rng)
+            self.new_cards.block(index)  # Not picked again until it is reviewed or skipped
+        elif top is not None:
+            index = top[2]
+        else:
+            index = None
+        self.current = index
+        self._current_reviewed = False
+        return index
+
+    def review(self, index: int, accuracy: float) -> CardState:
+        """
+        Updates the SM-2 state of a word after an answer and reschedules it.
+        Checking the same presentation of a word again does not change its state.
+        """
+        now = self.clock()
+        card = self.cards.get(index)
+        if index == self.current and self._current_reviewed:
+            return card
+        if card is None:
+            card = self.cards[index] = CardState()
+            self.new_cards.remove(index)
+        self._schedule(card, accuracy, now)
+        self._push(index, card)
+        if index == self.current:
+            self._current_reviewed = True
+        return card
@@ -0,0 +1,163 @@
+"""
+scoring.py
+
+Answer similarity scoring for the Vocabulary Practice App.
+
+Backends:
+    - "levenshtein" (default): 1 - edit_distance / max(len), computed with a bit-parallel
+      distance (a few int operations per character). For words and phrases it is 2-3x faster
+      than SequenceMatcher; on answers of several hundred characters SequenceMatcher is faster
+      again (it skips frequent characters of strings longer than 200, an approximation).
+      Answers with alternatives are scored with a bounded distance: every alternative
+      after the first stops as soon as it can no longer beat the best score so far.
+    - "difflib": difflib.SequenceMatcher(...).ratio() of the raw lowercased strings (no
+      normalization, no alternatives), reproduces the scores of versions <= 1.4.
+
+Usage:
+    from modules.scoring import AccuracyScorer
+    scorer = AccuracyScorer(backend="levenshtein")
+    accuracy = scorer.score("Barrister", "barister")     # percent, 0-100
+    accuracy = scorer.score_forms(word.forms("Left_Lang"), user_input, answer=word["Left_Lang"])  # precomputed normalized forms
+"""
+import logging
+import os
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+from modules.normalization import AnswerForms, normalize_input
+
+LOW_ACCURACY_THRESHOLD = 90.0  # Answers below this percentage count as low accuracy
+
+logger = logging.getLogger(__name__)
+
+
+def levenshtein_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Returns the edit distance between `a` and `b` (insert, delete, substitute = 1).
+    Bit-parallel (Myers / Hyyrö): the shorter string is a bit vector held in one int, so every
+    character of the longer string costs a few integer operations instead of a DP row.
+    The common prefix and suffix (e.g. around a single typo) are skipped first.
+    If `max_distance` is given, max_distance + 1 is returned as soon as the distance is known to exceed it.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a  # b is the shorter string (the bit vector)
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+    prefix = len(os.path.commonprefix((a, b)))
+    a, b = a[prefix:], b[prefix:]
+    suffix = len(os.path.commonprefix((a[::-1], b[::-1])))
+    if suffix:
+        a, b = a[:-suffix], b[:-suffix]
+    len_a, len_b = len(a), len(b)
+    if not len_b:
+        return len_a
+
+    match_masks: Dict[str, int] = {}  # Character -> bits of its positions in b
+    bit = 1
+    for char in b:
+        match_masks[char] = match_masks.get(char, 0) | bit
+        bit <<= 1
+    full = bit - 1
+    last = bit >> 1
+    # distance - (len_a - i) is a lower bound of the result (every remaining character lowers it by at most 1)
+    limit = len_a + (max_distance if max_distance is not None else len_a)
+    positive, negative = full, 0  # Vertical +1 / -1 deltas of the current DP column
+    distance = len_b  # Last row of the current column: distance of b to the prefix of a read so far
+    get = match_masks.get
+    for i, match in enumerate([get(char, 0) for char in a], start=1):
+        vertical = match | negative
+        horizontal = (((match & positive) + positive) ^ positive) | match
+        positive_h = negative | (full ^ (horizontal | positive))
+        negative_h = positive & horizontal
+        if positive_h & last:
+            distance += 1
+        elif negative_h & last:
+            distance -= 1
+        if distance + i > limit:
+            return max_distance + 1  # Early exit: the threshold is already decided
+        positive_h = (positive_h << 1) | 1
+        positive = ((negative_h << 1) | (full ^ (vertical | positive_h))) & full
+        negative = positive_h & vertical
+    return distance
+
+
+def levenshtein_ratio(a: str, b: str) -> float:
+    """Normalized similarity in [0, 1]: 1 - distance / length of the longer string."""
+    longest = max(len(a), len(b))
+    if not longest:
+        return 1.0
+    return 1.0 - levenshtein_distance(a, b) / longest
+
+
+def best_levenshtein_ratio(candidates: tuple[str, ...], text: str) -> float:
+    """Highest levenshtein_ratio of `text` against the candidates (bounded by the best ratio found so far)."""
+    best = 0.0
+    for candidate in candidates:
+        longest = max(len(candidate), len(text))
+        if not longest:
+            return 1.0
+        # Only a distance <= (1 - best) * longest can reach the best ratio so far
+        max_distance = int((1.0 - best) * longest)
+        distance = levenshtein_distance(candidate, text, max_distance)
+        if distance <= max_distance:
+            best = max(best, 1.0 - distance / longest)
+    return best
+
+
+def difflib_ratio(a: str, b: str) -> float:
+    """difflib.SequenceMatcher ratio, as used by previous versions of the app."""
+    import difflib  # Only loaded when the difflib backend is selected
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+class AccuracyScorer:
+    """
+    Pluggable, cached answer scorer. Scores are percentages (0-100).
+    Results are cached per (correct_answer, user_input) pair in an LRU cache of `cache_size` entries.
+    """
+    BACKENDS: Dict[str, Callable[[str, str], float]] = {
+        "levenshtein": levenshtein_ratio,
+        "difflib": difflib_ratio,
+    }
+
+    def __init__(self, backend: str = "levenshtein", cache_size: int = 4096):
+        if backend not in self.BACKENDS:
+            logger.warning("Unknown accuracy backend %r. Using 'levenshtein'.", backend)
+            backend = "levenshtein"
+        self.backend = backend
+        self._ratio = self.BACKENDS[backend]
+        self.score = lru_cache(maxsize=cache_size)(self._score)
+        self._best_score = lru_cache(maxsize=cache_size)(self._best_score_uncached)
+
+    def _score(self, correct_answer: str, user_input: str) -> float:
+        """Calculates the percentage match between the correct answer and the user's answer."""
+        return self._ratio(correct_answer.lower(), user_input.lower()) * 100
+
+    def _best_score_uncached(self, candidates: tuple[str, ...], user_form: str) -> float:
+        if self.backend == "levenshtein":
+            return best_levenshtein_ratio(candidates, user_form) * 100
+        ratio = self._ratio
+        return max(ratio(candidate, user_form) for candidate in candidates) * 100
+
+    def score_forms(self, forms: AnswerForms, user_input: str, accent_insensitive: bool = False,
+                    answer: Optional[str] = None) -> float:
+        """
+        Scores the user's answer against precomputed normalized forms (best matching alternative).
+        Only the user's input is normalized here; the answer forms are built once at load time.
+        With the difflib backend and the raw `answer` given, the raw strings are scored instead
+        (as versions <= 1.4 did; accent_insensitive does not apply).
+        """
+        if self.backend == "difflib" and answer is not None:
+            return self.score(answer, user_input)
+        user_form = normalize_input(user_input, accent_insensitive)
+        candidates = forms.loose if accent_insensitive else forms.exact
+        return self._best_score(candidates, user_form)
+
+    def cache_info(self):
+        return (self.score if self.backend == "difflib" else self._best_score).cache_info()
+
+    def cache_clear(self) -> None:
+        self.score.cache_clear()
+        self._best_score.cache_clear()
@@ -0,0 +1,173 @@
+"""
+selection.py
+
+O(1) random selection structures for the Vocabulary Practice App.
+
+SelectionPool keeps word indices in a single array split into two regions:
+    items[:available]  -> words that can still be picked,
+    items[available:]  -> words that are blocked (already asked in block-repeat mode).
+A position array maps every index to its slot, so blocking/unblocking is a single swap
+across the boundary and clearing the blocklist just moves the boundary to the end.
+
+IndexedWordSet is an insertion-ordered set of words keyed by line number
+(used for the low-accuracy words) with O(1) add, remove and random pick.
+
+Usage:
+    from modules.selection import SelectionPool
+    pool = SelectionPool(range(len(store)))
+    index = random.choice(pool)  # or pool.pick()
+    pool.block(index)
+    pool.clear()
+"""
+import random
+from array import array
+from typing import Iterable, Iterator, List, Optional
+
+_NOT_IN_POOL = 0xFFFFFFFF
+
+
+class SelectionPool:
+    """
+    Set of word indices with O(1) pick, block, unblock and remove, and O(1) clear of all blocks.
+    Supports len() (available count) and indexing over the available region, so random.choice(pool) works.
+    """
+    def __init__(self, indices: Iterable[int] = (), capacity: Optional[int] = None):
+        self.items = array("I", indices)
+        if capacity is None:
+            capacity = (max(self.items) + 1) if self.items else 0
+        self.positions = array("I", [_NOT_IN_POOL]) * capacity
+        for slot, index in enumerate(self.items):
+            self.positions[index] = slot
+        self.available = len(self.items)
+
+    def __len__(self) -> int:
+        return self.available
+
+    def __getitem__(self, slot: int) -> int:
+        if not 0 <= slot < self.available:
+            raise IndexError("SelectionPool index out of range")
+        return self.items[slot]
+
+    def __contains__(self, index: int) -> bool:
+        return 0 <= index < len(self.positions) and self.positions[index] != _NOT_IN_POOL
+
+    @property
+    def total(self) -> int:
+        """Number of indices in the pool (available + blocked)."""
+        return len(self.items)
+
+    @property
+    def blocked_count(self) -> int:
+        return len(self.items) - self.available
+
+    def pick(self, rng: random.Random = random) -> int:
+        """Returns a random available index. Raises IndexError if nothing is available."""
+        if not self.available:
+            raise IndexError("Cannot pick from an empty SelectionPool")
+        return self.items[rng.randrange(self.available)]
+
+    def is_blocked(self, index: int) -> bool:
+        return index in self and self.positions[index] >= self.available
+
+    def _swap(self, slot_a: int, slot_b: int) -> None:
+        items, positions = self.items, self.positions
+        index_a, index_b = items[slot_a], items[slot_b]
+        items[slot_a], items[slot_b] = index_b, index_a
+        positions[index_a], positions[index_b] = slot_b, slot_a
+
+    def block(self, index: int) -> bool:
+        """Moves an available index into the blocked region. Returns False if it was not available."""
+        if index not in self or self.positions[index] >= self.available:
+            return False
+        self.available -= 1
+        self._swap(self.positions[index], self.available)
+        return True
+
+    def unblock(self, index: int) -> bool:
+        """Moves a blocked index back into the available region. Returns False if it was not blocked."""
+        if not self.is_blocked(index):
+            return False
+        self._swap(self.positions[index], self.available)
+        self.available += 1
+        return True
+
+    def remove(self, index: int) -> bool:
+        """Removes an index from the pool entirely. Returns False if it was not in the pool."""
+        if index not in self:
+            return False
+        if self.positions[index] < self.available:
+            self.block(index)
+        self._swap(self.positions[index], len(self.items) - 1)
+        self.items.pop()
+        self.positions[index] = _NOT_IN_POOL
+        return True
+
+    def clear(self) -> None:
+        """Unblocks every index by moving the boundary (O(1))."""
+        self.available = len(self.items)
+
+    def available_indices(self) -> Iterator[int]:
+        return iter(self.items[:self.available])
+
+    def blocked_indices(self) -> List[int]:
+        return self.items[self.available:].tolist()
+
+
+class IndexedWordSet:
+    """
+    Ordered set of words keyed by line number with O(1) add, remove, membership and random pick.
+    Any non-negative int below 2**64 works as the key (e.g. WordStore.source_key for merged decks).
+    Iteration follows insertion order; picking uses a parallel swap-remove array.
+    """
+    def __init__(self):
+        self._slots: dict[int, int] = {}  # line_number -> slot in the arrays below (insertion ordered)
+        self._lines = array("Q")
+        self._indices = array("I")
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __contains__(self, line_number: int) -> bool:
+        return line_number in self._slots
+
+    def __iter__(self) -> Iterator[int]:
+        """Yields word indices in insertion order."""
+        indices = self._indices
+        return (indices[slot] for slot in self._slots.values())
+
+    def add(self, line_number: int, index: int) -> bool:
+        """Adds a word. Returns False if its line number is already present."""
+        if line_number in self._slots:
+            return False
+        self._slots[line_number] = len(self._lines)
+        self._lines.append(line_number)
+        self._indices.append(index)
+        return True
+
+    def remove(self, line_number: int) -> bool:
+        """Removes a word by line number. Returns False if it was not present."""
+        slot = self._slots.pop(line_number, None)
+        if slot is None:
+            return False
+        last_line = self._lines.pop()
+        last_index = self._indices.pop()
+        if slot < len(self._lines):
+            self._lines[slot] = last_line
+            self._indices[slot] = last_index
+            self._slots[last_line] = slot
+        return True
+
+    def pick(self, rng: random.Random = random) -> int:
+        """Returns the word index of a random member. Raises IndexError if the set is empty."""
+        if not self._lines:
+            raise IndexError("Cannot pick from an empty IndexedWordSet")
+        return self._indices[rng.randrange(len(self._indices))]
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._lines = array("Q")
+        self._indices = array("I")
+
+    def line_numbers(self) -> List[int]:
+        """Line numbers in insertion order."""
+        return list(self._slots)
@@ -0,0 +1,274 @@
+"""
+settings_service.py
+
+Settings layer of the Vocabulary Practice App (settingsV2.json).
+
+SettingsService:
+    - validates settings against a typed schema built from the default values,
+      invalid values are logged and replaced by the default,
+    - loads the file once and re-parses it only if its size or mtime changed,
+    - migrates older files VERSION by VERSION through registered migration functions,
+    - writes changes back atomically (temporary file + rename); changes made with set()
+      are debounced through root.after and written on a worker thread, so the UI never
+      waits for the disk. flush() writes pending changes synchronously and waits for a
+      background write in progress (on exit).
+
+Only settings present in the file or changed at runtime are written, so the other
+settings keep following the defaults of newer app versions.
+A file with a VERSION newer than the app (or one that cannot be migrated) is never overwritten.
+Its settings are ignored (and the mismatch is shown in an error messagebox) unless IGNORE_VERSION_ERROR
+is set, in which case they are applied as they are.
+
+Usage:
+    from modules.settings_service import SettingsService
+    settings = SettingsService("settingsV2.json", APP_SETTINGS, version=1)
+    settings.load()
+    settings.attach(root)                      # enables debounced write-back
+    settings.set("ui_zoom_factor", 1.2)
+    settings.flush()
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence
+
+Migration = Callable[[dict], dict]  # Document of version N -> document of version N + 1
+
+logger = logging.getLogger(__name__)
+
+
+def _show_error(message: str) -> None:
+    try:
+        from tkinter import messagebox
+        messagebox.showerror("Error", message)
+    except Exception as e:  # No display available
+        logger.debug("Could not show the error messagebox: %s", e)
+
+
+class Setting(NamedTuple):
+    default: Any
+    type: type
+    choices: Optional[Sequence[Any]] = None
+
+
+def build_schema(defaults: Dict[str, Any], choices: Optional[Dict[str, Sequence[Any]]] = None) -> Dict[str, Setting]:
+    """Builds the schema from the default values: every setting has the type of its default."""
+    choices = choices or {}
+    return {key: Setting(value, type(value), choices.get(key)) for key, value in defaults.items()}
+
+
+def coerce_setting(setting: Setting, value: Any) -> Any:
+    """
+    Returns `value` converted to the type of the setting.
+    Raises ValueError if the value has a different type or is not one of the allowed choices.
+    """
+    expected = setting.type
+    if expected is float and isinstance(value, int) and not isinstance(value, bool):
+        value = float(value)
+    elif expected is list and isinstance(value, tuple):
+        value = list(value)
+    if not isinstance(value, expected) or (expected is not bool and isinstance(value, bool)):
+        raise ValueError(f"expected {expected.__name__}, got {type(value).__name__}")
+    if expected is list and isinstance(setting.default, list) and len(value) != len(setting.default):
+        raise ValueError(f"expected {len(setting.default)} items, got {len(value)}")
+    if setting.choices is not None and value not in setting.choices:
+        raise ValueError(f"expected one of {', '.join(map(str, setting.choices))}")
+    return value
+
+
+class SettingsService:
+    """
+    Loads, validates and persists the settings stored under `settings_key` in a JSON file.
+    `values` is the live settings dict (the `defaults` dict passed in, updated in place).
+    `show_errors` shows a VERSION mismatch in a messagebox.
+    """
+    def __init__(self, file_path: str, defaults: Dict[str, Any], version: int,
+                 choices: Optional[Dict[str, Sequence[Any]]] = None,
+                 migrations: Optional[Dict[int, Migration]] = None,
+                 settings_key: str = "APP_SETTINGS", version_key: str = "VERSION",
+                 ignore_version_error_key: str = "IGNORE_VERSION_ERROR", save_delay_ms: int = 500,
+                 show_errors: bool = True):
+        self.file_path = file_path
+        self.values = defaults
+        self.schema = build_schema(defaults, choices)
+        self.version = version
+        self.migrations = migrations or {}
+        self.settings_key = settings_key
+        self.version_key = version_key
+        self.ignore_version_error_key = ignore_version_error_key
+        self.save_delay_ms = save_delay_ms
+        self.show_errors = show_errors
+        self.status = "False - Unknown"  # "True", "False - File not found", "False - Version mismatch", ...
+        self.read_only = False  # Set when the file must not be overwritten (e.g. newer VERSION)
+        self._document: Dict[str, Any] = {}  # Last loaded file content (other top-level keys are kept on save)
+        self._stored_keys: set = set()  # Settings present in the file or changed with set()
+        self._signature: Optional[tuple] = None  # (size, mtime_ns) of the last loaded/written file
+        self._root = None
+        self._save_job = None
+        self._dirty = False
+        self._generation = 0  # Incremented for every snapshot; older snapshots are never written
+        self._written_generation = 0
+        self._write_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None  # Last background write (joined by flush)
+
+    def _file_signature(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def load(self) -> str:
+        """
+        Loads the settings file if it changed since the last load/save.
+        Returns:
+            str: The status flag ("True" if the file was loaded).
+        """
+        signature = self._file_signature()
+        if signature is not None and signature == self._signature:
+            return self.status
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as file:
+                document = json.load(file)
+            if not isinstance(document, dict):
+                raise ValueError("the top level is not an object")
+        except FileNotFoundError:
+            logger.warning("File %s not found. Using default settings.", self.file_path)
+            self.status = "False - File not found"
+            return self.status
+        except ValueError as e:
+            logger.error("JSON decoding error in %s: %s. Using default settings.", self.file_path, e)
+            self.status = "False - JSON decode error"
+            self.read_only = True  # Do not replace a file the user may want to fix
+            return self.status
+        except OSError as e:
+            logger.error("Failed to read %s: %s", self.file_path, e)
+            self.status = "False - Unexpected error"
+            return self.status
+
+        self._signature = signature
+        document = self._migrate(document)
+        if document is None:
+            return self.status
+        self._document = document
+        self._apply(document.get(self.settings_key, {}))
+        self.status = "True"  # Also for an ignored VERSION mismatch (the settings were applied)
+        return self.status
+
+    def _migrate(self, document: dict) -> Optional[dict]:
+        """
+        Upgrades `document` to the current VERSION. Returns None if that is not possible,
+        or the document unchanged (and read_only set) if IGNORE_VERSION_ERROR is set.
+        """
+        file_version = document.get(self.version_key, self.version)
+        migrated = file_version != self.version
+        while file_version != self.version:
+            migration = self.migrations.get(file_version) if isinstance(file_version, int) and file_version < self.version else None
+            if migration is None:
+                self.status = "False - Version mismatch"
+                self.read_only = True
+                if document.get(self.ignore_version_error_key):
+                    logger.warning("The settings VERSION (%s) does not match the required version (%s), but the error is ignored. The settings are loaded as they are (the file will not be overwritten).", file_version, self.version)
+                    return document  # Applied unmigrated, like older versions did
+                logger.error("Settings VERSION (%s) does not match the required version (%s). Default settings will be applied.", file_version, self.version)
+                if self.show_errors:
+                    _show_error(f"[ERROR]: JSON version ({file_version}) does not match required version ({self.version}). Default settings will be applied.")
+                return None
+            document = migration(document)
+            file_version += 1
+            document[self.version_key] = file_version
+            logger.info("Migrated %s to VERSION %d.", self.file_path, file_version)
+        if migrated:
+            self._dirty = True  # Persist the migrated file on the next save
+        return document
+
+    def _apply(self, stored: Dict[str, Any]) -> None:
+        self._stored_keys = set(stored)
+        for key, value in stored.items():
+            setting = self.schema.get(key)
+            if setting is None:
+                self.values[key] = value  # Unknown keys are kept (e.g. settings of newer app versions)
+                continue
+            try:
+                self.values[key] = coerce_setting(setting, value)
+            except ValueError as e:
+                logger.warning("Invalid value of setting '%s' (%r): %s. Using %r.", key, value, e, setting.default)
+                self.values[key] = setting.default
+                self._stored_keys.discard(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        """Validates and changes a setting; the file is written after `save_delay_ms` without changes."""
+        setting = self.schema.get(key)
+        if setting is not None:
+            value = coerce_setting(setting, value)
+        if key in self.values and self.values[key] == value:
+            return
+        self.values[key] = value
+        self._stored_keys.add(key)
+        self._dirty = True
+        self.schedule_save()
+
+    def attach(self, root) -> None:
+        """Uses `root.after` for debounced saving (changes made before attaching are saved on the next change/flush)."""
+        self._root = root
+
+    def schedule_save(self) -> None:
+        if self._root is None or self.read_only:
+            return
+        if self._save_job is not None:
+            self._root.after_cancel(self._save_job)
+        self._save_job = self._root.after(self.save_delay_ms, self._save_in_background)
+
+    def _snapshot(self) -> tuple[int, dict]:
+        """Builds the document to write (on the main thread, so values are not read concurrently)."""
+        document = dict(self._document)
+        document[self.version_key] = self.version
+        document.setdefault(self.ignore_version_error_key, False)
+        stored = dict(document.get(self.settings_key, {}))
+        stored.update({key: self.values[key] for key in self._stored_keys if key in self.values})
+        document[self.settings_key] = stored
+        self._document = document
+        self._generation += 1
+        self._dirty = False
+        return self._generation, document
+
+    def _save_in_background(self) -> None:
+        self._save_job = None
+        if not self._dirty:
+            return
+        generation, document = self._snapshot()
+        self._writer = threading.Thread(target=self._write, args=(generation, document), name="SettingsWriter", daemon=True)
+        self._writer.start()
+
+    def _write(self, generation: int, document: dict) -> None:
+        with self._write_lock:
+            if generation <= self._written_generation:
+                return  # A newer snapshot was already written
+            temp_path = self.file_path + ".tmp"
+            try:
+                os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+                with open(temp_path, "w", encoding="utf-8") as file:
+                    json.dump(document, file, indent=2, ensure_ascii=False)
+                    file.write("\n")
+                os.replace(temp_path, self.file_path)
+            except OSError as e:
+                logger.error("Failed to save settings to %s: %s", self.file_path, e)
+                return
+            self._written_generation = generation
+            self._signature = self._file_signature()
+            logger.debug("Settings saved to %s.", self.file_path)
+
+    def flush(self) -> None:
+        """Writes pending changes synchronously and waits for a background write (call before the app exits)."""
+        if self._save_job is not None and self._root is not None:
+            self._root.after_cancel(self._save_job)
+            self._save_job = None
+        if self._dirty and not self.read_only:
+            self._write(*self._snapshot())
+        if self._writer is not None:
+            self._writer.join()  # A daemon thread would be killed mid-write at exit
+            self._writer = None
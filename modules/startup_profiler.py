@@ -0,0 +1,66 @@
+"""
+startup_profiler.py
+
+Startup timeline of the Vocabulary Practice App (enabled with `python main.py --profile-startup`).
+
+main.py imports this module first and calls STARTUP_PROFILER.mark() after every import group
+and initialization step. Marks are always recorded (one perf_counter() call each), the
+timeline is only printed when profiling is enabled - once the main window is idle in mainloop.
+
+Each line shows the time since the profiler was created, the duration of the step
+and how many modules the step imported:
+
+    [startup]    412.3 ms  (+305.1 ms, +212 modules)  import customtkinter
+
+For a per-module breakdown of the imports use `python -X importtime main.py`.
+
+Usage:
+    from modules.startup_profiler import STARTUP_PROFILER
+    STARTUP_PROFILER.mark("load settings")
+    STARTUP_PROFILER.report()
+"""
+import sys
+import time
+from typing import List, NamedTuple
+
+
+class StartupMark(NamedTuple):
+    label: str
+    time: float  # perf_counter() value
+    modules: int  # len(sys.modules) at the mark
+
+
+class StartupProfiler:
+    """Records labelled timestamps and formats them as a timeline."""
+    def __init__(self):
+        self.enabled = False
+        self.start = time.perf_counter()
+        self.start_modules = len(sys.modules)
+        self.marks: List[StartupMark] = []
+
+    def mark(self, label: str) -> None:
+        self.marks.append(StartupMark(label, time.perf_counter(), len(sys.modules)))
+
+    def timeline(self) -> List[str]:
+        """Returns the formatted timeline lines."""
+        lines = []
+        previous_time, previous_modules = self.start, self.start_modules
+        for label, mark_time, modules in self.marks:
+            lines.append(
+                f"[startup] {(mark_time - self.start) * 1000:9.1f} ms  "
+                f"(+{(mark_time - previous_time) * 1000:.1f} ms, +{modules - previous_modules} modules)  {label}"
+            )
+            previous_time, previous_modules = mark_time, modules
+        return lines
+
+    def report(self) -> None:
+        """Prints the timeline if profiling is enabled."""
+        if not self.enabled:
+            return
+        print("\n=== Startup profile ===")
+        for line in self.timeline():
+            print(line)
+        print("=== Startup profile ===\n")
+
+
+STARTUP_PROFILER = StartupProfiler()
@@ -1,61 +1,292 @@
 """
 translation_utils.py
 
-Helpers for loading and accessing translation dictionaries for the Vocabulary Practice App.
+Helpers for loading and accessing translation catalogs for the Vocabulary Practice App.
+
+Translations are JSON files in the translations directory, one per language, named
+by language code (en.json, pl.json, ...). configure_translations() only lists that
+directory; a catalog is parsed the first time its language is used.
+
+Every catalog is flattened into dotted keys ({"menubar.file.file": "File", ...}), so a
+lookup is a single dict access. Catalogs of other languages fall back to English for keys
+they do not define (missing/extra keys are logged when the catalog is loaded).
+Flattened catalogs are stored in a compiled cache (marshal files, validated by the size
+and mtime of the JSON file), together with a small index of the language display names,
+so the language menu does not need to parse every catalog.
+
+Usage:
+    from modules.translation_utils import configure_translations, set_language, t_path
+    configure_translations("Assets/Vocabulary-Practice-App/Translations", cache_dir)
+    set_language("pl")
+    t_path("menubar.file.file")  # "Plik"
 """
+import json
+import logging
+import marshal
+import os
+from typing import Dict, List, Optional
+
+DEFAULT_LANGUAGE = "en"
+TRANSLATIONS_DIR = "Assets/Vocabulary-Practice-App/Translations"
+CATALOG_EXTENSION = ".json"
+COMPILED_EXTENSION = ".marshal"
+_INDEX_NAME = "index" + COMPILED_EXTENSION
+
+logger = logging.getLogger(__name__)
+
+_sources: Dict[str, str] = {}  # Language code -> path of its JSON catalog
+_cache_dir: Optional[str] = None
+_flat_translations: Dict[str, Dict[str, str]] = {}  # Flattened catalog of every loaded language
+_catalogs: Dict[str, Dict[str, str]] = {}  # Flattened translations merged with the English fallback
+_display_names: Optional[Dict[str, tuple]] = None  # Cached index: code -> (size, mtime_ns, name)
+_active_language = DEFAULT_LANGUAGE
+_active_catalog: Optional[Dict[str, str]] = None
+_reported_missing: set = set()
+
+
+def flatten_translations(tree: dict, prefix: str = "") -> Dict[str, str]:
+    """
+    Flattens a nested translation dictionary into dotted keys.
+    Args:
+        tree (dict): Nested translations, e.g. {"menubar": {"file": {"file": "File"}}}.
+        prefix (str): Key prefix used for recursion.
+    Returns:
+        dict: {"menubar.file.file": "File", ...}
+    """
+    flat: Dict[str, str] = {}
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten_translations(value, path + "."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def configure_translations(translations_dir: str = TRANSLATIONS_DIR, cache_dir: Optional[str] = None) -> List[str]:
+    """
+    Discovers the catalogs in `translations_dir` (without parsing them) and resets loaded catalogs.
+    Args:
+        translations_dir (str): Directory with <language code>.json files.
+        cache_dir (str, optional): Directory of the compiled cache. If None, the cache is disabled.
+    Returns:
+        list: The available language codes.
+    """
+    global _cache_dir, _display_names, _active_catalog
+    _sources.clear()
+    _flat_translations.clear()
+    _catalogs.clear()
+    _display_names = None
+    _active_catalog = None
+    _cache_dir = cache_dir
+    try:
+        entries = sorted(os.scandir(translations_dir), key=lambda entry: entry.name)
+    except OSError as e:
+        logger.error("Translations directory %s is not readable: %s", translations_dir, e)
+        entries = []
+    for entry in entries:
+        code, extension = os.path.splitext(entry.name)
+        if extension == CATALOG_EXTENSION and entry.is_file():
+            _sources[code] = entry.path
+    if DEFAULT_LANGUAGE not in _sources:
+        logger.error("Default translations (%s%s) not found in %s.", DEFAULT_LANGUAGE, CATALOG_EXTENSION, translations_dir)
+    return available_languages()
 
-from functools import lru_cache
 
 # --- Translation loading logic ---
 def load_translations(language_code):
     """
-    Loads the appropriate translation dictionary based on the language code.
-    Defaults to English if the code is not recognized or if Polish translations are missing.
+    Parses the JSON catalog of a language.
     Args:
         language_code (str): Language code, e.g. 'en' or 'pl'.
     Returns:
-        dict: The translation dictionary for the selected language.
-    """
-    if language_code == "pl":
-        try:
-            from translation import TRANSLATIONS_PL as TRANSLATIONS
-        except ImportError:
-            print("[WARNING]: Polish translations not found. Falling back to English.")
-            from translation import TRANSLATIONS_EN as TRANSLATIONS
-    else:
-        from translation import TRANSLATIONS_EN as TRANSLATIONS
-    return TRANSLATIONS
-
-# Import both translation dictionaries for fallback/reference
-try:
-    from translation import TRANSLATIONS_PL, TRANSLATIONS_EN
-except ImportError:
-    TRANSLATIONS_PL = TRANSLATIONS_EN = {}
-
-# This global variable is set by the main app after language selection.
-# The main app should do:
-#   import modules.translation_utils
-#   modules.translation_utils.TRANSLATIONS = load_translations(language_code)
-TRANSLATIONS = TRANSLATIONS_EN
+        dict: The nested translation dictionary (empty if the catalog is missing or invalid).
+    """
+    path = _sources.get(language_code)
+    if path is None:
+        logger.warning("Translations for '%s' not found.", language_code)
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError) as e:
+        logger.error("Failed to load translations %s: %s", path, e)
+        return {}
+
+
+def _source_signature(language_code: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(_sources[language_code])
+    except (KeyError, OSError):
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _read_marshal(path: str):
+    try:
+        with open(path, "rb") as file:
+            return marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_marshal(path: str, value) -> None:
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as file:
+            marshal.dump(value, file)
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning("Failed to write the translation cache %s: %s", path, e)
+
+
+def _compiled_path(language_code: str) -> str:
+    return os.path.join(_cache_dir, language_code + COMPILED_EXTENSION)
+
+
+def _load_compiled(language_code: str, signature: tuple) -> Optional[Dict[str, str]]:
+    cached = _read_marshal(_compiled_path(language_code))
+    if isinstance(cached, tuple) and len(cached) == 2 and cached[0] == signature and isinstance(cached[1], dict):
+        return cached[1]
+    return None
+
+
+def _index() -> Dict[str, tuple]:
+    global _display_names
+    if _display_names is None:
+        index = _read_marshal(os.path.join(_cache_dir, _INDEX_NAME)) if _cache_dir else None
+        _display_names = index if isinstance(index, dict) else {}
+    return _display_names
+
+
+def _remember_display_name(language_code: str, signature: tuple, flat: Dict[str, str]) -> None:
+    index = _index()
+    entry = (*signature, flat.get("language_name", language_code))
+    if index.get(language_code) != entry:
+        index[language_code] = entry
+        if _cache_dir:
+            _write_marshal(os.path.join(_cache_dir, _INDEX_NAME), index)
+
+
+def _flat(language_code: str) -> Dict[str, str]:
+    """Returns the flattened catalog of one language: memory, then compiled cache, then JSON."""
+    flat = _flat_translations.get(language_code)
+    if flat is not None:
+        return flat
+    signature = _source_signature(language_code)
+    if signature is not None and _cache_dir:
+        flat = _load_compiled(language_code, signature)
+    if flat is None:
+        flat = flatten_translations(load_translations(language_code))
+        if signature is not None and _cache_dir and flat:
+            _write_marshal(_compiled_path(language_code), (signature, flat))
+    if signature is not None:
+        _remember_display_name(language_code, signature, flat)
+    _flat_translations[language_code] = flat
+    return flat
+
+
+def get_catalog(language_code: str) -> Dict[str, str]:
+    """Returns the flattened catalog of a language (built once, English keys as fallback)."""
+    catalog = _catalogs.get(language_code)
+    if catalog is None:
+        if language_code == DEFAULT_LANGUAGE:
+            catalog = _flat(DEFAULT_LANGUAGE)
+        else:
+            validate_translations([language_code])
+            catalog = {**_flat(DEFAULT_LANGUAGE), **_flat(language_code)}
+        _catalogs[language_code] = catalog
+    return catalog
+
+
+def set_language(language_code: str) -> str:
+    """
+    Makes `language_code` the language used by t_path().
+    Returns:
+        str: The active language code (DEFAULT_LANGUAGE if there is no catalog for the code).
+    """
+    global _active_language, _active_catalog
+    if language_code not in _sources:
+        logger.warning("Unsupported language '%s'. Using '%s'.", language_code, DEFAULT_LANGUAGE)
+        language_code = DEFAULT_LANGUAGE
+    _active_language = language_code
+    _active_catalog = get_catalog(language_code)
+    return language_code
+
+
+def get_language() -> str:
+    return _active_language
+
+
+def available_languages() -> List[str]:
+    return list(_sources)
+
+
+def language_display_name(language_code: str) -> str:
+    """
+    Returns the name of a language in that language (the "language_name" key), e.g. "Polski".
+    Uses the cached index when it is up to date, so the catalog itself is not loaded.
+    """
+    flat = _flat_translations.get(language_code)
+    if flat is None:
+        entry = _index().get(language_code)
+        if entry is not None and entry[:2] == _source_signature(language_code):
+            return entry[2]
+        flat = _flat(language_code)
+    return flat.get("language_name", language_code)
+
+
+def validate_translations(languages: Optional[List[str]] = None, reference: str = DEFAULT_LANGUAGE) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Compares the keys of languages with the reference language and logs the differences.
+    Catalogs are validated automatically when they are loaded.
+    Args:
+        languages (list, optional): Language codes to check. Defaults to all available languages.
+    Returns:
+        dict: {language_code: {"missing": [...], "extra": [...]}} for languages that differ.
+    """
+    reference_keys = _flat(reference).keys()
+    problems: Dict[str, Dict[str, List[str]]] = {}
+    for language_code in (languages if languages is not None else available_languages()):
+        if language_code == reference:
+            continue
+        keys = _flat(language_code).keys()
+        missing = sorted(reference_keys - keys)
+        extra = sorted(keys - reference_keys)
+        if missing or extra:
+            problems[language_code] = {"missing": missing, "extra": extra}
+            if missing:
+                logger.warning("Translations '%s' are missing %d keys: %s", language_code, len(missing), ", ".join(missing))
+            if extra:
+                logger.warning("Translations '%s' have %d keys not in '%s': %s", language_code, len(extra), reference, ", ".join(extra))
+    return problems
+
+
+def translation_cache_info() -> Dict[str, object]:
+    """Returns debug information about the discovered and loaded catalogs."""
+    return {
+        "active_language": _active_language,
+        "available": available_languages(),
+        "loaded": {code: len(flat) for code, flat in _flat_translations.items()},
+        "missing_lookups": sorted(_reported_missing),
+    }
+
 
 # --- Translation path helper ---
-@lru_cache(maxsize=None)
 def t_path(path):
     """
-    Retrieves a translation value from the TRANSLATIONS dictionary using a dot-separated path.
+    Retrieves a translation of the active language using a dot-separated path.
     Args:
         path (str): Dot-separated path to the translation (e.g., "menubar.file.file")
     Returns:
         str: The translated string if found, or a placeholder string in format "[path]" if not found
-    Note:
-        This function depends on the global TRANSLATIONS variable, which must be set before use.
     """
-    keys = path.split(".")
-    value = TRANSLATIONS
-    try:
-        for key in keys:
-            value = value[key]
-        return value
-    except KeyError:
-        print(f"[WARNING] Translation not found for path: {path}")
+    catalog = _active_catalog if _active_catalog is not None else get_catalog(_active_language)
+    value = catalog.get(path)
+    if value is None:
+        if path not in _reported_missing:
+            _reported_missing.add(path)
+            logger.warning("Translation not found for path: %s", path)
         return f"[{path}]"
+    return value
@@ -0,0 +1,129 @@
+"""
+vocab_parser.py
+
+Streaming, GUI-free parser for Vocabulary Practice App word list files.
+
+File format:
+    - The first line is a header with the language names: "English - Polish".
+    - Every following line is a word pair: "Left_Lang - Right_Lang".
+    - Lines in the form "$ context $" set the context for the following words.
+    - Empty lines and lines starting with "#" are ignored.
+
+Usage:
+    from modules.vocab_parser import VocabFileParser
+    parser = VocabFileParser(file_path)
+    for entry in parser:
+        ...
+    print(parser.language_names, parser.failed_lines)
+
+The parser never touches Tk, so it can be used in tests, batch jobs and background threads.
+For background loading it can report progress (bytes read) and be cancelled through a threading.Event.
+"""
+import os
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_LANGUAGE_NAMES = ("Left", "Right")
+PAIR_SEPARATOR = " - "
+PROGRESS_EVERY_LINES = 4096  # How often progress is reported / cancellation is checked
+
+ProgressCallback = Callable[[int, int], None]  # (bytes_read, total_bytes)
+
+
+class LoadCancelled(Exception):
+    """Raised by loaders when their cancel event is set."""
+
+
+def parse_language_names(header_line: str) -> tuple[str, str]:
+    """
+    Returns the language names from the header line of a vocabulary file.
+    Falls back to DEFAULT_LANGUAGE_NAMES if the header is not in the "Left - Right" format.
+    """
+    parts = header_line.strip().split(PAIR_SEPARATOR)
+    if len(parts) < 2:
+        return DEFAULT_LANGUAGE_NAMES
+    return parts[0], parts[1]
+
+
+def iter_entries(lines: Iterable[str], failed_lines: Optional[List[int]] = None, start: int = 2) -> Iterator[Dict[str, str | int | None]]:
+    """
+    Lazily parses word pair lines (without the header line).
+    Args:
+        lines (Iterable[str]): Lines of the file following the header.
+        failed_lines (list, optional): If given, line numbers with a bad format are appended to it.
+        start (int): Line number of the first line in `lines`. Defaults to 2 (line after the header).
+    Yields:
+        dict: {"Left_Lang", "Right_Lang", "line_number", "context"} for every valid word pair.
+            Pairs where the left and right words are identical are skipped.
+    """
+    current_context = None
+    for line_number, line in enumerate(lines, start=start):
+        line_strip = line.strip()
+        if not line_strip or line_strip.startswith('#'):
+            continue  # skip comments and empty lines
+        # Detect context line: $ ... $
+        if line_strip.startswith('$') and line_strip.endswith('$') and len(line_strip) > 2:
+            current_context = line_strip[1:-1].strip()
+            continue
+        parts = line_strip.split(PAIR_SEPARATOR)
+        if len(parts) != 2:
+            if failed_lines is not None:
+                failed_lines.append(line_number)
+            continue
+        Left_Lang, Right_Lang = parts
+        if Left_Lang != Right_Lang:
+            yield {
+                "Left_Lang": Left_Lang,
+                "Right_Lang": Right_Lang,
+                "line_number": line_number,
+                "context": current_context,
+            }
+
+
+class VocabFileParser:
+    """
+    Iterable parser of a single vocabulary file.
+    Iterating opens the file, reads the header into `language_names` and yields entries lazily.
+    Lines with a bad format (not a comment, context or empty line) are collected in `failed_lines`.
+    Raises FileNotFoundError / OSError from open() so the caller decides how to report it,
+    and LoadCancelled if `cancel_event` is set while reading.
+    Args:
+        progress (callable, optional): Called with (bytes_read, total_bytes) every PROGRESS_EVERY_LINES lines.
+        cancel_event (threading.Event, optional): Stops the parser when set.
+    """
+    def __init__(self, file_path: str, encoding: str = "utf-8", progress: Optional[ProgressCallback] = None, cancel_event: Optional[threading.Event] = None):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.language_names: tuple[str, str] = DEFAULT_LANGUAGE_NAMES
+        self.failed_lines: List[int] = []
+        self.bytes_read = 0
+        self.total_bytes = 0
+
+    def __iter__(self) -> Iterator[Dict[str, str | int | None]]:
+        self.failed_lines = []
+        with open(self.file_path, "rb") as file:
+            self.total_bytes = os.fstat(file.fileno()).st_size
+            header = file.readline()
+            self.bytes_read = len(header)
+            self.language_names = parse_language_names(header.decode(self.encoding))
+            yield from iter_entries(self._decoded_lines(file), self.failed_lines)
+        if self.progress is not None:
+            self.progress(self.total_bytes, self.total_bytes)
+
+    def _decoded_lines(self, file) -> Iterator[str]:
+        """Decodes lines while counting bytes, reporting progress and checking for cancellation."""
+        progress, cancel_event = self.progress, self.cancel_event
+        for count, raw_line in enumerate(file, start=1):
+            self.bytes_read += len(raw_line)
+            if count % PROGRESS_EVERY_LINES == 0:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise LoadCancelled(self.file_path)
+                if progress is not None:
+                    progress(self.bytes_read, self.total_bytes)
+            yield raw_line.decode(self.encoding)
+
+    def parse(self) -> List[Dict[str, str | int | None]]:
+        """Parses the whole file and returns the list of entries."""
+        return list(self)
@@ -0,0 +1,132 @@
+"""
+weighted_sampler.py
+
+Weighted random word selection for the Vocabulary Practice App.
+
+Every word has an error rate (exponential moving average of 1 - accuracy / 100) and is
+picked with probability proportional to min_weight + error. Weights are kept in a
+Fenwick (binary indexed) tree, so both a weight update after check_answer and a draw
+are O(log N) - the distribution is never rebuilt. Building the tree is O(N).
+
+Words without attempts start at `prior_error`; WeightedSampler.seed() sets the starting
+errors from the answer history (AttemptHistory.word_stats).
+
+Usage:
+    from modules.weighted_sampler import WeightedSampler
+    sampler = WeightedSampler(len(store))
+    index = sampler.pick()
+    sampler.record(index, accuracy)
+"""
+import random
+from array import array
+from typing import Iterable, Optional
+
+
+class FenwickTree:
+    """Prefix sums over float weights with O(log N) update, prefix query and weighted search."""
+    def __init__(self, weights: Iterable[float] = ()):
+        self.weights = array("d", weights)
+        size = len(self.weights)
+        tree = array("d", [0.0]) * (size + 1)
+        for position, weight in enumerate(self.weights, start=1):
+            tree[position] += weight
+            parent = position + (position & -position)
+            if parent <= size:
+                tree[parent] += tree[position]
+        self.tree = tree
+        self.total = sum(self.weights)
+        self._top_bit = 1 << (size.bit_length() - 1) if size else 0
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def set(self, index: int, weight: float) -> None:
+        """Sets the weight of `index` (0-based)."""
+        delta = weight - self.weights[index]
+        if not delta:
+            return
+        self.weights[index] = weight
+        self.total += delta
+        tree, size = self.tree, len(self.weights)
+        position = index + 1
+        while position <= size:
+            tree[position] += delta
+            position += position & -position
+
+    def prefix_sum(self, count: int) -> float:
+        """Sum of the first `count` weights."""
+        total, tree = 0.0, self.tree
+        while count > 0:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def find(self, target: float) -> int:
+        """Returns the 0-based index whose cumulative weight range contains `target` (0 <= target < total)."""
+        tree, size = self.tree, len(self.weights)
+        position, step = 0, self._top_bit
+        while step:
+            candidate = position + step
+            if candidate <= size and tree[candidate] <= target:
+                position = candidate
+                target -= tree[candidate]
+            step >>= 1
+        return min(position, size - 1)  # Guards against float rounding at the upper end
+
+
+class WeightedSampler:
+    """
+    Picks word indices with probability proportional to min_weight + recent error rate.
+    Args:
+        card_count (int): Number of words in the deck.
+        prior_error (float): Error rate of words without attempts (0-1).
+        smoothing (float): Weight of the newest answer in the moving average (0-1).
+        min_weight (float): Added to every weight, so mastered words are still picked sometimes.
+        rng (random.Random, optional): Random generator.
+    """
+    def __init__(self, card_count: int, prior_error: float = 0.5, smoothing: float = 0.3,
+                 min_weight: float = 0.05, rng: Optional[random.Random] = None):
+        self.smoothing = smoothing
+        self.min_weight = min_weight
+        self.rng = rng or random.Random()
+        self.errors = array("d", [prior_error]) * card_count
+        self.tree = FenwickTree(array("d", [min_weight + prior_error]) * card_count)
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def set_error(self, index: int, error: float) -> None:
+        error = min(max(error, 0.0), 1.0)
+        self.errors[index] = error
+        self.tree.set(index, self.min_weight + error)
+
+    def record(self, index: int, accuracy: float) -> None:
+        """Updates the error rate of a word after an answer (O(log N))."""
+        error = 1.0 - accuracy / 100.0
+        self.set_error(index, (1.0 - self.smoothing) * self.errors[index] + self.smoothing * error)
+
+    def seed(self, index: int, mean_accuracy: float, last_accuracy: float) -> None:
+        """Sets the starting error of a word from its history: the long-term mean, then the last answer."""
+        self.set_error(index, 1.0 - mean_accuracy / 100.0)
+        self.record(index, last_accuracy)
+
+    def probability(self, index: int) -> float:
+        return self.tree.weights[index] / self.tree.total if self.tree.total else 0.0
+
+    def pick(self, exclude: Optional[int] = None) -> Optional[int]:
+        """
+        Draws a word index (O(log N)). Returns None if the deck is empty.
+        `exclude` (e.g. the word just shown) is avoided when another word can be drawn.
+        """
+        if not self.errors:
+            return None
+        tree = self.tree
+        index = tree.find(self.rng.random() * tree.total)
+        if index == exclude and len(self.errors) > 1:
+            # Draw from the remaining weight, skipping the excluded range
+            excluded_start = tree.prefix_sum(exclude)
+            target = self.rng.random() * (tree.total - tree.weights[exclude])
+            if target >= excluded_start:
+                target += tree.weights[exclude]
+            index = tree.find(target)
+        return index
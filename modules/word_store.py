@@ -0,0 +1,273 @@
+"""
+word_store.py
+
+Compact, columnar storage for the words of a loaded vocabulary file.
+
+Instead of one dict per word, WordStore keeps:
+    - two lists of strings (left and right side),
+    - an array of line numbers (sorted, because files are read top to bottom),
+    - an array of context ids pointing into an interned table of context strings,
+    - the normalized answer forms of both sides (see modules/normalization.py), built once on append.
+
+WordRecord is a lightweight __slots__ view over one row, so the UI can keep using
+word["Left_Lang"], word["Right_Lang"], word["line_number"] and word.get("context").
+
+A store merged from several decks (see modules/merged_deck.py) numbers its rows 1..N in
+`line_numbers` and keeps the deck and line every row came from in `source_ids` and
+`source_lines`. WordRecord.source is the stable identity of a word in both cases:
+(sha256 of the deck file, line number in that file).
+
+Usage:
+    from modules.word_store import WordStore
+    store = WordStore.from_entries(VocabFileParser(file_path))
+    word = store[0]
+    remaining = store.indices_excluding_lines(blocked_lines)
+"""
+from array import array
+from bisect import bisect_left
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from modules.normalization import AnswerForms, answer_forms
+
+NO_CONTEXT_ID = 0  # Context id used for words without a "$ context $" header
+
+
+class WordRecord:
+    """Read-only view of a single word in a WordStore (dict-like access for the UI)."""
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "WordStore", index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def left(self) -> str:
+        return self.store.left[self.index]
+
+    @property
+    def right(self) -> str:
+        return self.store.right[self.index]
+
+    @property
+    def line_number(self) -> int:
+        return self.store.line_numbers[self.index]
+
+    @property
+    def context(self) -> Optional[str]:
+        return self.store.contexts[self.store.context_ids[self.index]]
+
+    @property
+    def source(self) -> tuple[Optional[str], int]:
+        """Stable identity of the word: (digest of its deck file, line number in that file)."""
+        return self.store.source(self.index)
+
+    def forms(self, key: str) -> AnswerForms:
+        """Returns the precomputed normalized forms of the "Left_Lang" or "Right_Lang" side."""
+        if key == "Left_Lang":
+            return self.store.left_forms[self.index]
+        if key == "Right_Lang":
+            return self.store.right_forms[self.index]
+        raise KeyError(key)
+
+    def __getitem__(self, key: str):
+        if key == "Left_Lang":
+            return self.left
+        if key == "Right_Lang":
+            return self.right
+        if key == "line_number":
+            return self.line_number
+        if key == "context":
+            return self.context
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, str | int | None]:
+        return {
+            "Left_Lang": self.left,
+            "Right_Lang": self.right,
+            "line_number": self.line_number,
+            "context": self.context,
+        }
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, WordRecord) and other.store is self.store and other.index == self.index
+
+    def __hash__(self) -> int:
+        return hash((id(self.store), self.index))
+
+    def __repr__(self) -> str:
+        return f"WordRecord({self.to_dict()!r})"
+
+
+class WordStore:
+    """
+    Columnar word list. Rows are addressed by index (0..len-1); line numbers are kept
+    in ascending order so lookups by line number use binary search instead of a dict.
+    """
+    def __init__(self, language_names: tuple[str, str] = ("Left", "Right")):
+        self.language_names = language_names
+        self.failed_lines: List[int] = []
+        self.left: Sequence[str] = []
+        self.right: Sequence[str] = []
+        self.left_forms: Sequence[AnswerForms] = []
+        self.right_forms: Sequence[AnswerForms] = []
+        self.line_numbers: Sequence[int] = array("I")
+        self.context_ids: Sequence[int] = array("I")
+        self.contexts: List[Optional[str]] = [None]  # id 0 == no context
+        self._context_ids: Dict[str, int] = {}
+        self.digest: Optional[str] = None  # sha256 of the source file, set by the loader
+        # Merged stores only: source decks and, per row, the deck and line the word was read from
+        self.source_names: List[str] = []
+        self.source_digests: List[Optional[str]] = []
+        self.source_ids: Sequence[int] = array("I")
+        self.source_lines: Sequence[int] = array("I")
+        self._source_index: Optional[Dict[tuple[int, int], int]] = None  # (source id, line) -> index
+        self.duplicates = 0  # Words skipped as duplicates while merging
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict[str, str | int | None]], language_names: Optional[tuple[str, str]] = None) -> "WordStore":
+        """
+        Builds a store from parser entries. If `entries` is a VocabFileParser,
+        its language names and failed lines are copied after the file is read.
+        """
+        store = cls()
+        append = store.append
+        for entry in entries:
+            append(entry["Left_Lang"], entry["Right_Lang"], entry["line_number"], entry["context"])
+        store.language_names = language_names or getattr(entries, "language_names", store.language_names)
+        store.failed_lines = list(getattr(entries, "failed_lines", []))
+        return store
+
+    @classmethod
+    def from_columns(cls, left: Sequence[str], right: Sequence[str], left_forms: Sequence[AnswerForms], right_forms: Sequence[AnswerForms],
+                     line_numbers: Sequence[int], context_ids: Sequence[int], contexts: List[str],
+                     language_names: tuple[str, str], failed_lines: List[int]) -> "WordStore":
+        """
+        Builds a store from prebuilt columns (e.g. memory-mapped by modules/deck_cache.py).
+        `contexts` excludes the implicit id 0 (no context). Such a store is read-only.
+        """
+        store = cls(language_names)
+        store.left, store.right = left, right
+        store.left_forms, store.right_forms = left_forms, right_forms
+        store.line_numbers, store.context_ids = line_numbers, context_ids
+        store.contexts = [None, *contexts]
+        store._context_ids = {context: context_id for context_id, context in enumerate(store.contexts) if context_id}
+        store.failed_lines = failed_lines
+        return store
+
+    def intern_context(self, context: Optional[str]) -> int:
+        """Returns the id of a context string, adding it to the table if needed."""
+        if context is None:
+            return NO_CONTEXT_ID
+        context_id = self._context_ids.get(context)
+        if context_id is None:
+            context_id = len(self.contexts)
+            self.contexts.append(context)
+            self._context_ids[context] = context_id
+        return context_id
+
+    def append(self, left: str, right: str, line_number: int, context: Optional[str] = None,
+               left_forms: Optional[AnswerForms] = None, right_forms: Optional[AnswerForms] = None) -> int:
+        """
+        Appends a word and returns its index. Line numbers must be appended in ascending order.
+        The normalized forms are computed unless they are passed (e.g. copied from another store).
+        """
+        if self.line_numbers and line_number <= self.line_numbers[-1]:
+            raise ValueError(f"Line numbers must be ascending (got {line_number} after {self.line_numbers[-1]})")
+        self.left.append(left)
+        self.right.append(right)
+        self.left_forms.append(left_forms or answer_forms(left))
+        self.right_forms.append(right_forms or answer_forms(right))
+        self.line_numbers.append(line_number)
+        self.context_ids.append(self.intern_context(context))
+        return len(self.left) - 1
+
+    def __len__(self) -> int:
+        return len(self.line_numbers)
+
+    def __bool__(self) -> bool:
+        return len(self.line_numbers) > 0
+
+    def __getitem__(self, index: int) -> WordRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("WordStore index out of range")
+        return WordRecord(self, index)
+
+    def __iter__(self) -> Iterator[WordRecord]:
+        for index in range(len(self)):
+            yield WordRecord(self, index)
+
+    def index_of_line(self, line_number: int) -> Optional[int]:
+        """Returns the index of the word read from `line_number`, or None."""
+        index = bisect_left(self.line_numbers, line_number)
+        if index < len(self.line_numbers) and self.line_numbers[index] == line_number:
+            return index
+        return None
+
+    @property
+    def is_merged(self) -> bool:
+        return bool(self.source_names)
+
+    def source(self, index: int) -> tuple[Optional[str], int]:
+        """Returns the stable identity of a word: (digest of its deck file, line number in that file)."""
+        if self.source_names:
+            return self.source_digests[self.source_ids[index]], self.source_lines[index]
+        return self.digest, self.line_numbers[index]
+
+    def source_key(self, index: int) -> int:
+        """
+        Returns an int key of the source line of a word: the line number for a single deck,
+        (source_id << 32) | line of the source deck for a merged one (merged row numbers are per session).
+        """
+        if self.source_names:
+            return self.source_ids[index] << 32 | self.source_lines[index]
+        return self.line_numbers[index]
+
+    def source_name(self, index: int) -> Optional[str]:
+        """Returns the name of the deck a word of a merged store comes from (None for a single deck)."""
+        return self.source_names[self.source_ids[index]] if self.source_names else None
+
+    def digests(self) -> List[str]:
+        """Digests of the deck files the words come from."""
+        digests = self.source_digests if self.source_names else [self.digest]
+        return [digest for digest in digests if digest]
+
+    def index_of_source(self, digest: str, line_number: int) -> Optional[int]:
+        """Returns the index of the word read from `line_number` of the deck with `digest`, or None."""
+        if not self.source_names:
+            return self.index_of_line(line_number) if digest == self.digest else None
+        if self._source_index is None:
+            self._source_index = {(source_id, line): index
+                                  for index, (source_id, line) in enumerate(zip(self.source_ids, self.source_lines))}
+        for source_id, source_digest in enumerate(self.source_digests):
+            if source_digest == digest:
+                index = self._source_index.get((source_id, line_number))
+                if index is not None:
+                    return index
+        return None
+
+    def line_mask(self, line_numbers: Iterable[int]) -> bytearray:
+        """Returns a bytearray with 1 at the index of every word whose line is in `line_numbers`."""
+        mask = bytearray(len(self))
+        for line_number in line_numbers:
+            index = self.index_of_line(line_number)
+            if index is not None:
+                mask[index] = 1
+        return mask
+
+    def indices_excluding_lines(self, line_numbers: Iterable[int]) -> List[int]:
+        """Returns indices of all words whose line is not in `line_numbers` (filtered in C via compress)."""
+        mask = self.line_mask(line_numbers)
+        keep = mask.translate(_INVERT_MASK)
+        return list(compress(range(len(self)), keep))
+
+
+_INVERT_MASK = bytes([1]) + bytes(255)  # 0 -> 1, anything else -> 0
@@ -1,152 +0,0 @@
-# This file contains translations for the application in Polish and English.
-
-# To use Polish, set "LANGUAGE": "pl" in the config file.
-# To use English, set "LANGUAGE": "en" in the config file.
-
-# Structure version 1.1.1
-TRANSLATIONS_PL = {
-    "menubar": {
-        "file": {
-            "file": "Plik",
-            "load_file": "Wczytaj plik",
-            "exit": "Zakończ",
-        },
-        "appearance": {
-            "appearance": "Wygląd",
-            "dark_mode": "Dark Mode",
-            "light_mode": "Light Mode",
-            "zoom_in": "Powiększ UI",
-            "zoom_out": "Pomniejsz UI",
-        },
-        "about": {
-            "about": "O aplikacji",
-            "about_this_app": "O tej aplikacji",
-        }
-    },
-    
-    "main_window": {
-        "question_label": {
-            "default": "Załaduj plik, aby rozpocząć",
-            "File_error": "Plik jest pusty lub niewłaściwy!",
-            "TranslateIt": "Przetłumacz to:",
-            "No_words": "Brak dostępnych słówek do wyświetlenia!",
-            "Not_loaded": "Brak załadowanych słówek!"
-            },
-        "line_info_label": "Losowo wybrana linia pliku:",
-        "entry_placeholder": "Wpisz tutaj tłumaczenie",
-        "buttons": {
-            "hint_button": "Ujawnij pierwsze litery",
-            "check_button": "Sprawdź",
-            "skip_button": "Pomiń/Przejdź dalej",
-            "file_button": "Załaduj plik .txt",
-            "clear_button": "Wyczyść listę blokady"
-        },
-        "mode_label": "Wybierz tryb tłumaczenia:",
-        "Radiobuttons": {
-        "left": "Lewy",
-        "right": "Prawy",
-        "both": "Mieszane",
-        },
-        "checkbox": {
-            "block_list": "Blokuj powtarzające się pytania",
-        },
-        "result_label": {
-            "default": "Tu będzie wynik",
-            "percent": "Procent poprawności:",
-            "correct": "Poprawna odpowiedź:",
-            "score": "Wynik:",
-            "percentage": "Procent poprawnych odpowiedzi:",
-            "No_words": "Brak słowa do sprawdzenia!",
-            "hint_text": "Podpowiedź:"
-        },
-
-    },
-
-    "about_window": {
-        "about_window_title": "O aplikacji",
-        
-        "program_info_description": {
-            "program_name": "Nazwa programu",
-            "version": "Wersja",
-            "author": "Autor",
-            "release_date": "Data wydania",
-            "first_release": "Pierwsze wydanie",
-            "licence": "Licencja",
-            "description": "Opis"
-        },
-    }
-}
-
-# The English translation is the default one, so it doesn't need to be defined in the same way as the Polish one.
-TRANSLATIONS_EN = {
-    "menubar": {
-        "file": {
-            "file": "File",
-            "load_file": "Load File",
-            "exit": "Exit",
-        },
-        "appearance": {
-            "appearance": "Appearance",
-            "dark_mode": "Dark Mode",
-            "light_mode": "Light Mode",
-            "zoom_in": "Zoom In",
-            "zoom_out": "Zoom Out",
-        },
-        "about": {
-            "about": "About",
-            "about_this_app": "About this app",
-        }
-    },
-    
-    "main_window": {
-        "question_label": {
-            "default": "Load the file to start",
-            "File_error": "The file is empty or invalid!",
-            "TranslateIt": "Translate it:",
-            "No_words": "No available words to display!",
-            "Not_loaded": "No words loaded!"
-            },
-        "line_info_label": "Randomly selected line from the file:",
-        "entry_placeholder": "Enter the translation here",
-        "buttons": {
-            "hint_button": "Reveal first letters",
-            "check_button": "Check",
-            "skip_button": "Skip/Next",
-            "file_button": "Load .txt file",
-            "clear_button": "Reset progress"
-        },
-        "mode_label": "Choose translation mode:",
-        "Radiobuttons": {
-        "left": "Left",
-        "right": "Right",
-        "both": "Mixed",
-        },
-        "checkbox": {
-            "block_list": "Block repeated questions",
-        },
-        "result_label": {
-            "default": "Result will appear here",
-            "percent": "Accuracy percentage:",
-            "correct": "Correct answer:",
-            "score": "Score:",
-            "percentage": "Percentage of correct answers:",
-            "No_words": "No word to check!",
-            "hint_text": "Hint:"
-        },
-
-    },
-
-    "about_window": {
-        "about_window_title": "About the application",
-        
-        "program_info_description": {
-            "program_name": "Program name",
-            "version": "Version",
-            "author": "Author",
-            "release_date": "Release date",
-            "first_release": "First release",
-            "licence": "License",
-            "description": "Description"
-        },
-    }
-}
\ No newline at end of file